@@ -2,9 +2,10 @@
 
 from .client import PlaudClient
 from .config import PlaudConfig
-from .exceptions import APIError, AuthenticationError, ConfigurationError, PlaudError
+from .exceptions import APIError, AuthenticationError, ConfigurationError, OfflineError, PlaudError
 from .models import (
     AccessTokenInfo,
+    ColumnarTranscript,
     CustomTemplate,
     Device,
     FeatureAccess,
@@ -13,6 +14,7 @@ from .models import (
     FileStats,
     FileTag,
     FreeTrialStatus,
+    ListingDiff,
     Recording,
     SavedQuery,
     SearchResult,
@@ -29,6 +31,7 @@ from .models import (
     UploadPresignedUrl,
     UserProfile,
     UserSettings,
+    diff_listings,
 )
 
 __version__ = "0.2.0"
@@ -42,14 +45,18 @@ __all__ = [
     "AuthenticationError",
     "APIError",
     "ConfigurationError",
+    "OfflineError",
     # Core models
     "Recording",
     "Transcript",
     "TranscriptEntry",
+    "ColumnarTranscript",
     "FileSimple",
     "FileDetail",
     "FileTag",
     "UploadPresignedUrl",
+    "ListingDiff",
+    "diff_listings",
     # Auth models
     "AccessTokenInfo",
     "SSOProvider",
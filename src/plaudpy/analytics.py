@@ -0,0 +1,246 @@
+"""Vectorized speaker analytics (talk time, turns, interruptions, monologues).
+
+Requires NumPy (``pip install plaudpy[analytics]``).
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from . import utils
+from .models import ColumnarTranscript, Transcript
+
+if TYPE_CHECKING:
+    import numpy as np
+
+METRICS = ("talk_time", "segments", "turns", "interruptions", "longest_monologue")
+
+
+def require_numpy():
+    """Import NumPy, or explain how to install the optional dependency."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "This feature requires NumPy; install it with `pip install plaudpy[analytics]`"
+        ) from e
+    return numpy
+
+
+def transcript_arrays(
+    transcript: Transcript | ColumnarTranscript,
+) -> tuple["np.ndarray", "np.ndarray", "np.ndarray", list[str]]:
+    """Build (starts, ends, speaker_codes, speakers) arrays for a transcript.
+
+    Times are float64 seconds; speaker_codes index into speakers. For a
+    ColumnarTranscript the time arrays are zero-copy views of its columns.
+    """
+    np = require_numpy()
+    if isinstance(transcript, ColumnarTranscript):
+        starts = np.frombuffer(transcript._starts, dtype=np.float64)
+        ends = np.frombuffer(transcript._ends, dtype=np.float64)
+        codes = np.array(transcript._codes, dtype=np.intp)
+        return starts, ends, codes, transcript.speakers
+
+    speakers: dict[str, int] = {}
+    n = len(transcript.entries)
+    starts = np.empty(n, dtype=np.float64)
+    ends = np.empty(n, dtype=np.float64)
+    codes = np.empty(n, dtype=np.intp)
+    for i, entry in enumerate(transcript.entries):
+        starts[i] = entry.start_time
+        ends[i] = entry.end_time
+        codes[i] = speakers.setdefault(entry.speaker, len(speakers))
+    return starts, ends, codes, list(speakers)
+
+
+def speaker_stats_from_arrays(
+    starts: "np.ndarray", ends: "np.ndarray", codes: "np.ndarray", speakers: list[str]
+) -> list[dict]:
+    """Compute per-speaker metrics from transcript arrays.
+
+    Segments are taken in start-time order. A turn is a maximal run of
+    consecutive segments by the same speaker; an interruption is a turn that
+    starts before an earlier segment has ended; a monologue is a turn's span
+    from its first start to its last end.
+
+    Returns:
+        One dict per speaker with 'speaker' and the METRICS, ordered by
+        talk_time descending.
+    """
+    np = require_numpy()
+    k = len(speakers)
+    if len(starts) == 0:
+        return []
+
+    order = np.argsort(starts, kind="stable")
+    s, e, c = starts[order], ends[order], codes[order]
+
+    talk_time = np.bincount(c, weights=np.clip(e - s, 0, None), minlength=k)
+    segments = np.bincount(c, minlength=k)
+
+    new_turn = np.empty(len(c), dtype=bool)
+    new_turn[0] = True
+    np.not_equal(c[1:], c[:-1], out=new_turn[1:])
+    turn_starts = np.flatnonzero(new_turn)
+    turn_speakers = c[turn_starts]
+    turns = np.bincount(turn_speakers, minlength=k)
+
+    latest_end = np.maximum.accumulate(e)
+    interrupted = np.zeros(len(c), dtype=bool)
+    interrupted[1:] = new_turn[1:] & (s[1:] < latest_end[:-1])
+    interruptions = np.bincount(c[interrupted], minlength=k)
+
+    turn_spans = np.maximum.reduceat(e, turn_starts) - s[turn_starts]
+    longest = np.zeros(k, dtype=np.float64)
+    np.maximum.at(longest, turn_speakers, turn_spans)
+
+    stats = [
+        {
+            "speaker": speakers[i],
+            "talk_time": float(talk_time[i]),
+            "segments": int(segments[i]),
+            "turns": int(turns[i]),
+            "interruptions": int(interruptions[i]),
+            "longest_monologue": float(longest[i]),
+        }
+        for i in range(k)
+        if segments[i]
+    ]
+    stats.sort(key=lambda row: row["talk_time"], reverse=True)
+    return stats
+
+
+def speaker_stats(transcript: Transcript | ColumnarTranscript) -> list[dict]:
+    """Per-speaker talk time, segments, turns, interruptions and longest monologue.
+
+    See speaker_stats_from_arrays() for the metric definitions.
+    """
+    return speaker_stats_from_arrays(*transcript_arrays(transcript))
+
+
+def aggregate_speaker_stats(per_recording: Iterable[list[dict]]) -> list[dict]:
+    """Combine speaker_stats() results from many recordings.
+
+    Counts and talk time are summed; longest_monologue is the maximum.
+    Adds 'recordings', the number of recordings each speaker appears in.
+    """
+    totals: dict[str, dict] = {}
+    for stats in per_recording:
+        for row in stats:
+            total = totals.setdefault(
+                row["speaker"],
+                {"speaker": row["speaker"], **{m: 0 for m in METRICS}, "recordings": 0},
+            )
+            for metric in ("talk_time", "segments", "turns", "interruptions"):
+                total[metric] += row[metric]
+            total["longest_monologue"] = max(total["longest_monologue"], row["longest_monologue"])
+            total["recordings"] += 1
+    return sorted(totals.values(), key=lambda row: row["talk_time"], reverse=True)
+
+
+def analyze_library(db_path: str | Path | None = None, force: bool = False) -> int:
+    """Compute and store speaker metrics for every recording in the local store.
+
+    Works from the transcript segments persisted by
+    utils.sync_recordings(details=True). Recordings whose content hash is
+    unchanged since the last run are skipped unless force is set.
+
+    Returns:
+        Number of recordings analysed.
+    """
+    np = require_numpy()
+    conn = utils.get_db(db_path)
+    try:
+        with conn:
+            if force:
+                conn.execute("DELETE FROM speaker_stats")
+            else:
+                conn.execute(
+                    """DELETE FROM speaker_stats
+                       WHERE content_hash IS NOT (
+                           SELECT d.content_hash FROM recording_details d
+                           WHERE d.id = speaker_stats.recording_id)"""
+                )
+            stale = {
+                r["id"]: r["content_hash"]
+                for r in conn.execute(
+                    """SELECT d.id, d.content_hash FROM recording_details d
+                       WHERE NOT EXISTS (
+                           SELECT 1 FROM speaker_stats s WHERE s.recording_id = d.id)"""
+                )
+            }
+            if not stale:
+                return 0
+
+            # One pass over all segments, grouped by recording
+            rows = conn.execute(
+                """SELECT t.recording_id, t.speaker, t.start_ms, t.end_ms
+                   FROM transcript_segments t
+                   WHERE NOT EXISTS (
+                       SELECT 1 FROM speaker_stats s WHERE s.recording_id = t.recording_id)
+                   ORDER BY t.recording_id, t.seq"""
+            ).fetchall()
+            rows = [r for r in rows if r["recording_id"] in stale]
+            if not rows:
+                return 0
+            ids = [r["recording_id"] for r in rows]
+            starts = np.fromiter((r["start_ms"] for r in rows), np.float64, len(rows)) / 1000.0
+            ends = np.fromiter((r["end_ms"] for r in rows), np.float64, len(rows)) / 1000.0
+            speaker_names = [r["speaker"] for r in rows]
+
+            analysed = 0
+            bounds = [0] + [i for i in range(1, len(ids)) if ids[i] != ids[i - 1]] + [len(ids)]
+            for lo, hi in zip(bounds[:-1], bounds[1:]):
+                recording_id = ids[lo]
+                speakers: dict[str, int] = {}
+                codes = np.fromiter(
+                    (speakers.setdefault(name, len(speakers)) for name in speaker_names[lo:hi]),
+                    np.intp,
+                    hi - lo,
+                )
+                stats = speaker_stats_from_arrays(starts[lo:hi], ends[lo:hi], codes, list(speakers))
+                conn.executemany(
+                    """INSERT INTO speaker_stats
+                           (recording_id, speaker, talk_time, segments, turns,
+                            interruptions, longest_monologue, content_hash)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                    [
+                        (recording_id, row["speaker"], row["talk_time"], row["segments"],
+                         row["turns"], row["interruptions"], row["longest_monologue"],
+                         stale[recording_id])
+                        for row in stats
+                    ],
+                )
+                analysed += 1
+            return analysed
+    finally:
+        conn.close()
+
+
+def library_speaker_report(db_path: str | Path | None = None) -> list[dict]:
+    """Library-wide speaker totals from the stored per-recording metrics.
+
+    Run analyze_library() first to bring the metrics up to date.
+
+    Returns:
+        List of dicts with 'speaker', 'recordings' and the METRICS, ordered
+        by talk_time descending.
+    """
+    conn = utils.get_db(db_path)
+    try:
+        rows = conn.execute(
+            """SELECT speaker,
+                      COUNT(*) AS recordings,
+                      SUM(talk_time) AS talk_time,
+                      SUM(segments) AS segments,
+                      SUM(turns) AS turns,
+                      SUM(interruptions) AS interruptions,
+                      MAX(longest_monologue) AS longest_monologue
+               FROM speaker_stats
+               GROUP BY speaker
+               ORDER BY talk_time DESC"""
+        ).fetchall()
+        return [dict(r) for r in rows]
+    finally:
+        conn.close()
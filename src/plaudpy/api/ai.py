@@ -2,8 +2,10 @@
 
 import json
 import random
+from collections.abc import AsyncIterator, Iterable
 
 from ..models.ai import CustomTemplate, TaskStatus
+from ..tasks import TaskPoller
 from .base import BaseAPI
 
 
@@ -61,6 +63,41 @@ class AIAPI(BaseAPI):
         """Get file-level AI task status."""
         return self._get("/ai/file-task-status")
 
+    @property
+    def poller(self) -> TaskPoller:
+        """Shared background task-status poller, created on first use."""
+        if getattr(self, "_poller", None) is None:
+            self._poller = TaskPoller(self)
+        return self._poller
+
+    @poller.setter
+    def poller(self, poller: TaskPoller) -> None:
+        self._poller = poller
+
+    def wait_for(self, file_id: str, timeout: float | None = None) -> TaskStatus:
+        """Wait for a file's transcription/summary task to finish.
+
+        All waiters share one polling loop (see TaskPoller), so waiting on
+        many files costs one status request per interval.
+
+        Args:
+            file_id: The file ID to wait for.
+            timeout: Seconds to wait; None waits indefinitely.
+
+        Returns:
+            The task's final status (check it for failure).
+        """
+        return self.poller.wait_for(file_id, timeout=timeout)
+
+    def completions(self, file_ids: Iterable[str]) -> AsyncIterator[TaskStatus]:
+        """Async iterator of final task statuses, in completion order.
+
+        Example:
+            async for status in client.ai.completions(file_ids):
+                print(status.file_id, status.status)
+        """
+        return self.poller.completions(file_ids)
+
     def get_recently_used_language(self) -> dict:
         """Get the most recently used transcription language."""
         return self._get("/ai/recently_used_language")
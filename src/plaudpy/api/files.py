@@ -1,8 +1,24 @@
 """Files API endpoints."""
 
+import os
+import time
+from collections.abc import Iterator, Sequence
+from typing import BinaryIO
+
+import httpx
+
+from ..batching import AdaptiveChunker
 from ..models.file import FileDetail, FileSimple, UploadPresignedUrl
 from .base import BaseAPI
 
+# Bytes read per chunk when streaming an upload from a file
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _read_chunks(fp: BinaryIO, size: int = UPLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+    while chunk := fp.read(size):
+        yield chunk
+
 
 class FilesAPI(BaseAPI):
     """API for file operations."""
@@ -38,7 +54,10 @@ class FilesAPI(BaseAPI):
         """
         if not file_ids:
             return []
+        return self._post_details(file_ids)[0]
 
+    def _post_details(self, file_ids: list[str]) -> tuple[list[FileDetail], int]:
+        """POST /file/list; returns the details and the response size in bytes."""
         url = f"{self.base_url}/file/list"
         # API expects a plain list of IDs
         response = self.client.post(url, headers=self.headers, json=file_ids)
@@ -46,7 +65,47 @@ class FilesAPI(BaseAPI):
 
         # API returns {"data_file_list": [...]}
         files_data = data.get("data_file_list", [])
-        return [FileDetail.model_validate(f) for f in files_data]
+        nbytes = len(response.content) if isinstance(response.content, bytes) else 0
+        return [FileDetail.model_validate(f) for f in files_data], nbytes
+
+    def iter_details(
+        self,
+        files: Sequence[FileSimple | str],
+        chunker: AdaptiveChunker | None = None,
+    ) -> Iterator[list[FileDetail]]:
+        """Fetch details for many files in adaptively sized chunks.
+
+        Each request is sized by the chunker from the files' listing
+        durations so responses stay near its target size; observed response
+        bytes, latency and timeouts feed back into later chunks. A chunk
+        that times out is retried with fewer IDs.
+
+        Args:
+            files: FileSimple entries (preferred, for their durations) or
+                bare IDs.
+            chunker: Policy to use and update; pass the same one across
+                calls to keep what it learned. Defaults to a fresh one.
+
+        Yields:
+            The FileDetail objects of each chunk.
+        """
+        chunker = chunker or AdaptiveChunker()
+        pending = [f if isinstance(f, FileSimple) else None for f in files]
+        ids = [f.id if isinstance(f, FileSimple) else f for f in files]
+        start = 0
+        while start < len(ids):
+            n = chunker.next_size(pending[start:])
+            began = time.monotonic()
+            try:
+                details, nbytes = self._post_details(ids[start:start + n])
+            except httpx.TimeoutException:
+                chunker.record_timeout(n)
+                if n == 1:
+                    raise
+                continue
+            chunker.record(pending[start:start + n], nbytes, time.monotonic() - began)
+            start += n
+            yield details
 
     def get_detail(self, file_id: str) -> FileDetail:
         """Get detailed metadata for a single file.
@@ -117,6 +176,36 @@ class FilesAPI(BaseAPI):
         data = self._post("/file/get_upload_presigned_url", json=payload)
         return UploadPresignedUrl.model_validate(data)
 
+    def upload_part(
+        self, url: str, data: bytes | BinaryIO, fields: dict | None = None
+    ) -> str | None:
+        """Upload file content to a pre-signed URL.
+
+        The URL carries its own authorization, so no bearer token is sent.
+
+        Args:
+            url: Pre-signed URL from get_upload_url().
+            data: File (or part) content, or a binary file object to
+                stream from its current position.
+            fields: Form fields for a pre-signed POST; without them the
+                content is PUT.
+
+        Returns:
+            The ETag of the stored object, when the storage returns one.
+        """
+        if fields:
+            response = self.client.post(url, data=fields, files={"file": data})
+        elif isinstance(data, bytes):
+            response = self.client.put(url, content=data)
+        else:
+            # Pre-signed PUTs need a length; chunked transfer is rejected
+            length = os.fstat(data.fileno()).st_size - data.tell()
+            response = self.client.put(
+                url, content=_read_chunks(data), headers={"Content-Length": str(length)}
+            )
+        self._handle_binary_response(response)
+        return response.headers.get("ETag")
+
     def confirm_upload(self, file_id: str, **kwargs) -> dict:
         """Confirm a completed file upload.
 
@@ -0,0 +1,113 @@
+"""Adaptive chunk sizing for /file/list detail requests.
+
+A /file/list response carries each file's full trans_result, so its size
+scales with the recordings' durations: a fixed number of IDs per call is
+either too chatty for voice memos or too large for all-day meetings.
+AdaptiveChunker instead fills each chunk up to a byte budget, estimating
+each file's response size from its listing duration with a bytes-per-
+duration rate learned from previous responses. The budget itself follows
+AIMD: it grows additively while responses are fast, and is cut
+multiplicatively after a slow, oversized or timed-out response. The number
+of IDs per request is capped the same way, so a chunk that timed out is
+always retried with fewer IDs even when their estimated sizes are small.
+"""
+
+from collections.abc import Sequence
+
+from .models import FileSimple
+
+# Desired size of one /file/list response
+DEFAULT_TARGET_BYTES = 2 * 1024 * 1024
+
+# Responses slower than this (seconds) shrink the budget
+DEFAULT_MAX_LATENCY = 10.0
+
+
+class AdaptiveChunker:
+    """AIMD chunk-size policy for FilesAPI.iter_details().
+
+    Args:
+        target_bytes: Response size to aim for; the budget never exceeds it.
+        max_latency: Latency (seconds) above which the budget is cut.
+        max_ids: Upper bound on IDs per request.
+        increase: Additive step after a good response, as a fraction of
+            target_bytes.
+        decrease: Multiplicative factor applied after a bad response.
+        bytes_per_unit: Initial estimate of response bytes per unit of
+            FileSimple.duration (refined from observations).
+        overhead_bytes: Initial estimate of the per-file size independent
+            of duration (metadata, summary).
+        smoothing: Weight of the newest observation in the running estimates.
+    """
+
+    def __init__(
+        self,
+        target_bytes: int = DEFAULT_TARGET_BYTES,
+        max_latency: float = DEFAULT_MAX_LATENCY,
+        max_ids: int = 100,
+        increase: float = 0.125,
+        decrease: float = 0.5,
+        bytes_per_unit: float = 0.05,
+        overhead_bytes: float = 4096,
+        smoothing: float = 0.3,
+    ):
+        self.target_bytes = target_bytes
+        self.max_latency = max_latency
+        self.max_ids = max(1, max_ids)
+        self.increase = increase
+        self.decrease = decrease
+        self.bytes_per_unit = bytes_per_unit
+        self.overhead_bytes = overhead_bytes
+        self.smoothing = smoothing
+        self.budget = float(target_bytes)
+        self.id_cap = float(self.max_ids)  # AIMD cap on IDs per request
+        self._mean_duration = 0.0  # of transcribed files seen so far
+
+    def estimate(self, file: FileSimple | None) -> float:
+        """Predicted response bytes for one file (None: no listing info)."""
+        if file is None:
+            return self.overhead_bytes + self.bytes_per_unit * self._mean_duration
+        if not (file.is_trans or file.is_summary):
+            return self.overhead_bytes
+        return self.overhead_bytes + self.bytes_per_unit * file.duration
+
+    def next_size(self, files: Sequence[FileSimple | None]) -> int:
+        """Number of leading files to request next (at least one)."""
+        limit = max(1, int(self.id_cap))
+        total = 0.0
+        for n, file in enumerate(files[:limit]):
+            total += self.estimate(file)
+            if total > self.budget and n:
+                return n
+        return min(len(files), limit) or 1
+
+    def record(self, files: Sequence[FileSimple | None], nbytes: int, latency: float) -> None:
+        """Learn from a completed request and adjust the budget."""
+        durations = [f.duration for f in files if f is not None and (f.is_trans or f.is_summary)]
+        if durations:
+            a = self.smoothing
+            self._mean_duration = (1 - a) * self._mean_duration + a * (sum(durations) / len(durations))
+            fixed = self.overhead_bytes * len(files)
+            rate = max(nbytes - fixed, 0) / max(sum(durations), 1)
+            self.bytes_per_unit = (1 - a) * self.bytes_per_unit + a * rate
+        elif files:
+            a = self.smoothing
+            self.overhead_bytes = (1 - a) * self.overhead_bytes + a * (nbytes / len(files))
+
+        if latency > self.max_latency or nbytes > 2 * self.target_bytes:
+            self._cut(len(files))
+        else:
+            self.budget = min(float(self.target_bytes), self.budget + self.increase * self.target_bytes)
+            self.id_cap = min(float(self.max_ids), self.id_cap + max(1.0, self.increase * self.max_ids))
+
+    def record_timeout(self, n: int | None = None) -> None:
+        """Shrink the budget after a request of n IDs timed out.
+
+        With n, the next request is also capped below n IDs.
+        """
+        self._cut(n)
+
+    def _cut(self, n: int | None = None) -> None:
+        self.budget = max(self.budget * self.decrease, 1.0)
+        if n:
+            self.id_cap = max(1.0, min(self.id_cap, float(n - 1), n * self.decrease))
@@ -0,0 +1,576 @@
+"""Offline-first client that reads through the local SQLite store.
+
+CachedPlaudClient answers get_recording(), files.list_simple() and
+tags.list_tags() from the store filled by utils.sync_recordings (or the
+sync daemon) while the stored copy is within max_age. Older copies are
+returned immediately and refreshed in the background; when the API is
+unreachable they keep being served. Only a read with no stored copy at all
+waits for the API.
+
+Writes (rename, trash, tagging, tag edits) go to the API when it is
+reachable. Otherwise they are queued in the store, applied to the local
+copy right away, and replayed in order once the API answers again.
+Everything else is passed through to a regular PlaudClient.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone, tzinfo
+from pathlib import Path
+from typing import Any, TypeVar
+
+import httpx
+
+from . import utils
+from .client import PlaudClient
+from .exceptions import APIError, ConfigurationError, OfflineError, PlaudError
+from .models import FileSimple, FileTag, Recording
+
+T = TypeVar("T")
+
+
+def _is_unreachable(e: BaseException) -> bool:
+    """True for errors that say nothing about the request itself."""
+    if isinstance(e, (httpx.TransportError, ConfigurationError, OfflineError)):
+        return True
+    return isinstance(e, APIError) and (e.status_code or 0) >= 500
+
+
+class CachedPlaudClient:
+    """PlaudClient variant that serves reads from the local store.
+
+    The API client is created (and logs in) on first use, so a cached
+    client can be opened without network or credentials; reads then fail
+    with OfflineError only for data that was never synced.
+
+    Example:
+        with CachedPlaudClient(db_path="plaud.db", max_age=timedelta(minutes=10)) as client:
+            for f in client.files.list_simple():  # local, revalidated in the background
+                print(f.filename)
+            client.files.update(file_id, filename="Renamed")  # queued if offline
+    """
+
+    def __init__(
+        self,
+        client: PlaudClient | None = None,
+        db_path: str | Path | None = None,
+        max_age: timedelta = timedelta(minutes=5),
+        retry_after: float = 30.0,
+        tz: tzinfo | None = None,
+        work_start: int = 9,
+        work_end: int = 18,
+        **credentials,
+    ):
+        """Initialize the cached client.
+
+        Args:
+            client: Authenticated client for the API. Defaults to a
+                PlaudClient(**credentials) created on first use and closed
+                by close().
+            db_path: Path to the database file.
+            max_age: How old a stored copy may be and still be served
+                without revalidation.
+            retry_after: Seconds to wait before contacting an unreachable
+                API again; reads in between are answered locally.
+            tz: Timezone for local time fields of refreshed rows. Defaults
+                to system local tz.
+            work_start: Start of working hours (inclusive, 24h).
+            work_end: End of working hours (exclusive, 24h).
+            **credentials: username, password and base_url for PlaudClient.
+        """
+        self._client = client
+        self._owns_client = client is None
+        self._credentials = credentials
+        self.db_path = Path(db_path) if db_path else utils.DEFAULT_DB_PATH
+        utils.get_db(self.db_path).close()  # create or migrate the schema once
+        self.max_age = max_age
+        self.retry_after = retry_after
+        self.tz = tz or datetime.now().astimezone().tzinfo
+        self.work_start = work_start
+        self.work_end = work_end
+        self.last_error: BaseException | None = None
+        self._offline_until = 0.0
+        self._upstream_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="plaudpy-cache")
+        self.files = CachedFilesAPI(self)
+        self.tags = CachedTagsAPI(self)
+
+    def __getattr__(self, name: str) -> Any:
+        # Everything not cached goes straight to the API
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.upstream, name)
+
+    @property
+    def upstream(self) -> PlaudClient:
+        """The API client, created and logged in on first use."""
+        with self._upstream_lock:
+            if self._client is None:
+                self._client = PlaudClient(**self._credentials)
+            return self._client
+
+    @property
+    def online(self) -> bool:
+        """False while the API is considered unreachable (see retry_after)."""
+        return time.monotonic() >= self._offline_until
+
+    # --- Store and API plumbing ---
+
+    @contextmanager
+    def _store(self) -> Iterator[sqlite3.Connection]:
+        # Plain connections: the schema was set up in __init__
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _fresh(self, iso: str | None) -> bool:
+        if not iso:
+            return False
+        return datetime.now(timezone.utc) - datetime.fromisoformat(iso) <= self.max_age
+
+    def _listing_fresh(self, conn: sqlite3.Connection) -> bool:
+        return self._fresh(conn.execute("SELECT MAX(synced_at) FROM sync_log").fetchone()[0])
+
+    def _call(self, fn: Callable[[PlaudClient], T]) -> T:
+        """Run fn against the API, tracking whether it is reachable.
+
+        Raises:
+            OfflineError: The API (or login) is unreachable, now or
+                within retry_after of the last failure.
+        """
+        if not self.online:
+            raise OfflineError("Plaud API unreachable") from self.last_error
+        try:
+            result = fn(self.upstream)
+        except (PlaudError, httpx.HTTPError) as e:
+            if not _is_unreachable(e):
+                raise
+            self.last_error = e
+            self._offline_until = time.monotonic() + self.retry_after
+            raise OfflineError(f"Plaud API unreachable: {e}") from e
+        self._offline_until = 0.0
+        if self.queued_writes(pending_only=True):
+            self._submit("writes", self.replay_writes)
+        return result
+
+    def _send(self, api: str, method: str, args: list, kwargs: dict) -> Any:
+        return self._call(lambda c: getattr(getattr(c, api), method)(*args, **kwargs))
+
+    def _submit(self, key: str, fetch: Callable[[], T]) -> Future:
+        """Run fetch in the background, sharing one run per key."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._inflight[key] = self._executor.submit(self._run, key, fetch)
+            return future
+
+    def _run(self, key: str, fetch: Callable[[], T]) -> T:
+        try:
+            return fetch()
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _read(
+        self,
+        key: str,
+        cached: Callable[[], tuple[T, bool] | None],
+        fetch: Callable[[], T],
+        fallback: Callable[[], T | None] = lambda: None,
+    ) -> T:
+        """Serve cached() if present (revalidating when stale), else fetch().
+
+        cached returns (value, fresh) or None. When fetch fails because
+        the API is unreachable, a non-None fallback() is served instead.
+        """
+        hit = cached()
+        if hit is not None:
+            value, fresh = hit
+            if not fresh and self.online:
+                self._submit(key, fetch)
+            return value
+        try:
+            return self._submit(key, fetch).result()
+        except OfflineError:
+            value = fallback()
+            if value is None:
+                raise
+            return value
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Block until background revalidations and replays finish."""
+        with self._lock:
+            futures = list(self._inflight.values())
+        wait(futures, timeout=timeout)
+
+    # --- Reads ---
+
+    def get_recording(self, file_id: str) -> Recording | None:
+        """Get a single recording, from the store when possible.
+
+        A stored transcript is fresh when fetched within max_age, or when
+        the (fresh) listing shows the file unchanged since it was fetched.
+
+        Returns:
+            Recording object or None if not found.
+
+        Raises:
+            OfflineError: The recording was never synced and the API is
+                unreachable.
+        """
+
+        def cached() -> tuple[Recording | None, bool] | None:
+            with self._store() as conn:
+                row = conn.execute(
+                    """SELECT d.listing_sig, d.fetched_at, l.payload
+                       FROM recordings r
+                       LEFT JOIN recording_details d ON d.id = r.id
+                       LEFT JOIN listing_entries l ON l.id = r.id
+                       WHERE r.id = ?""",
+                    (file_id,),
+                ).fetchone()
+                if row is None:
+                    return None
+                entry = FileSimple.model_validate_json(row["payload"]) if row["payload"] else None
+                if row["fetched_at"] is not None:
+                    fresh = self._fresh(row["fetched_at"]) or (
+                        entry is not None
+                        and row["listing_sig"] == utils.listing_signature(entry)
+                        and self._listing_fresh(conn)
+                    )
+                elif entry is not None and not (entry.is_trans or entry.is_summary):
+                    fresh = self._listing_fresh(conn)  # nothing to fetch
+                else:
+                    return None
+                return utils.load_recording(conn, file_id), fresh
+
+        def fallback() -> Recording | None:
+            with self._store() as conn:
+                return utils.load_recording(conn, file_id)
+
+        return self._read(
+            f"recording:{file_id}", cached, lambda: self._fetch_recording(file_id), fallback
+        )
+
+    def _fetch_recording(self, file_id: str) -> Recording | None:
+        details = self._call(lambda c: c.files.get_details([file_id]))
+        if not details:
+            return None
+        detail = details[0]
+        now_iso = datetime.now(timezone.utc).isoformat()
+        with self._store() as conn:
+            entry = self._entry(conn, file_id)
+            if entry is None:
+                entry = FileSimple(
+                    id=detail.id, filename=detail.filename,
+                    duration=detail.duration, start_time=detail.start_time,
+                )
+                self._save_entries(conn, [entry], now_iso)
+            utils.write_detail(conn, detail)
+            utils.upsert_detail_row(
+                conn, detail.id, utils.listing_signature(entry),
+                utils.detail_content_hash(detail), detail.language, now_iso,
+            )
+        return Recording.from_file_detail(detail, release=True)
+
+    def _list_files(self) -> list[FileSimple]:
+        def cached() -> tuple[list[FileSimple], bool] | None:
+            with self._store() as conn:
+                rows = conn.execute("SELECT payload FROM listing_entries").fetchall()
+                if not rows:
+                    return None
+                fresh = self._listing_fresh(conn)
+            files = [FileSimple.model_validate_json(r["payload"]) for r in rows]
+            files.sort(key=lambda f: f.start_time, reverse=True)
+            return files, fresh
+
+        def fallback() -> list[FileSimple] | None:
+            # Stores synced before listing entries were kept
+            with self._store() as conn:
+                tags: dict[str, list[str]] = {}
+                for r in conn.execute("SELECT tag_id, recording_id FROM recording_tags"):
+                    tags.setdefault(r["recording_id"], []).append(r["tag_id"])
+                rows = conn.execute(
+                    """SELECT id, filename, duration, start_time_ms, is_trash
+                       FROM recordings ORDER BY start_time_ms DESC"""
+                ).fetchall()
+            return [
+                FileSimple(
+                    id=r["id"], filename=r["filename"], duration=r["duration"],
+                    start_time=r["start_time_ms"], is_trash=bool(r["is_trash"]),
+                    filetag_id_list=tuple(sorted(tags.get(r["id"], ()))),
+                )
+                for r in rows
+            ] or None
+
+        return self._read("listing", cached, self._fetch_listing, fallback)
+
+    def _fetch_listing(self) -> list[FileSimple]:
+        files = self._call(lambda c: c.files.list_simple())
+        now_iso = datetime.now(timezone.utc).isoformat()
+        with self._store() as conn:
+            # Queued writes are not upstream yet; keep their local effect
+            self._save_entries(conn, files, now_iso)
+            utils.prune_listing(conn, files)
+            conn.execute(
+                "INSERT INTO sync_log (synced_at, total_files) VALUES (?, ?)", (now_iso, len(files))
+            )
+            for write in self.queued_writes(pending_only=True, conn=conn):
+                self._apply(conn, write["api"], write["method"], write["args"], write["kwargs"])
+        return files
+
+    def _list_tags(self) -> list[FileTag]:
+        def cached() -> tuple[list[FileTag], bool] | None:
+            with self._store() as conn:
+                rows = conn.execute("SELECT id, name, color, synced_at FROM tags").fetchall()
+            if not rows:
+                return None
+            tags = [FileTag(id=r["id"], name=r["name"], color=r["color"]) for r in rows]
+            return tags, self._fresh(min(r["synced_at"] for r in rows))
+
+        return self._read("tags", cached, self._fetch_tags)
+
+    def _fetch_tags(self) -> list[FileTag]:
+        tags = self._call(lambda c: c.tags.list_tags())
+        with self._store() as conn:
+            utils.cache_tags(conn, tags)
+            for write in self.queued_writes(pending_only=True, conn=conn):
+                if write["api"] == "tags":
+                    self._apply(conn, "tags", write["method"], write["args"], write["kwargs"])
+        return tags
+
+    # --- Writes ---
+
+    def _write(self, api: str, method: str, *args, **kwargs) -> Any:
+        """Send a write now, or queue it if the API is unreachable.
+
+        Returns:
+            The API response, or {"queued": <queue id>} when queued.
+        """
+        with self._write_lock:
+            if not self.queued_writes(pending_only=True):
+                try:
+                    result = self._send(api, method, list(args), kwargs)
+                except OfflineError:
+                    pass
+                else:
+                    with self._store() as conn:
+                        self._apply(conn, api, method, list(args), kwargs)
+                    return result
+            with self._store() as conn:
+                write_id = conn.execute(
+                    """INSERT INTO pending_writes (api, method, args, queued_at)
+                       VALUES (?, ?, ?, ?)""",
+                    (api, method, json.dumps([list(args), kwargs]),
+                     datetime.now(timezone.utc).isoformat()),
+                ).lastrowid
+                self._apply(conn, api, method, list(args), kwargs)
+        if self.online:
+            self._submit("writes", self.replay_writes)
+        return {"queued": write_id}
+
+    def queued_writes(
+        self, pending_only: bool = False, conn: sqlite3.Connection | None = None
+    ) -> list[dict]:
+        """Writes waiting for the API, oldest first.
+
+        Writes the API rejected stay listed with their error message
+        (unless pending_only) and are not retried.
+        """
+        query = "SELECT id, api, method, args, queued_at, error FROM pending_writes"
+        if pending_only:
+            query += " WHERE error IS NULL"
+        query += " ORDER BY id"
+        if conn is None:
+            with self._store() as conn:
+                rows = conn.execute(query).fetchall()
+        else:
+            rows = conn.execute(query).fetchall()
+        writes = []
+        for r in rows:
+            args, kwargs = json.loads(r["args"])
+            writes.append({
+                "id": r["id"], "api": r["api"], "method": r["method"], "args": args,
+                "kwargs": kwargs, "queued_at": r["queued_at"], "error": r["error"],
+            })
+        return writes
+
+    def replay_writes(self) -> int:
+        """Send queued writes in order, stopping while the API is unreachable.
+
+        Returns:
+            Number of writes the API accepted.
+        """
+        sent = 0
+        with self._write_lock:
+            for write in self.queued_writes(pending_only=True):
+                try:
+                    self._send(write["api"], write["method"], write["args"], write["kwargs"])
+                except OfflineError:
+                    break
+                except (PlaudError, httpx.HTTPError) as e:
+                    with self._store() as conn:
+                        conn.execute(
+                            "UPDATE pending_writes SET error = ? WHERE id = ?", (str(e), write["id"])
+                        )
+                    continue
+                with self._store() as conn:
+                    conn.execute("DELETE FROM pending_writes WHERE id = ?", (write["id"],))
+                sent += 1
+        return sent
+
+    # --- Local effect of writes ---
+
+    def _entry(self, conn: sqlite3.Connection, file_id: str) -> FileSimple | None:
+        row = conn.execute("SELECT payload FROM listing_entries WHERE id = ?", (file_id,)).fetchone()
+        return FileSimple.model_validate_json(row["payload"]) if row else None
+
+    def _save_entries(self, conn: sqlite3.Connection, files: list[FileSimple], now_iso: str) -> None:
+        utils.upsert_recordings(conn, files, self.tz, self.work_start, self.work_end, now_iso)
+        utils.sync_recording_tags(conn, files)
+
+    def _apply(self, conn: sqlite3.Connection, api: str, method: str, args: list, kwargs: dict) -> None:
+        """Mirror a write in the store, so reads reflect it before the API does.
+
+        args are positional as passed by CachedFilesAPI / CachedTagsAPI.
+        """
+        if (api, method) == ("tags", "update_tag"):
+            for name in ("name", "color"):
+                if name in kwargs:
+                    conn.execute(f"UPDATE tags SET {name} = ? WHERE id = ?", (kwargs[name], args[0]))
+            return
+
+        if (api, method) == ("tags", "delete_tag"):
+            tag_id = args[0]
+            conn.execute("DELETE FROM tags WHERE id = ?", (tag_id,))
+            file_ids = [
+                r[0] for r in conn.execute(
+                    "SELECT recording_id FROM recording_tags WHERE tag_id = ?", (tag_id,)
+                )
+            ]
+
+            def edit(f: FileSimple) -> dict:
+                return {"filetag_id_list": tuple(t for t in f.filetag_id_list if t != tag_id)}
+        elif method == "update":
+            file_ids = [args[0]]
+
+            def edit(f: FileSimple) -> dict:
+                return {k: v for k, v in kwargs.items() if k in FileSimple.model_fields}
+        elif method in ("trash", "untrash"):
+            file_ids = args[0]
+
+            def edit(f: FileSimple) -> dict:
+                return {"is_trash": method == "trash"}
+        elif method == "update_tags":
+            file_ids = [args[0]] if isinstance(args[0], str) else args[0]
+            tag_id = args[1]
+
+            def edit(f: FileSimple) -> dict:
+                return {"filetag_id_list": tuple(dict.fromkeys(f.filetag_id_list + (tag_id,)))}
+        else:
+            return
+
+        entries = [e for e in (self._entry(conn, file_id) for file_id in file_ids) if e is not None]
+        if entries:
+            now_iso = datetime.now(timezone.utc).isoformat()
+            self._save_entries(conn, [e.model_copy(update=edit(e)) for e in entries], now_iso)
+
+    # --- Lifecycle ---
+
+    def close(self) -> None:
+        """Finish background work and close the API client if owned."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._owns_client and self._client is not None:
+            self._client.close()
+
+    def __enter__(self) -> "CachedPlaudClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class _CachedAPI:
+    """Sub-API wrapper: cached methods here, everything else passed through."""
+
+    name = ""
+
+    def __init__(self, cached: CachedPlaudClient):
+        self._cached = cached
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(getattr(self._cached.upstream, self.name), name)
+
+
+class CachedFilesAPI(_CachedAPI):
+    """FilesAPI with a cached listing and queueable writes."""
+
+    name = "files"
+
+    def list_simple(self) -> list[FileSimple]:
+        """Get simple list of all files, from the store when possible."""
+        return self._cached._list_files()
+
+    def update(self, file_id: str, **kwargs) -> dict:
+        """Update file metadata (queued if the API is unreachable)."""
+        return self._cached._write("files", "update", file_id, **kwargs)
+
+    def trash(self, file_ids: list[str]) -> dict:
+        """Move files to trash (queued if the API is unreachable)."""
+        return self._cached._write("files", "trash", list(file_ids))
+
+    def untrash(self, file_ids: list[str]) -> dict:
+        """Restore files from trash (queued if the API is unreachable)."""
+        return self._cached._write("files", "untrash", list(file_ids))
+
+    def update_tags(self, file_ids: str | list[str], tag_id: str) -> dict:
+        """Apply a tag to one or more files (queued if the API is unreachable)."""
+        return self._cached._write("files", "update_tags", file_ids, tag_id)
+
+
+class CachedTagsAPI(_CachedAPI):
+    """TagsAPI with a cached tag list and queueable edits."""
+
+    name = "tags"
+
+    def list_tags(self) -> list[FileTag]:
+        """List all file tags, from the store when possible."""
+        return self._cached._list_tags()
+
+    def create_tag(self, name: str, color: str | None = None, icon: str | None = None) -> FileTag:
+        """Create a new file tag. Needs the API, which assigns the tag ID.
+
+        Raises:
+            OfflineError: The API is unreachable.
+        """
+        tag = self._cached._call(lambda c: c.tags.create_tag(name, color=color, icon=icon))
+        if tag.id:
+            with self._cached._store() as conn:
+                conn.execute(
+                    """INSERT INTO tags (id, name, color, synced_at) VALUES (?, ?, ?, ?)
+                       ON CONFLICT(id) DO UPDATE SET name=excluded.name, color=excluded.color""",
+                    (tag.id, tag.name or name, tag.color, datetime.now(timezone.utc).isoformat()),
+                )
+        return tag
+
+    def update_tag(self, tag_id: str, **kwargs) -> FileTag | dict:
+        """Update a file tag (queued if the API is unreachable)."""
+        return self._cached._write("tags", "update_tag", tag_id, **kwargs)
+
+    def delete_tag(self, tag_id: str) -> dict:
+        """Delete a file tag (queued if the API is unreachable)."""
+        return self._cached._write("tags", "delete_tag", tag_id)
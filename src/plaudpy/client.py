@@ -1,5 +1,7 @@
 """Main PlaudClient class."""
 
+from collections.abc import Iterable
+from concurrent.futures import Executor
 from pathlib import Path
 
 import httpx
@@ -18,7 +20,10 @@ from .api.templates import TemplatesAPI
 from .api.users import UsersAPI
 from .config import PlaudConfig
 from .exceptions import ConfigurationError
+from .loader import RecordingLoader
 from .models import Recording, SearchResult, UserProfile, TranscriptionQuota
+from .parallel import parse_recordings
+from .tasks import TaskPoller
 
 
 class PlaudClient:
@@ -89,6 +94,12 @@ class PlaudClient:
         self._devices_api = DevicesAPI(self.config, self._http_client)
         self._misc_api = MiscAPI(self.config, self._http_client)
 
+        # Task status polling can confirm completions against the file listing
+        self._ai_api.poller = TaskPoller(self._ai_api, files=self._files_api)
+
+        # Concurrent get_recording calls share batched /file/list requests
+        self.recording_loader = RecordingLoader(self._files_api)
+
         # Collect all APIs for token distribution
         self._apis = [
             self._auth_api,
@@ -117,6 +128,10 @@ class PlaudClient:
         for api in self._apis:
             api.set_access_token(token_response.access_token)
 
+    def reauthenticate(self) -> None:
+        """Log in again, replacing an expired access token on every sub-API."""
+        self._authenticate()
+
     # --- Sub-API properties ---
 
     @property
@@ -181,23 +196,38 @@ class PlaudClient:
 
     # --- Convenience methods ---
 
-    def get_recordings(self) -> list[Recording]:
+    def get_recordings(
+        self,
+        workers: int | None = None,
+        executor: Executor | None = None,
+        columnar: bool = False,
+    ) -> list[Recording]:
         """Get all recordings with transcripts and summaries.
 
+        By default transcripts are parsed lazily on first access. Passing
+        workers or executor parses them eagerly across cores instead (see
+        plaudpy.parallel); small libraries still run sequentially.
+
+        Args:
+            workers: Number of worker processes for parsing.
+            executor: Executor to parse with (left running afterwards).
+            columnar: Store transcripts as ColumnarTranscript.
+
         Returns:
             List of Recording objects.
         """
         # First get simple list to get all file IDs
         simple_files = self._files_api.list_simple()
-        file_ids = [f.id for f in simple_files]
 
-        if not file_ids:
+        if not simple_files:
             return []
 
-        # Get detailed info including transcripts
-        details = self._files_api.get_details(file_ids)
+        # Get detailed info including transcripts, in duration-sized chunks
+        details = [d for chunk in self._files_api.iter_details(simple_files) for d in chunk]
 
-        return [Recording.from_file_detail(d) for d in details]
+        if workers is not None or executor is not None:
+            return parse_recordings(details, columnar=columnar, executor=executor, workers=workers)
+        return [Recording.from_file_detail(d, columnar=columnar, release=True) for d in details]
 
     def get_recording(self, file_id: str) -> Recording | None:
         """Get a single recording by ID.
@@ -205,13 +235,17 @@ class PlaudClient:
         Args:
             file_id: The file ID to fetch.
 
+        Lookups from concurrent callers are batched into one /file/list
+        request by recording_loader.
+
         Returns:
             Recording object or None if not found.
         """
-        details = self._files_api.get_details([file_id])
-        if not details:
-            return None
-        return Recording.from_file_detail(details[0])
+        return self.recording_loader.get(file_id)
+
+    async def aget_recording(self, file_id: str) -> Recording | None:
+        """Async variant of get_recording(), batched the same way."""
+        return await self.recording_loader.aget(file_id)
 
     def trigger_transcription(self, file_id: str, **kwargs) -> dict:
         """Trigger transcription/summarization for a file.
@@ -248,6 +282,19 @@ class PlaudClient:
         path.write_bytes(content)
         return path
 
+    def ingest(self, paths: Iterable[str | Path], dest: str | Path, **kwargs) -> list:
+        """Upload audio files, transcribe them and export the transcripts.
+
+        Stages run as an overlapping pipeline with per-file checkpoints;
+        see plaudpy.ingest.ingest() for the options.
+
+        Returns:
+            List of IngestState, one per file.
+        """
+        from .ingest import ingest  # deferred: ingest imports this module
+
+        return ingest(self, paths, dest, **kwargs)
+
     def search_recordings(self, query: str, **kwargs) -> list[SearchResult]:
         """Search recordings.
 
@@ -261,7 +308,9 @@ class PlaudClient:
         return self._search_api.search(query, **kwargs)
 
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Send pending lookups, stop task polling and close the HTTP client."""
+        self.recording_loader.flush()
+        self._ai_api.poller.close()
         self._http_client.close()
 
     def __enter__(self) -> "PlaudClient":
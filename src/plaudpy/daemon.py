@@ -0,0 +1,461 @@
+"""Resident sync service for the local SQLite store.
+
+Instead of a cron job that logs in and re-imports the whole listing on
+every run, SyncDaemon keeps one authenticated client and one store
+connection open and runs three jobs on their own cadences:
+
+- listing: fetch /file/simple/web and write only the rows that changed
+  since the previous pass (see models.diff_listings)
+- details: refetch transcripts and summaries of files whose listing
+  signature changed (see utils.sync_recordings(details=True))
+- tasks: check /ai/file-task-status for files not yet transcribed, and
+  pull the listing forward as soon as one finishes
+
+Each job is rescheduled after its interval with random jitter, so several
+daemons do not hit the API in lockstep. Changes are reported to
+registered callbacks as SyncEvents.
+
+Run it with ``plaud-sync`` (or ``python -m plaudpy.daemon``).
+"""
+
+import argparse
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone, tzinfo
+from pathlib import Path
+
+import httpx
+from pydantic import BaseModel
+
+from . import utils
+from .client import PlaudClient
+from .exceptions import APIError, AuthenticationError, PlaudError
+from .models import FileSimple, diff_listings
+from .tasks import SUCCESS_STATUSES, parse_task_statuses
+
+logger = logging.getLogger(__name__)
+
+NEW_RECORDING = "new_recording"
+TRANSCRIPT_READY = "transcript_ready"
+TAG_CHANGED = "tag_changed"
+EVENT_KINDS = (NEW_RECORDING, TRANSCRIPT_READY, TAG_CHANGED)
+
+# Jobs in the order they run when due together
+JOBS = ("listing", "details", "tasks")
+
+
+class SyncEvent(BaseModel):
+    """A change noticed by SyncDaemon."""
+
+    kind: str
+    file_id: str
+    file: FileSimple | None = None
+    added_tags: tuple[str, ...] = ()
+    removed_tags: tuple[str, ...] = ()
+
+
+class SyncDaemon:
+    """Keep the local store in sync with Plaud from a long-running process.
+
+    When the store is empty at start-up, the first pass only seeds it and
+    emits no events; otherwise events cover changes since the store was
+    last synced.
+
+    Example:
+        daemon = SyncDaemon(db_path="plaud.db", listing_interval=60)
+        daemon.on(TRANSCRIPT_READY, lambda e: print("ready:", e.file_id))
+        daemon.start()
+        ...
+        daemon.close()
+    """
+
+    def __init__(
+        self,
+        client: PlaudClient | None = None,
+        db_path: str | Path | None = None,
+        tz: tzinfo | None = None,
+        work_start: int = 9,
+        work_end: int = 18,
+        listing_interval: float = 60.0,
+        detail_interval: float = 300.0,
+        task_interval: float = 20.0,
+        jitter: float = 0.1,
+    ):
+        """Initialize the daemon.
+
+        Args:
+            client: Authenticated client to use. Defaults to a new
+                PlaudClient(), which the daemon closes on close().
+            db_path: Path to the database file.
+            tz: Timezone for the local time fields. Defaults to system local tz.
+            work_start: Start of working hours (inclusive, 24h).
+            work_end: End of working hours (exclusive, 24h).
+            listing_interval: Seconds between listing passes.
+            detail_interval: Seconds between detail refreshes.
+            task_interval: Seconds between task-status checks.
+            jitter: Each delay is scaled by a random factor in
+                [1 - jitter, 1 + jitter].
+        """
+        self._owns_client = client is None
+        self.client = client if client is not None else PlaudClient()
+        self.db_path = db_path
+        self.tz = tz or datetime.now().astimezone().tzinfo
+        self.work_start = work_start
+        self.work_end = work_end
+        self.intervals = {
+            "listing": listing_interval,
+            "details": detail_interval,
+            "tasks": task_interval,
+        }
+        self.jitter = jitter
+        self._random = random.Random()
+        self._callbacks: list[tuple[str | None, Callable[[SyncEvent], None]]] = []
+        self._conn: sqlite3.Connection | None = None
+        self._listing: dict[str, FileSimple] | None = None
+        self._detail_due: set[str] | None = None  # None: check every file
+        self._seeding = False
+        self._lock = threading.RLock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        now = time.monotonic()
+        self._due = {job: now for job in JOBS}
+
+    # --- Callbacks ---
+
+    def on(self, kind: str | None, callback: Callable[[SyncEvent], None]) -> None:
+        """Register callback for events of kind (None: every event).
+
+        Callbacks run on the daemon thread, after the change is committed
+        to the store. Exceptions they raise are logged and ignored.
+        """
+        if kind is not None and kind not in EVENT_KINDS:
+            raise ValueError(f"Unknown event kind {kind!r}; expected one of {EVENT_KINDS}")
+        self._callbacks.append((kind, callback))
+
+    def off(self, callback: Callable[[SyncEvent], None]) -> None:
+        """Unregister callback for all kinds."""
+        self._callbacks = [(k, cb) for k, cb in self._callbacks if cb is not callback]
+
+    def _emit(self, events: list[SyncEvent]) -> None:
+        for event in events:
+            for kind, callback in list(self._callbacks):
+                if kind is None or kind == event.kind:
+                    try:
+                        callback(event)
+                    except Exception:
+                        logger.exception("Sync event callback failed for %s", event.kind)
+
+    # --- Jobs ---
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The daemon's store connection, opened on first use.
+
+        Jobs may run on the caller's thread or the daemon thread; every use
+        happens under the daemon's lock, so the connection is shared.
+        """
+        with self._lock:
+            if self._conn is None:
+                self._conn = utils.get_db(self.db_path, check_same_thread=False)
+            return self._conn
+
+    def sync_listing(self) -> list[SyncEvent]:
+        """Fetch the listing and write the rows that changed.
+
+        Returns:
+            The events emitted (NEW_RECORDING, TAG_CHANGED).
+        """
+        with self._lock:
+            files = self.client.files.list_simple()
+            now_iso = datetime.now(timezone.utc).isoformat()
+            conn = self.conn
+
+            if self._listing is None:
+                # Baseline is whatever the store holds from earlier syncs
+                known = {r["id"] for r in conn.execute("SELECT id FROM recordings")}
+                old_tags: dict[str, set[str]] = {}
+                for r in conn.execute("SELECT tag_id, recording_id FROM recording_tags"):
+                    old_tags.setdefault(r["recording_id"], set()).add(r["tag_id"])
+                quiet = self._seeding = not known
+                changed = files
+                utils.prune_listing(conn, files)
+                added = [f for f in files if f.id not in known]
+                retagged = [f for f in files if f.id in known]
+            else:
+                diff = diff_listings(self._listing.values(), files)
+                old_tags = {f.id: set(self._listing[f.id].filetag_id_list) for f in diff.edited}
+                changed = diff.added + diff.edited
+                added = diff.added
+                retagged = diff.edited
+                quiet = False
+                conn.executemany(
+                    "DELETE FROM listing_entries WHERE id = ?", [(f.id,) for f in diff.removed]
+                )
+                if self._detail_due is not None:
+                    self._detail_due.update(diff.needs_detail)
+                if diff.newly_transcribed:
+                    self.trigger("details")
+
+            if changed:
+                utils.upsert_recordings(
+                    conn, changed, self.tz, self.work_start, self.work_end, now_iso
+                )
+                utils.sync_recording_tags(conn, changed)
+            conn.execute(
+                "INSERT INTO sync_log (synced_at, total_files) VALUES (?, ?)",
+                (now_iso, len(files)),
+            )
+            conn.commit()
+            self._listing = {f.id: f for f in files}
+
+            events = [SyncEvent(kind=NEW_RECORDING, file_id=f.id, file=f) for f in added]
+            for f in retagged:
+                before, after = old_tags.get(f.id, set()), set(f.filetag_id_list)
+                if before != after:
+                    events.append(SyncEvent(
+                        kind=TAG_CHANGED, file_id=f.id, file=f,
+                        added_tags=tuple(sorted(after - before)),
+                        removed_tags=tuple(sorted(before - after)),
+                    ))
+            if quiet:
+                return []
+        self._emit(events)
+        return events
+
+    def refresh_details(self) -> list[SyncEvent]:
+        """Refetch transcripts and summaries whose listing signature changed.
+
+        Returns:
+            The TRANSCRIPT_READY events emitted, for files that now have a
+            transcript in the store and did not before.
+        """
+        with self._lock:
+            if self._listing is None:
+                return []
+            if self._detail_due is None:
+                files = list(self._listing.values())
+            else:
+                files = [self._listing[i] for i in self._detail_due if i in self._listing]
+            self._detail_due = set()
+            if not files:
+                self._seeding = False
+                return []
+
+            conn = self.conn
+            ids = [f.id for f in files]
+            had = self._with_transcript(ids)
+            utils.sync_details(
+                conn, files, datetime.now(timezone.utc).isoformat(), client=self.client
+            )
+            conn.commit()
+            ready = self._with_transcript(ids) - had
+
+            # Files /file/list did not return keep their old signature; retry them
+            stored = {
+                r["id"]: r["listing_sig"]
+                for r in conn.execute(
+                    "SELECT id, listing_sig FROM recording_details"
+                    " WHERE id IN (SELECT value FROM json_each(?))",
+                    (json.dumps(ids),),
+                )
+            }
+            self._detail_due = {f.id for f in files if stored.get(f.id) != utils.listing_signature(f)}
+
+            seeding, self._seeding = self._seeding, False
+            events = [
+                SyncEvent(kind=TRANSCRIPT_READY, file_id=f.id, file=f)
+                for f in files if f.id in ready
+            ]
+            if seeding:
+                return []
+        self._emit(events)
+        return events
+
+    def _with_transcript(self, ids: list[str]) -> set[str]:
+        return {
+            r[0]
+            for r in self.conn.execute(
+                "SELECT DISTINCT recording_id FROM transcript_segments"
+                " WHERE recording_id IN (SELECT value FROM json_each(?))",
+                (json.dumps(ids),),
+            )
+        }
+
+    def check_tasks(self) -> list[str]:
+        """Check task status of untranscribed files.
+
+        Makes no request when every listed file is transcribed. When a task
+        has succeeded, the listing (and then details) runs right away
+        instead of waiting for its cadence.
+
+        Returns:
+            IDs whose task finished successfully.
+        """
+        with self._lock:
+            if self._listing is None:
+                return []
+            pending = {
+                f.id for f in self._listing.values()
+                if not (f.is_trans or f.is_summary or f.is_trash)
+            }
+        if not pending:
+            return []
+        statuses = parse_task_statuses(self.client.ai.get_file_task_status())
+        finished = [
+            file_id for file_id, status in statuses.items()
+            if file_id in pending and str(status.status or "").lower() in SUCCESS_STATUSES
+        ]
+        if finished:
+            self.trigger("listing")
+        return finished
+
+    # --- Scheduling ---
+
+    def _delay(self, job: str) -> float:
+        return self.intervals[job] * (1 + self._random.uniform(-self.jitter, self.jitter))
+
+    def trigger(self, job: str) -> None:
+        """Make job due now (e.g. "listing" after an upload)."""
+        if job not in JOBS:
+            raise ValueError(f"Unknown job {job!r}; expected one of {JOBS}")
+        self._due[job] = time.monotonic()
+        self._wake.set()
+
+    def run_pending(self) -> list[str]:
+        """Run every job that is due and reschedule it.
+
+        Errors are logged and the job retried at its next slot, so one bad
+        response or a locked store never stops the cadence; an expired
+        session is renewed first.
+
+        Returns:
+            The jobs that ran.
+        """
+        ran = []
+        for job in JOBS:
+            if self._due[job] > time.monotonic():
+                continue
+            self._due[job] = time.monotonic() + self._delay(job)
+            ran.append(job)
+            try:
+                {"listing": self.sync_listing,
+                 "details": self.refresh_details,
+                 "tasks": self.check_tasks}[job]()
+            except Exception as e:
+                logger.warning("Sync job %s failed: %s", job, e, exc_info=True)
+                if isinstance(e, AuthenticationError) or (
+                    isinstance(e, APIError) and e.status_code == 401
+                ):
+                    self._reauthenticate()
+        return ran
+
+    def _reauthenticate(self) -> None:
+        try:
+            self.client.reauthenticate()
+        except (PlaudError, httpx.HTTPError) as e:
+            logger.warning("Re-authentication failed: %s", e)
+
+    def run_forever(self) -> None:
+        """Run jobs on their cadences until stop() is called."""
+        while not self._stop.is_set():
+            self._wake.clear()
+            self.run_pending()
+            if self._stop.is_set():
+                break
+            timeout = max(0.0, min(self._due.values()) - time.monotonic())
+            self._wake.wait(timeout)
+
+    def start(self) -> None:
+        """Run the daemon in a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._serve, name="plaudpy-sync", daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        try:
+            self.run_forever()
+        finally:
+            self._close_store()
+
+    def stop(self) -> None:
+        """Ask the loop to exit after the current job."""
+        self._stop.set()
+        self._wake.set()
+
+    def close(self) -> None:
+        """Stop the loop and release the store and (if owned) the client."""
+        self.stop()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._close_store()
+        if self._owns_client:
+            self.client.close()
+
+    def _close_store(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> "SyncDaemon":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point: sync until interrupted, printing events as JSON lines."""
+    parser = argparse.ArgumentParser(
+        prog="plaud-sync", description="Keep a local PlaudPy store in sync."
+    )
+    parser.add_argument("--db", help="database file (default: <project>/plaud_data.db)")
+    parser.add_argument("--tz", help="IANA timezone for local time fields (default: system)")
+    parser.add_argument("--work-start", type=int, default=9)
+    parser.add_argument("--work-end", type=int, default=18)
+    parser.add_argument("--listing-interval", type=float, default=60.0)
+    parser.add_argument("--detail-interval", type=float, default=300.0)
+    parser.add_argument("--task-interval", type=float, default=20.0)
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not print events")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    tz = None
+    if args.tz:
+        from zoneinfo import ZoneInfo
+
+        tz = ZoneInfo(args.tz)
+
+    daemon = SyncDaemon(
+        db_path=args.db,
+        tz=tz,
+        work_start=args.work_start,
+        work_end=args.work_end,
+        listing_interval=args.listing_interval,
+        detail_interval=args.detail_interval,
+        task_interval=args.task_interval,
+        jitter=args.jitter,
+    )
+    if not args.quiet:
+        daemon.on(None, lambda event: print(event.model_dump_json(exclude={"file"}), flush=True))
+    try:
+        daemon.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
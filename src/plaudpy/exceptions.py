@@ -25,3 +25,9 @@ class ConfigurationError(PlaudError):
     """Raised when configuration is invalid or missing."""
 
     pass
+
+
+class OfflineError(PlaudError):
+    """Raised when the API is unreachable and no local copy can answer."""
+
+    pass
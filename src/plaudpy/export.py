@@ -0,0 +1,443 @@
+"""Transcript exporters (SRT, WebVTT, JSONL, CSV, markdown, text).
+
+Each writer streams to a text file-like object without building the whole
+document in memory, and works with both Transcript and ColumnarTranscript.
+"""
+
+import csv
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import textwrap
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO
+
+from . import utils
+from .models import ColumnarTranscript, Recording, Transcript
+from .models.transcript import write_lines
+
+logger = logging.getLogger(__name__)
+
+TranscriptLike = Transcript | ColumnarTranscript
+
+Row = tuple[str, str, float, float]  # speaker, text, start_time, end_time
+
+
+def merge_rows(rows: Iterable[Row], max_gap: float | None = None) -> Iterator[Row]:
+    """Merge consecutive rows from the same speaker into one.
+
+    Args:
+        rows: (speaker, text, start_time, end_time) tuples.
+        max_gap: Only merge when the silence between rows is at most this
+            many seconds. None merges regardless of the gap.
+    """
+    current: list | None = None
+    for speaker, text, start, end in rows:
+        if (
+            current is not None
+            and speaker == current[0]
+            and (max_gap is None or start - current[3] <= max_gap)
+        ):
+            current[1] = f"{current[1]} {text}" if current[1] else text
+            current[3] = max(current[3], end)
+            continue
+        if current is not None:
+            yield tuple(current)  # type: ignore[misc]
+        current = [speaker, text, start, end]
+    if current is not None:
+        yield tuple(current)  # type: ignore[misc]
+
+
+def _rows(
+    transcript: TranscriptLike, merge_speakers: bool, max_merge_gap: float | None
+) -> Iterator[Row]:
+    rows = transcript._rows()
+    return merge_rows(rows, max_merge_gap) if merge_speakers else rows
+
+
+def _timestamp(seconds: float, separator: str) -> str:
+    ms = max(0, round(seconds * 1000))
+    hours, ms = divmod(ms, 3_600_000)
+    minutes, ms = divmod(ms, 60_000)
+    secs, ms = divmod(ms, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{ms:03d}"
+
+
+def _wrap(text: str, width: int | None) -> list[str]:
+    if not width:
+        return [text]
+    return textwrap.wrap(text, width=width) or [""]
+
+
+def iter_srt_lines(
+    transcript: TranscriptLike,
+    include_speakers: bool = True,
+    merge_speakers: bool = False,
+    max_merge_gap: float | None = None,
+    wrap_width: int | None = 42,
+) -> Iterator[str]:
+    """Yield the lines of an SRT subtitle file."""
+    for i, (speaker, text, start, end) in enumerate(
+        _rows(transcript, merge_speakers, max_merge_gap), start=1
+    ):
+        if i > 1:
+            yield ""
+        yield str(i)
+        yield f"{_timestamp(start, ',')} --> {_timestamp(end, ',')}"
+        if include_speakers and speaker:
+            text = f"{speaker}: {text}"
+        yield from _wrap(text, wrap_width)
+
+
+def iter_vtt_lines(
+    transcript: TranscriptLike,
+    include_speakers: bool = True,
+    merge_speakers: bool = False,
+    max_merge_gap: float | None = None,
+    wrap_width: int | None = 42,
+) -> Iterator[str]:
+    """Yield the lines of a WebVTT subtitle file (speakers as voice spans)."""
+    yield "WEBVTT"
+    for speaker, text, start, end in _rows(transcript, merge_speakers, max_merge_gap):
+        yield ""
+        yield f"{_timestamp(start, '.')} --> {_timestamp(end, '.')}"
+        lines = _wrap(text, wrap_width)
+        if include_speakers and speaker:
+            lines[0] = f"<v {speaker}>{lines[0]}"
+        yield from lines
+
+
+def write_srt(transcript: TranscriptLike, fp: IO[str], **options) -> None:
+    """Stream a transcript as SRT subtitles.
+
+    Args:
+        transcript: Transcript to export.
+        fp: Text file-like object.
+        **options: include_speakers, merge_speakers, max_merge_gap and
+            wrap_width (characters per line, None to disable wrapping).
+    """
+    write_lines(fp, iter_srt_lines(transcript, **options))
+    fp.write("\n")
+
+
+def write_vtt(transcript: TranscriptLike, fp: IO[str], **options) -> None:
+    """Stream a transcript as WebVTT subtitles.
+
+    Args:
+        transcript: Transcript to export.
+        fp: Text file-like object.
+        **options: Same as write_srt().
+    """
+    write_lines(fp, iter_vtt_lines(transcript, **options))
+    fp.write("\n")
+
+
+def write_jsonl(
+    transcript: TranscriptLike,
+    fp: IO[str],
+    merge_speakers: bool = False,
+    max_merge_gap: float | None = None,
+) -> None:
+    """Stream a transcript as JSON Lines, one segment object per line.
+
+    Each object has 'index', 'speaker', 'start_time', 'end_time' (seconds)
+    and 'text'.
+    """
+    lines = (
+        json.dumps(
+            {"index": i, "speaker": speaker, "start_time": start, "end_time": end, "text": text},
+            ensure_ascii=False,
+        )
+        for i, (speaker, text, start, end) in enumerate(
+            _rows(transcript, merge_speakers, max_merge_gap)
+        )
+    )
+    for line in lines:
+        fp.write(line)
+        fp.write("\n")
+
+
+def write_csv(
+    transcript: TranscriptLike,
+    fp: IO[str],
+    merge_speakers: bool = False,
+    max_merge_gap: float | None = None,
+) -> None:
+    """Stream a transcript as CSV with a header row.
+
+    Columns: index, start_time, end_time, speaker, text. Open files with
+    newline="" as the csv module requires.
+    """
+    writer = csv.writer(fp)
+    writer.writerow(["index", "start_time", "end_time", "speaker", "text"])
+    writer.writerows(
+        (i, start, end, speaker, text)
+        for i, (speaker, text, start, end) in enumerate(
+            _rows(transcript, merge_speakers, max_merge_gap)
+        )
+    )
+
+
+def _write_markdown(recording: Recording, fp: IO[str], **options) -> None:
+    recording.write_markdown(fp, **options)
+
+
+def _write_text(recording: Recording, fp: IO[str], **options) -> None:
+    recording.transcript.write_text(fp, **options)
+
+
+def _on_transcript(writer: Callable) -> Callable[..., None]:
+    return lambda recording, fp, **options: writer(recording.transcript, fp, **options)
+
+
+# format -> (file extension, writer(recording, fp, **options))
+FORMATS: dict[str, tuple[str, Callable[..., None]]] = {
+    "srt": ("srt", _on_transcript(write_srt)),
+    "vtt": ("vtt", _on_transcript(write_vtt)),
+    "jsonl": ("jsonl", _on_transcript(write_jsonl)),
+    "csv": ("csv", _on_transcript(write_csv)),
+    "markdown": ("md", _write_markdown),
+    "text": ("txt", _write_text),
+}
+
+
+def check_format(format: str) -> None:
+    """Raise ValueError unless format is one of FORMATS."""
+    if format not in FORMATS:
+        raise ValueError(f"Unknown export format {format!r}; expected one of {sorted(FORMATS)}")
+
+
+def export_recording(recording: Recording, path: str | Path, format: str = "srt", **options) -> Path:
+    """Export one recording to a file.
+
+    Args:
+        recording: Recording to export.
+        path: Destination file path.
+        format: One of FORMATS ("srt", "vtt", "jsonl", "csv", "markdown", "text").
+        **options: Passed to the format's writer.
+
+    Returns:
+        Path to the written file.
+    """
+    check_format(format)
+    path = Path(path)
+    _, writer = FORMATS[format]
+    with path.open("w", encoding="utf-8", newline="") as fp:
+        writer(recording, fp, **options)
+    return path
+
+
+def export_recordings(
+    recordings: Iterable[Recording],
+    dest: str | Path,
+    format: str = "srt",
+    workers: int = 4,
+    **options,
+) -> list[Path]:
+    """Export many recordings concurrently, one file per recording.
+
+    Files are named <recording id>.<extension> inside dest, which is created
+    if needed.
+
+    Args:
+        recordings: Recordings to export.
+        dest: Destination directory.
+        format: One of FORMATS.
+        workers: Number of export threads.
+        **options: Passed to the format's writer.
+
+    Returns:
+        Paths of the written files, in input order.
+    """
+    check_format(format)
+    dest = Path(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+    ext, _ = FORMATS[format]
+
+    def export(recording: Recording) -> Path:
+        return export_recording(recording, dest / f"{recording.id}.{ext}", format, **options)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return list(pool.map(export, recordings))
+
+
+# --- Incremental library export (reads the local store from utils) ---
+
+MANIFEST_NAME = ".plaud-export.json"
+
+# Recordings per process-pool task
+EXPORT_CHUNK_SIZE = 64
+
+
+def write_atomic(path: Path, render: Callable[[IO[str]], None]) -> None:
+    """Render into a temp file next to path, then rename it into place."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as fp:
+            render(fp)
+        os.chmod(tmp, 0o644)  # mkstemp creates files private to the owner
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _render_chunk(
+    db_path: str, dest: str, file_ids: list[str], format: str, options: dict
+) -> list[str]:
+    """Render a chunk of recordings from the local store (process-pool task)."""
+    ext, writer = FORMATS[format]
+    written = []
+    conn = utils.get_db(db_path)
+    try:
+        for file_id in file_ids:
+            recording = utils.load_recording(conn, file_id)
+            if recording is None:
+                continue
+            write_atomic(
+                Path(dest) / f"{file_id}.{ext}",
+                lambda fp: writer(recording, fp, **options),
+            )
+            written.append(file_id)
+    finally:
+        conn.close()
+    return written
+
+
+def _load_manifest(path: Path) -> dict:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    return manifest.get("recordings", {}) if isinstance(manifest, dict) else {}
+
+
+def export_library(
+    dest: str | Path,
+    format: str = "markdown",
+    workers: int | None = None,
+    db_path: str | Path | None = None,
+    **options,
+) -> dict:
+    """Mirror every locally stored recording into dest, re-rendering only changes.
+
+    Reads recordings from the local database (see utils.sync_recordings;
+    transcripts and summaries need details=True). A manifest in dest records
+    a hash of each recording's content plus the format and options, so
+    unchanged recordings are skipped. Files are written atomically, and
+    exports of trashed or no longer stored recordings are removed.
+
+    A chunk that fails to render is logged and left out of the manifest,
+    so it is retried on the next run; the manifest is written for the
+    work that completed even if the export is interrupted.
+
+    Args:
+        dest: Destination directory (created if needed).
+        format: One of FORMATS.
+        workers: Processes used for rendering. None or 1 renders in-process.
+        db_path: Path to the database file.
+        **options: Passed to the format's writer.
+
+    Returns:
+        Dict with 'rendered', 'unchanged', 'deleted' and 'failed' counts.
+    """
+    check_format(format)
+    dest = Path(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+    db_path = str(Path(db_path).resolve()) if db_path else str(utils.DEFAULT_DB_PATH)
+    ext, _ = FORMATS[format]
+    settings = json.dumps([format, options], sort_keys=True, default=str)
+
+    conn = utils.get_db(db_path)
+    try:
+        rows = conn.execute(
+            """SELECT r.id, r.filename, r.duration, r.start_time_ms, r.is_trash,
+                      d.content_hash, d.language
+               FROM recordings r
+               LEFT JOIN recording_details d ON d.id = r.id"""
+        ).fetchall()
+    finally:
+        conn.close()
+
+    manifest_path = dest / MANIFEST_NAME
+    previous = _load_manifest(manifest_path)
+    current: dict[str, dict] = {}
+    pending: list[str] = []
+    unchanged = 0
+    for r in rows:
+        if r["is_trash"]:
+            continue
+        key = json.dumps(
+            [settings, r["filename"], r["duration"], r["start_time_ms"],
+             r["content_hash"], r["language"]]
+        )
+        entry = {
+            "hash": hashlib.sha256(key.encode("utf-8")).hexdigest(),
+            "file": f"{r['id']}.{ext}",
+        }
+        current[r["id"]] = entry
+        old = previous.get(r["id"])
+        if old == entry and (dest / entry["file"]).exists():
+            unchanged += 1
+        else:
+            pending.append(r["id"])
+
+    # Remove exports that are trashed, gone, or superseded by another extension
+    deleted = 0
+    for file_id, old in previous.items():
+        if file_id not in current or current[file_id]["file"] != old.get("file"):
+            try:
+                (dest / old["file"]).unlink()
+                deleted += 1
+            except (FileNotFoundError, KeyError):
+                pass
+
+    chunks = [
+        pending[i:i + EXPORT_CHUNK_SIZE] for i in range(0, len(pending), EXPORT_CHUNK_SIZE)
+    ]
+    rendered: list[str] = []
+    failed = 0
+
+    def chunk_failed(chunk: list[str], error: Exception) -> None:
+        nonlocal failed
+        failed += len(chunk)
+        logger.warning("Failed to export %d recordings (%s…): %s", len(chunk), chunk[0], error)
+
+    try:
+        if workers and workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_render_chunk, db_path, str(dest), chunk, format, options)
+                    for chunk in chunks
+                ]
+                for chunk, future in zip(chunks, futures):
+                    try:
+                        rendered.extend(future.result())
+                    except Exception as e:
+                        chunk_failed(chunk, e)
+        else:
+            for chunk in chunks:
+                try:
+                    rendered.extend(_render_chunk(db_path, str(dest), chunk, format, options))
+                except Exception as e:
+                    chunk_failed(chunk, e)
+    finally:
+        # Anything not rendered is left out so it is retried next run
+        done = set(rendered)
+        pending_ids = set(pending)
+        manifest = {
+            file_id: entry
+            for file_id, entry in current.items()
+            if file_id in done or file_id not in pending_ids
+        }
+        write_atomic(
+            manifest_path,
+            lambda fp: json.dump({"version": 1, "recordings": manifest}, fp, indent=0),
+        )
+    return {
+        "rendered": len(rendered), "unchanged": unchanged, "deleted": deleted, "failed": failed,
+    }
@@ -0,0 +1,277 @@
+"""End-to-end ingest: upload audio files and export their transcripts.
+
+Each file moves through the stages in STAGES. Every stage has its own
+bounded worker pool and a file is handed to the next stage as soon as it
+finishes the previous one, so uploads, triggers, fetches and exports of
+different files overlap. Waiting for transcription uses the client's
+shared task poller and occupies no thread.
+
+Per-file progress is checkpointed to a JSON state file after every stage,
+so re-running ingest() with the same state file resumes each file after
+its last completed stage.
+"""
+
+import json
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from .client import PlaudClient
+from .exceptions import APIError, PlaudError
+from .export import FORMATS, check_format, write_atomic
+from .models import Recording, TaskStatus
+from .tasks import FAILED_STATUSES
+
+STAGES = ("upload", "confirm", "transcribe", "wait", "fetch", "export")
+
+STATE_NAME = ".plaud-ingest.json"
+
+DEFAULT_CONCURRENCY = {"upload": 4, "confirm": 4, "transcribe": 4, "fetch": 4, "export": 2}
+
+
+class IngestState(BaseModel):
+    """Checkpointed progress of one file."""
+
+    path: str
+    size: int = 0
+    mtime_ns: int = 0
+    file_id: str | None = None
+    stage: str | None = None  # last completed stage
+    output: str | None = None
+    error: str | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.stage == STAGES[-1]
+
+
+def _upload(client: PlaudClient, path: Path) -> str:
+    """Upload one file, in parts when the server hands out part URLs.
+
+    The file is streamed (or read one part at a time), never loaded whole.
+    """
+    size = path.stat().st_size
+    target = client.files.get_upload_url(path.name, filesize=size)
+    if not target.file_id:
+        raise APIError(f"No file_id in upload URL response for {path.name}")
+
+    extra = target.model_extra or {}
+    part_urls = extra.get("part_urls") or extra.get("urls")
+    with path.open("rb") as fp:
+        if part_urls:
+            part_size = -(-size // len(part_urls))
+            parts = [
+                {"part_number": n, "etag": client.files.upload_part(url, fp.read(part_size))}
+                for n, url in enumerate(part_urls, start=1)
+            ]
+            client.files.merge_multipart(
+                target.file_id, upload_id=extra.get("upload_id"), parts=parts
+            )
+        elif target.url:
+            client.files.upload_part(target.url, fp, fields=target.fields)
+        else:
+            raise APIError(f"No upload URL in response for {path.name}")
+    return target.file_id
+
+
+class _Pipeline:
+    def __init__(
+        self,
+        client: PlaudClient,
+        dest: Path,
+        format: str,
+        state_path: Path,
+        concurrency: dict[str, int],
+        export_options: dict,
+        trigger_options: dict,
+    ):
+        self.client = client
+        self.dest = dest
+        self.format = format
+        self.state_path = state_path
+        self.export_options = export_options
+        self.trigger_options = trigger_options
+        self.states = self._load()
+        self._lock = threading.Lock()
+        self._done: dict[str, Future] = {}
+        self._recordings: dict[str, Recording] = {}
+        self._closed = False
+        self.pools = {
+            stage: ThreadPoolExecutor(max_workers=max(1, n), thread_name_prefix=f"ingest-{stage}")
+            for stage, n in concurrency.items()
+        }
+
+    def _load(self) -> dict[str, IngestState]:
+        try:
+            raw = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+        return {key: IngestState.model_validate(value) for key, value in raw.get("files", {}).items()}
+
+    def _save(self) -> None:
+        payload = {"files": {key: s.model_dump() for key, s in self.states.items()}}
+        write_atomic(self.state_path, lambda fp: json.dump(payload, fp, indent=1))
+
+    def _advance(self, key: str, stage: str, **changes) -> None:
+        with self._lock:
+            state = self.states[key]
+            for name, value in changes.items():
+                setattr(state, name, value)
+            state.stage = stage
+            state.error = None
+            self._save()
+        self._schedule(key)
+
+    def _fail(self, key: str, error: BaseException) -> None:
+        with self._lock:
+            self.states[key].error = str(error) or type(error).__name__
+            self._save()
+        self._recordings.pop(key, None)
+        if not self._done[key].done():
+            self._done[key].set_result(self.states[key])
+
+    def start(self, path: Path) -> Future:
+        key = str(path.resolve())
+        stat = path.stat()
+        with self._lock:
+            state = self.states.get(key)
+            if state is None or (state.size, state.mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+                state = self.states[key] = IngestState(
+                    path=key, size=stat.st_size, mtime_ns=stat.st_mtime_ns
+                )
+            self._done[key] = Future()
+        self._schedule(key)
+        return self._done[key]
+
+    def _schedule(self, key: str) -> None:
+        if self._closed:
+            return
+        state = self.states[key]
+        if state.done:
+            self._done[key].set_result(state)
+            return
+        stage = STAGES[STAGES.index(state.stage) + 1 if state.stage else 0]
+        if stage == "wait":
+            future = self.client.ai.poller.watch(state.file_id)
+            future.add_done_callback(lambda f: self._waited(key, f))
+        else:
+            self.pools[stage].submit(self._run_stage, key, stage)
+
+    def _waited(self, key: str, future: Future) -> None:
+        if future.cancelled():
+            self._fail(key, PlaudError("Stopped waiting for transcription"))
+            return
+        try:
+            status: TaskStatus = future.result()
+            if str(status.status or "").lower() in FAILED_STATUSES:
+                self._fail(key, APIError(f"Transcription failed: {status.status}"))
+            else:
+                self._advance(key, "wait")
+        except Exception as e:
+            self._fail(key, e)
+
+    def _run_stage(self, key: str, stage: str) -> None:
+        state = self.states[key]
+        try:
+            if stage == "upload":
+                self._advance(key, stage, file_id=_upload(self.client, Path(state.path)))
+            elif stage == "confirm":
+                self.client.files.confirm_upload(state.file_id)
+                self._advance(key, stage)
+            elif stage == "transcribe":
+                self.client.ai.trigger_transcription(state.file_id, **self.trigger_options)
+                self._advance(key, stage)
+            elif stage == "fetch":
+                details = self.client.files.get_details([state.file_id])
+                if not details:
+                    raise APIError(f"File {state.file_id} not found")
+                self._recordings[key] = Recording.from_file_detail(details[0], release=True)
+                self._advance(key, stage)
+            elif stage == "export":
+                self._export(key)
+        except Exception as e:
+            # Anything uncaught here would leave the file's future pending forever
+            self._fail(key, e)
+
+    def _export(self, key: str) -> None:
+        state = self.states[key]
+        recording = self._recordings.pop(key, None)
+        if recording is None:
+            # Resumed between fetch and export; the fetched detail is gone
+            with self._lock:
+                state.stage = "wait"
+            self._schedule(key)
+            return
+        ext, writer = FORMATS[self.format]
+        output = self.dest / f"{state.file_id}.{ext}"
+        write_atomic(output, lambda fp: writer(recording, fp, **self.export_options))
+        self._advance(key, "export", output=str(output))
+
+    def shutdown(self) -> None:
+        self._closed = True
+        for pool in self.pools.values():
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def ingest(
+    client: PlaudClient,
+    paths: Iterable[str | Path],
+    dest: str | Path,
+    format: str = "markdown",
+    state_path: str | Path | None = None,
+    concurrency: dict[str, int] | None = None,
+    export_options: dict | None = None,
+    timeout: float | None = None,
+    **trigger_options,
+) -> list[IngestState]:
+    """Upload audio files, transcribe them and export the results.
+
+    Args:
+        client: Authenticated client.
+        paths: Audio files to ingest.
+        dest: Directory for exported transcripts (<file id>.<extension>).
+        format: Export format, one of plaudpy.export.FORMATS.
+        state_path: Checkpoint file. Defaults to dest/.plaud-ingest.json.
+            Files whose size or mtime changed since they were checkpointed
+            start over.
+        concurrency: Per-stage worker counts, overriding DEFAULT_CONCURRENCY.
+        export_options: Passed to the format's writer.
+        timeout: Seconds to wait for the whole batch; files still in flight
+            keep their checkpoint and resume on the next run.
+        **trigger_options: Passed to AIAPI.trigger_transcription.
+
+    Returns:
+        Final state of each file, in input order (duplicates removed).
+        Failed files carry an error and resume from their last completed
+        stage on the next run.
+
+    Raises:
+        TimeoutError: If timeout elapses first.
+    """
+    check_format(format)
+    dest = Path(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+    pipeline = _Pipeline(
+        client,
+        dest,
+        format,
+        Path(state_path) if state_path else dest / STATE_NAME,
+        {**DEFAULT_CONCURRENCY, **(concurrency or {})},
+        export_options or {},
+        trigger_options,
+    )
+    try:
+        futures = {}
+        for p in paths:
+            key = str(Path(p).resolve())
+            if key not in futures:
+                futures[key] = pipeline.start(Path(p))
+        _, not_done = wait(list(futures.values()), timeout=timeout)
+        if not_done:
+            raise TimeoutError(f"{len(not_done)} file(s) still in flight after {timeout}s")
+        return [f.result() for f in futures.values()]
+    finally:
+        pipeline.shutdown()
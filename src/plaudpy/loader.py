@@ -0,0 +1,110 @@
+"""Batching of single-recording lookups into /file/list calls.
+
+/file/list accepts an array of IDs, so lookups for different recordings
+that arrive close together can share one request. RecordingLoader collects
+IDs for a short window (or until max_batch distinct IDs are queued), sends
+one request and resolves every caller's future. Requests are sent from
+a background thread, never from the thread that queued the lookup.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
+
+from .models import Recording
+
+if TYPE_CHECKING:
+    from .api.files import FilesAPI
+
+# Seconds a batch stays open for more IDs after its first request
+DEFAULT_WINDOW = 0.005
+
+# Largest number of IDs sent in one /file/list request
+DEFAULT_MAX_BATCH = 100
+
+
+class RecordingLoader:
+    """Coalesce get_recording calls into batched /file/list requests.
+
+    Requests for the same ID within a batch share one future. Futures
+    resolve to a Recording, or None when the ID is not found.
+
+    Example:
+        loader = RecordingLoader(client.files)
+        a, b = loader.load("id-1"), loader.load("id-2")  # one request
+        print(a.result().title, b.result().title)
+    """
+
+    def __init__(
+        self,
+        files: "FilesAPI",
+        window: float = DEFAULT_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        self.files = files
+        self.window = window
+        self.max_batch = max(1, max_batch)
+        self._lock = threading.Lock()
+        self._pending: dict[str, Future] = {}
+        self._timer: threading.Timer | None = None
+
+    def load(self, file_id: str) -> Future:
+        """Queue a lookup and return a future for its Recording (or None)."""
+        with self._lock:
+            future = self._pending.get(file_id)
+            if future is not None:
+                return future
+            future = self._pending[file_id] = Future()
+            if len(self._pending) >= self.max_batch:
+                batch = self._take()
+            else:
+                batch = None
+                if self._timer is None:
+                    self._timer = threading.Timer(self.window, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if batch:
+            # Like the timer path, send off the caller's thread (which may
+            # be an event loop)
+            threading.Thread(
+                target=self._dispatch, args=(batch,), name="plaudpy-loader", daemon=True
+            ).start()
+        return future
+
+    def get(self, file_id: str, timeout: float | None = None) -> Recording | None:
+        """Load one recording, blocking until its batch completes."""
+        return self.load(file_id).result(timeout=timeout)
+
+    async def aget(self, file_id: str) -> Recording | None:
+        """Async variant of get(); the batch runs off the event loop."""
+        return await asyncio.wrap_future(self.load(file_id))
+
+    def flush(self) -> None:
+        """Send the pending batch now, from the calling thread."""
+        with self._lock:
+            batch = self._take()
+        if batch:
+            self._dispatch(batch)
+
+    def _take(self) -> dict[str, Future]:
+        """Detach the pending batch; the caller holds the lock."""
+        batch, self._pending = self._pending, {}
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _dispatch(self, batch: dict[str, Future]) -> None:
+        try:
+            details = self.files.get_details(list(batch))
+        except BaseException as e:
+            for future in batch.values():
+                future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        found = {d.id: d for d in details}
+        for file_id, future in batch.items():
+            detail = found.get(file_id)
+            future.set_result(None if detail is None else Recording.from_file_detail(detail, release=True))
@@ -3,12 +3,20 @@
 from .ai import CustomTemplate, TaskStatus
 from .auth import AccessTokenInfo, SSOProvider, TokenResponse
 from .device import Device
-from .file import FileDetail, FileSimple, FileTag, Recording, UploadPresignedUrl
+from .file import (
+    FileDetail,
+    FileSimple,
+    FileTag,
+    ListingDiff,
+    Recording,
+    UploadPresignedUrl,
+    diff_listings,
+)
 from .membership import FreeTrialStatus, StripePrice, StripeSubscription
 from .search import SavedQuery, SearchResult
 from .speaker import Speaker
 from .template import SummaryTemplate, TemplateCategory
-from .transcript import Transcript, TranscriptEntry
+from .transcript import ColumnarTranscript, Transcript, TranscriptEntry
 from .user import (
     FeatureAccess,
     FileStats,
@@ -26,11 +34,14 @@ __all__ = [
     "FileSimple",
     "FileDetail",
     "FileTag",
+    "ListingDiff",
+    "diff_listings",
     "Recording",
     "UploadPresignedUrl",
     # Transcript
     "TranscriptEntry",
     "Transcript",
+    "ColumnarTranscript",
     # AI
     "TaskStatus",
     "CustomTemplate",
@@ -1,11 +1,20 @@
 """File and recording models."""
 
+import io
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import IO, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, field_validator, model_validator
 
-from .transcript import Transcript, TranscriptEntry
+from .transcript import (
+    WRITE_CHUNK_SIZE,
+    ColumnarTranscript,
+    Transcript,
+    TranscriptEntry,
+    write_lines,
+)
 
 
 class FileSimple(BaseModel):
@@ -13,11 +22,32 @@ class FileSimple(BaseModel):
 
     id: str
     filename: str = ""
+    filesize: int = 0
+    file_md5: str = ""
     duration: int = 0
     start_time: int = Field(default=0)
+    end_time: int = 0
+    edit_time: int = 0
+    is_trans: bool = False
+    is_summary: bool = False
+    is_trash: bool = False
+    scene: int | None = None
+    serial_number: str = ""
+    filetag_id_list: tuple[str, ...] = ()
+    keywords: tuple[str, ...] = ()
 
     model_config = {"populate_by_name": True}
 
+    @field_validator("file_md5", "serial_number", mode="before")
+    @classmethod
+    def _none_to_empty_str(cls, value: Any) -> Any:
+        return "" if value is None else value
+
+    @field_validator("filetag_id_list", "keywords", mode="before")
+    @classmethod
+    def _none_to_empty_tuple(cls, value: Any) -> Any:
+        return () if value is None else value
+
     @property
     def title(self) -> str:
         return self.filename
@@ -29,6 +59,67 @@ class FileSimple(BaseModel):
         return None
 
 
+class ListingDiff(BaseModel):
+    """Changes between two /file/simple/web listings (see diff_listings)."""
+
+    added: list[FileSimple] = Field(default_factory=list)
+    removed: list[FileSimple] = Field(default_factory=list)
+    edited: list[FileSimple] = Field(default_factory=list)
+    # The part of edited whose audio or content may have changed
+    content_edited: list[FileSimple] = Field(default_factory=list)
+    newly_transcribed: list[FileSimple] = Field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.edited or self.newly_transcribed)
+
+    @property
+    def needs_detail(self) -> list[str]:
+        """IDs whose transcript or summary may have changed, in listing order.
+
+        Metadata-only edits (a rename, new tags, trashing) are left out;
+        they only need the listing updated.
+        """
+        files = self.added + self.content_edited + self.newly_transcribed
+        return list(dict.fromkeys(f.id for f in files if f.is_trans or f.is_summary))
+
+
+# Listing fields whose change marks a file as edited
+_EDIT_FIELDS = ("edit_time", "file_md5", "filesize", "filename", "filetag_id_list", "is_trash")
+# The subset that can mean new content
+_CONTENT_FIELDS = ("edit_time", "file_md5", "filesize")
+
+
+def diff_listings(old: Iterable[FileSimple], new: Iterable[FileSimple]) -> ListingDiff:
+    """Compare two listings without fetching any details.
+
+    A file is edited when any of its edit time, content hash, size, name,
+    tags or trash flag changed (content edited when it was its edit time,
+    hash or size), and newly transcribed when is_trans or is_summary
+    turned on. A file can be both.
+
+    Returns:
+        ListingDiff; added, edited, content_edited and newly_transcribed
+        hold entries from new, removed holds entries from old.
+    """
+    before = {f.id: f for f in old}
+    diff = ListingDiff()
+    seen = set()
+    for f in new:
+        seen.add(f.id)
+        prev = before.get(f.id)
+        if prev is None:
+            diff.added.append(f)
+            continue
+        if any(getattr(prev, name) != getattr(f, name) for name in _EDIT_FIELDS):
+            diff.edited.append(f)
+            if any(getattr(prev, name) != getattr(f, name) for name in _CONTENT_FIELDS):
+                diff.content_edited.append(f)
+        if (f.is_trans and not prev.is_trans) or (f.is_summary and not prev.is_summary):
+            diff.newly_transcribed.append(f)
+    diff.removed = [f for file_id, f in before.items() if file_id not in seen]
+    return diff
+
+
 class FileDetail(BaseModel):
     """Detailed file info from /file/list endpoint."""
 
@@ -42,6 +133,19 @@ class FileDetail(BaseModel):
 
     model_config = {"populate_by_name": True}
 
+    # Parsed transcripts, keyed by the `columnar` flag; a cache, ignored by __eq__
+    _transcripts: dict[bool, Any] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "transcript_data":
+            self._transcripts.clear()
+        super().__setattr__(name, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FileDetail):
+            return NotImplemented
+        return self.model_dump() == other.model_dump()
+
     @property
     def title(self) -> str:
         return self.filename
@@ -52,8 +156,40 @@ class FileDetail(BaseModel):
             return datetime.fromtimestamp(self.start_time / 1000.0, tz=timezone.utc)
         return None
 
-    def get_transcript(self) -> Transcript:
-        """Parse transcript data into a Transcript object."""
+    def get_transcript(
+        self, columnar: bool = False, release: bool = False
+    ) -> Transcript | ColumnarTranscript:
+        """Parse transcript data into a Transcript object.
+
+        The result is memoized, so repeated calls return the same object.
+
+        Args:
+            columnar: Return a memory-compact ColumnarTranscript instead,
+                built straight from the raw data without per-entry models.
+            release: Drop the raw transcript_data once parsed.
+        """
+        transcript = self._transcripts.get(columnar)
+        if transcript is None:
+            other = self._transcripts.get(not columnar)
+            if self.transcript_data is None and other is not None:
+                # Raw data already released; convert the parsed form instead
+                transcript = other.to_columnar() if columnar else other.to_transcript()
+            else:
+                transcript = self._parse_transcript(columnar)
+            self._transcripts[columnar] = transcript
+        if release:
+            self.release_transcript_data()
+        return transcript
+
+    def release_transcript_data(self) -> None:
+        """Free the raw trans_result, keeping any already-parsed transcript."""
+        object.__setattr__(self, "transcript_data", None)
+
+    def _parse_transcript(self, columnar: bool) -> Transcript | ColumnarTranscript:
+        if columnar:
+            return ColumnarTranscript.from_trans_result(
+                self.transcript_data or [], language=self.language
+            )
         if not self.transcript_data:
             return Transcript(language=self.language)
 
@@ -77,55 +213,129 @@ class Recording(BaseModel):
     title: str
     duration: int = 0
     created_at: datetime | None = None
-    transcript: Transcript = Field(default_factory=Transcript)
     summary: str | None = None
     language: str | None = None
 
+    # The transcript is parsed from _source on first access
+    _transcript: Transcript | ColumnarTranscript | None = PrivateAttr(default=None)
+    _source: FileDetail | None = PrivateAttr(default=None)
+    _columnar: bool = PrivateAttr(default=False)
+    _release: bool = PrivateAttr(default=False)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _take_transcript(cls, data: Any, handler: Any) -> "Recording":
+        transcript = None
+        if isinstance(data, dict) and "transcript" in data:
+            data = dict(data)
+            transcript = data.pop("transcript")
+        recording = handler(data)
+        if transcript is not None:
+            recording.transcript = transcript
+        return recording
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def transcript(self) -> Transcript | ColumnarTranscript:
+        """The recording's transcript, parsed lazily and memoized."""
+        if self._transcript is None:
+            if self._source is not None:
+                self._transcript = self._source.get_transcript(
+                    columnar=self._columnar, release=self._release
+                )
+                self._source = None
+            else:
+                self._transcript = Transcript(language=self.language)
+        return self._transcript
+
+    @transcript.setter
+    def transcript(self, value: Transcript | ColumnarTranscript | dict) -> None:
+        if isinstance(value, dict):
+            value = Transcript.model_validate(value)
+        self._transcript = value
+        self._source = None
+
+    def __eq__(self, other: object) -> bool:
+        # Compare what the recording holds, not whether its transcript has
+        # been parsed yet
+        if not isinstance(other, Recording):
+            return NotImplemented
+        return self.model_dump() == other.model_dump()
+
     @classmethod
-    def from_file_detail(cls, detail: FileDetail) -> "Recording":
-        """Create a Recording from FileDetail."""
-        return cls(
+    def from_file_detail(
+        cls, detail: FileDetail, columnar: bool = False, release: bool = False
+    ) -> "Recording":
+        """Create a Recording from FileDetail.
+
+        The transcript is not parsed until `transcript` is first accessed.
+
+        Args:
+            detail: The file detail to convert.
+            columnar: Store the transcript as a ColumnarTranscript.
+            release: Drop the detail's raw trans_result once the transcript
+                is parsed. Only pass this for details nothing else reads.
+        """
+        recording = cls(
             id=detail.id,
             title=detail.title,
             duration=detail.duration,
             created_at=detail.created_at,
-            transcript=detail.get_transcript(),
             summary=detail.summary,
             language=detail.language,
         )
+        recording._source = detail
+        recording._columnar = columnar
+        recording._release = release
+        return recording
 
-    def to_markdown(self, include_timestamps: bool = False) -> str:
-        """Export recording to markdown format.
-
-        Args:
-            include_timestamps: Whether to include timestamps in transcript.
-
-        Returns:
-            Markdown representation of the recording.
-        """
-        lines = [f"# {self.title}", ""]
+    def iter_markdown_lines(self, include_timestamps: bool = False) -> Iterator[str]:
+        """Yield the lines of to_markdown() one at a time."""
+        yield f"# {self.title}"
+        yield ""
 
         if self.created_at:
-            lines.append(f"**Date:** {self.created_at.strftime('%Y-%m-%d %H:%M')}")
+            yield f"**Date:** {self.created_at.strftime('%Y-%m-%d %H:%M')}"
 
         if self.duration:
             minutes = self.duration // 60
             seconds = self.duration % 60
-            lines.append(f"**Duration:** {minutes}:{seconds:02d}")
+            yield f"**Duration:** {minutes}:{seconds:02d}"
 
-        lines.append("")
+        yield ""
 
         if self.summary:
-            lines.extend(["## Summary", "", self.summary, ""])
+            yield from ("## Summary", "", self.summary, "")
 
         if self.transcript.entries:
-            lines.extend([
-                "## Transcript",
-                "",
-                self.transcript.to_markdown(include_timestamps=include_timestamps),
-            ])
+            yield "## Transcript"
+            yield ""
+            yield from self.transcript.iter_markdown_lines(include_timestamps=include_timestamps)
+
+    def write_markdown(
+        self, fp: IO, include_timestamps: bool = False, chunk_size: int = WRITE_CHUNK_SIZE
+    ) -> None:
+        """Stream the recording as markdown to a file-like object.
 
-        return "\n".join(lines)
+        Args:
+            fp: Text or binary file-like object (binary receives UTF-8).
+            include_timestamps: Whether to include timestamps in transcript.
+            chunk_size: Approximate number of characters buffered per write.
+        """
+        write_lines(fp, self.iter_markdown_lines(include_timestamps), chunk_size)
+
+    def to_markdown(self, include_timestamps: bool = False) -> str:
+        """Export recording to markdown format.
+
+        Args:
+            include_timestamps: Whether to include timestamps in transcript.
+
+        Returns:
+            Markdown representation of the recording.
+        """
+        buf = io.StringIO()
+        self.write_markdown(buf, include_timestamps=include_timestamps)
+        return buf.getvalue()
 
 
 class FileTag(BaseModel):
@@ -1,6 +1,42 @@
 """Transcript models."""
 
-from pydantic import BaseModel, Field
+import io
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from typing import IO, Any, overload
+
+from pydantic import BaseModel, Field, PrivateAttr
+from pydantic_core import core_schema
+
+
+# Characters buffered between writes by the streaming writers
+WRITE_CHUNK_SIZE = 64 * 1024
+
+
+def write_lines(fp: IO, lines: Iterable[str], chunk_size: int = WRITE_CHUNK_SIZE) -> None:
+    """Write lines joined by newlines (no trailing newline) in buffered chunks.
+
+    Binary file objects receive UTF-8 encoded bytes.
+    """
+    binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or "b" in str(getattr(fp, "mode", ""))
+    buf: list[str] = []
+    size = 0
+    first = True
+    for line in lines:
+        if not first:
+            buf.append("\n")
+        first = False
+        buf.append(line)
+        size += len(line) + 1
+        if size >= chunk_size:
+            chunk = "".join(buf)
+            fp.write(chunk.encode("utf-8") if binary else chunk)
+            buf.clear()
+            size = 0
+    if buf:
+        chunk = "".join(buf)
+        fp.write(chunk.encode("utf-8") if binary else chunk)
 
 
 class TranscriptEntry(BaseModel):
@@ -12,11 +48,163 @@ class TranscriptEntry(BaseModel):
     end_time: float = 0.0
 
 
-class Transcript(BaseModel):
-    """A complete transcript with multiple entries."""
+class _TimeIndex:
+    """Entries sorted by start time, for bisect-based time lookups.
 
-    entries: list[TranscriptEntry] = Field(default_factory=list)
-    language: str | None = None
+    Diarized transcripts can contain overlapping segments, so a running
+    maximum of end times (in start order) bounds the search from the left:
+    no entry before the first position whose running max reaches t can
+    still be active at t.
+    """
+
+    __slots__ = ("order", "starts", "ends", "max_ends")
+
+    def __init__(self, rows: Iterable[tuple[str, str, float, float]]):
+        spans = sorted(
+            ((start, max(end, start), i) for i, (_, _, start, end) in enumerate(rows)),
+            key=lambda span: span[0],
+        )
+        self.order = array("L", (i for _, _, i in spans))
+        self.starts = array("d", (start for start, _, _ in spans))
+        self.ends = array("d", (end for _, end, _ in spans))
+        self.max_ends = array("d")
+        running = float("-inf")
+        for end in self.ends:
+            running = max(running, end)
+            self.max_ends.append(running)
+
+    def overlapping(self, start: float, end: float) -> list[int]:
+        """Entry indices (in start order) overlapping [start, end).
+
+        Zero-length entries count when they fall inside the range.
+        """
+        lo = bisect_left(self.max_ends, start)
+        hi = bisect_left(self.starts, end)
+        return [
+            self.order[k]
+            for k in range(lo, hi)
+            if self.ends[k] > start or self.starts[k] >= start
+        ]
+
+    def active_at(self, t: float) -> list[int]:
+        """Entry indices (in start order) with start <= t < end."""
+        lo = bisect_right(self.max_ends, t)
+        hi = bisect_right(self.starts, t)
+        return [self.order[k] for k in range(lo, hi) if self.ends[k] > t]
+
+
+class _TranscriptMixin:
+    """Behaviour shared by Transcript and ColumnarTranscript.
+
+    Subclasses provide _rows(), yielding (speaker, text, start_time, end_time)
+    tuples in transcript order, _subset() and the _time_index() cache.
+    """
+
+    def _rows(self) -> Iterator[tuple[str, str, float, float]]:
+        raise NotImplementedError
+
+    def _subset(self, indices: list[int]):
+        raise NotImplementedError
+
+    def _time_index(self) -> _TimeIndex:
+        raise NotImplementedError
+
+    def entries_at(self, t: float) -> list[TranscriptEntry]:
+        """All entries being spoken at time t (seconds), earliest start first."""
+        return [self.entries[i] for i in self._time_index().active_at(t)]
+
+    def entry_at(self, t: float) -> TranscriptEntry | None:
+        """The entry being spoken at time t (seconds).
+
+        When diarized segments overlap, the one that started most recently
+        wins. Returns None if nothing is being said at t.
+        """
+        active = self._time_index().active_at(t)
+        return self.entries[active[-1]] if active else None
+
+    def slice(self, start: float, end: float):
+        """Entries overlapping [start, end) seconds, as a transcript of the same type.
+
+        Entries are ordered by start time.
+        """
+        return self._subset(self._time_index().overlapping(start, end))
+
+    def window_iter(self, size: float, step: float | None = None, origin: float = 0.0):
+        """Iterate over fixed-size time windows.
+
+        Args:
+            size: Window length in seconds.
+            step: Distance between window starts. Defaults to size
+                (non-overlapping windows).
+            origin: Start of the first window.
+
+        Yields:
+            (window_start, window_end, transcript) tuples, where transcript
+            holds the entries overlapping the window.
+        """
+        step = size if step is None else step
+        if size <= 0 or step <= 0:
+            raise ValueError("size and step must be positive")
+        index = self._time_index()
+        if not index.starts:
+            return
+        last = index.max_ends[-1]
+        k = 0
+        while True:
+            window_start = origin + k * step
+            if window_start >= last and k:
+                break
+            window_end = window_start + size
+            yield window_start, window_end, self._subset(index.overlapping(window_start, window_end))
+            k += 1
+
+    def iter_text_lines(self, include_speakers: bool = True) -> Iterator[str]:
+        """Yield the lines of to_text() one at a time."""
+        for speaker, text, _, _ in self._rows():
+            if include_speakers and speaker:
+                yield f"{speaker}: {text}"
+            else:
+                yield text
+
+    def iter_markdown_lines(self, include_timestamps: bool = False) -> Iterator[str]:
+        """Yield the lines of to_markdown() one at a time."""
+        current_speaker = None
+
+        for speaker, text, start_time, _ in self._rows():
+            if speaker != current_speaker:
+                current_speaker = speaker
+                speaker_label = f"**{speaker}**" if speaker else "**Speaker**"
+                yield f"\n{speaker_label}\n"
+
+            if include_timestamps:
+                timestamp = f"[{start_time:.1f}s] "
+                yield f"{timestamp}{text}"
+            else:
+                yield text
+
+    def write_text(
+        self, fp: IO, include_speakers: bool = True, chunk_size: int = WRITE_CHUNK_SIZE
+    ) -> None:
+        """Stream the plain-text transcript to a file-like object.
+
+        Args:
+            fp: Text or binary file-like object (binary receives UTF-8).
+            include_speakers: Whether to include speaker labels.
+            chunk_size: Approximate number of characters buffered per write.
+        """
+        write_lines(fp, self.iter_text_lines(include_speakers), chunk_size)
+
+    def write_markdown(
+        self, fp: IO, include_timestamps: bool = False, chunk_size: int = WRITE_CHUNK_SIZE
+    ) -> None:
+        """Stream the markdown transcript to a file-like object.
+
+        Args:
+            fp: Text or binary file-like object (binary receives UTF-8).
+            include_timestamps: Whether to include timestamps.
+            chunk_size: Approximate number of characters buffered per write.
+        """
+        write_lines(fp, self.iter_markdown_lines(include_timestamps), chunk_size)
 
     def to_text(self, include_speakers: bool = True) -> str:
         """Convert transcript to plain text.
@@ -27,13 +215,9 @@ class Transcript(BaseModel):
         Returns:
             Plain text representation of the transcript.
         """
-        lines = []
-        for entry in self.entries:
-            if include_speakers and entry.speaker:
-                lines.append(f"{entry.speaker}: {entry.text}")
-            else:
-                lines.append(entry.text)
-        return "\n".join(lines)
+        buf = io.StringIO()
+        self.write_text(buf, include_speakers=include_speakers)
+        return buf.getvalue()
 
     def to_markdown(self, include_timestamps: bool = False) -> str:
         """Convert transcript to markdown format.
@@ -44,19 +228,221 @@ class Transcript(BaseModel):
         Returns:
             Markdown representation of the transcript.
         """
-        lines = []
-        current_speaker = None
+        buf = io.StringIO()
+        self.write_markdown(buf, include_timestamps=include_timestamps)
+        return buf.getvalue()
+
+
+class Transcript(_TranscriptMixin, BaseModel):
+    """A complete transcript with multiple entries.
+
+    Time lookups build an index on first use. It is rebuilt when entries
+    is reassigned or changes length; editing existing entries in place
+    (t.entries[i] = ...) is not detected, so reassign entries instead.
+    """
+
+    entries: list[TranscriptEntry] = Field(default_factory=list)
+    language: str | None = None
 
+    # (len(entries), index); a cache, ignored by __eq__
+    _index: tuple[int, _TimeIndex] | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "entries":
+            self._index = None
+        super().__setattr__(name, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Transcript):
+            return NotImplemented
+        return self.language == other.language and self.entries == other.entries
+
+    def _rows(self) -> Iterator[tuple[str, str, float, float]]:
         for entry in self.entries:
-            if entry.speaker != current_speaker:
-                current_speaker = entry.speaker
-                speaker_label = f"**{entry.speaker}**" if entry.speaker else "**Speaker**"
-                lines.append(f"\n{speaker_label}\n")
+            yield entry.speaker, entry.text, entry.start_time, entry.end_time
 
-            if include_timestamps:
-                timestamp = f"[{entry.start_time:.1f}s] "
-                lines.append(f"{timestamp}{entry.text}")
-            else:
-                lines.append(entry.text)
+    def _subset(self, indices: list[int]) -> "Transcript":
+        return Transcript(entries=[self.entries[i] for i in indices], language=self.language)
+
+    def _time_index(self) -> _TimeIndex:
+        # Reassigning entries clears the index; growing or shrinking it rebuilds it
+        if self._index is None or self._index[0] != len(self.entries):
+            self._index = (len(self.entries), _TimeIndex(self._rows()))
+        return self._index[1]
+
+    def to_columnar(self) -> "ColumnarTranscript":
+        """Convert to the memory-compact columnar representation."""
+        return ColumnarTranscript.from_rows(self._rows(), language=self.language)
+
+
+class _EntryView(Sequence):
+    """Read-only sequence of TranscriptEntry built on demand from columns."""
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: "ColumnarTranscript"):
+        self._owner = owner
+
+    def __len__(self) -> int:
+        return len(self._owner)
+
+    @overload
+    def __getitem__(self, index: int) -> TranscriptEntry: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[TranscriptEntry]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._owner._entry(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("transcript entry index out of range")
+        return self._owner._entry(index)
+
+    def __iter__(self) -> Iterator[TranscriptEntry]:
+        for i in range(len(self)):
+            yield self._owner._entry(i)
+
+
+class ColumnarTranscript(_TranscriptMixin):
+    """Memory-compact transcript stored as columns instead of entry objects.
+
+    Start and end times live in float arrays, speakers are interned into a
+    small table referenced by integer codes, and all segment text shares one
+    string buffer addressed by offsets. Exposes the same to_text/to_markdown/
+    entries surface as Transcript; TranscriptEntry objects are only created
+    when entries are accessed.
+    """
+
+    __slots__ = (
+        "language", "_starts", "_ends", "_codes", "_speakers", "_text", "_offsets", "_index",
+    )
+
+    def __init__(self, language: str | None = None):
+        self.language = language
+        self._starts = array("d")
+        self._ends = array("d")
+        self._codes = array("H")
+        self._speakers: list[str] = []
+        self._text = ""
+        self._offsets = array("Q", [0])
+        self._index: _TimeIndex | None = None
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[tuple[str, str, float, float]],
+        language: str | None = None,
+    ) -> "ColumnarTranscript":
+        """Build from (speaker, text, start_time, end_time) tuples (seconds)."""
+        transcript = cls(language=language)
+        speaker_codes: dict[str, int] = {}
+        chunks: list[str] = []
+        offset = 0
+        for speaker, text, start_time, end_time in rows:
+            code = speaker_codes.get(speaker)
+            if code is None:
+                code = speaker_codes[speaker] = len(transcript._speakers)
+                transcript._speakers.append(speaker)
+                if code > 0xFFFF and transcript._codes.typecode == "H":
+                    transcript._codes = array("I", transcript._codes)
+            transcript._codes.append(code)
+            transcript._starts.append(start_time)
+            transcript._ends.append(end_time)
+            chunks.append(text)
+            offset += len(text)
+            transcript._offsets.append(offset)
+        transcript._text = "".join(chunks)
+        return transcript
+
+    @classmethod
+    def from_trans_result(
+        cls, items: Iterable[dict], language: str | None = None
+    ) -> "ColumnarTranscript":
+        """Build directly from raw API trans_result dicts (times in ms)."""
+        return cls.from_rows(
+            (
+                (
+                    item.get("speaker") or "",
+                    item.get("content") or "",
+                    (item.get("start_time") or 0) / 1000.0,
+                    (item.get("end_time") or 0) / 1000.0,
+                )
+                for item in items
+            ),
+            language=language,
+        )
+
+    @property
+    def entries(self) -> Sequence[TranscriptEntry]:
+        """Entries as a lazy sequence of TranscriptEntry."""
+        return _EntryView(self)
+
+    @property
+    def speakers(self) -> list[str]:
+        """Distinct speaker labels in order of first appearance."""
+        return list(self._speakers)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _entry(self, i: int) -> TranscriptEntry:
+        return TranscriptEntry(
+            speaker=self._speakers[self._codes[i]],
+            text=self._text[self._offsets[i]:self._offsets[i + 1]],
+            start_time=self._starts[i],
+            end_time=self._ends[i],
+        )
+
+    def _row(self, i: int) -> tuple[str, str, float, float]:
+        return (
+            self._speakers[self._codes[i]],
+            self._text[self._offsets[i]:self._offsets[i + 1]],
+            self._starts[i],
+            self._ends[i],
+        )
+
+    def _rows(self) -> Iterator[tuple[str, str, float, float]]:
+        speakers, codes, text, offsets = self._speakers, self._codes, self._text, self._offsets
+        for i in range(len(self._starts)):
+            yield (
+                speakers[codes[i]],
+                text[offsets[i]:offsets[i + 1]],
+                self._starts[i],
+                self._ends[i],
+            )
+
+    def _subset(self, indices: list[int]) -> "ColumnarTranscript":
+        return ColumnarTranscript.from_rows((self._row(i) for i in indices), language=self.language)
+
+    def _time_index(self) -> _TimeIndex:
+        if self._index is None:
+            self._index = _TimeIndex(self._rows())
+        return self._index
+
+    def to_transcript(self) -> Transcript:
+        """Materialize as a regular Transcript model."""
+        return Transcript(entries=list(self.entries), language=self.language)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ColumnarTranscript, Transcript)):
+            return self.language == other.language and list(self._rows()) == list(other._rows())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnarTranscript(entries={len(self)}, speakers={len(self._speakers)}, "
+            f"language={self.language!r})"
+        )
 
-        return "\n".join(lines)
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> core_schema.CoreSchema:
+        # Usable as a pydantic field type; dumps like a regular Transcript.
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda t: t.to_transcript().model_dump()
+            ),
+        )
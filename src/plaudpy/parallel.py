@@ -0,0 +1,164 @@
+"""Multi-core parsing and rendering for large batches of recordings.
+
+Transcript parsing and markdown/subtitle rendering are pure-Python CPU work.
+The helpers here spread it over a process pool (or a thread pool on a
+free-threaded interpreter) in chunks, so each task amortizes its pickling
+cost over many recordings. Small inputs run sequentially.
+"""
+
+import io
+import os
+import sys
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, TypeVar
+
+from .models import FileDetail, Recording
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Inputs shorter than this are processed in the calling thread
+MIN_PARALLEL_ITEMS = 32
+
+# Target number of chunks per worker, to balance load without tiny tasks
+CHUNKS_PER_WORKER = 4
+
+
+def gil_disabled() -> bool:
+    """True on a free-threaded interpreter running without the GIL."""
+    is_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_enabled is not None and not is_enabled()
+
+
+def default_executor(workers: int | None = None) -> Executor:
+    """Create the executor best suited to CPU-bound work on this interpreter.
+
+    A ThreadPoolExecutor when the GIL is disabled (no pickling needed),
+    otherwise a ProcessPoolExecutor. The caller owns and must shut it down.
+    """
+    if gil_disabled():
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _apply_chunk(fn: Callable[[T], R], chunk: Sequence[T]) -> list[R]:
+    return [fn(item) for item in chunk]
+
+
+def parallel_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    executor: Executor | None = None,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    min_items: int = MIN_PARALLEL_ITEMS,
+) -> list[R]:
+    """Apply fn to every item across cores, preserving order.
+
+    Args:
+        fn: Picklable (module-level) function when a process pool is used.
+        items: Work items.
+        executor: Executor to use; left running afterwards. When omitted,
+            default_executor(workers) is created for the call.
+        workers: Worker count for the default executor (defaults to the
+            CPU count). workers=1 forces sequential processing.
+        chunk_size: Items per task. Defaults to splitting the input into
+            about CHUNKS_PER_WORKER chunks per worker.
+        min_items: Inputs shorter than this run sequentially.
+
+    Returns:
+        Results in input order.
+    """
+    items = list(items)
+    if workers == 1 or len(items) < max(min_items, 2):
+        return [fn(item) for item in items]
+
+    n_workers = workers or getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(items) // (n_workers * CHUNKS_PER_WORKER)))
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+    own_executor = executor is None
+    pool = default_executor(workers) if own_executor else executor
+    try:
+        results: list[R] = []
+        for chunk_result in pool.map(partial(_apply_chunk, fn), chunks):
+            results.extend(chunk_result)
+        return results
+    finally:
+        if own_executor:
+            pool.shutdown()
+
+
+def _parse_recording(item: FileDetail | dict, columnar: bool = False) -> Recording:
+    # Only release raw data we parsed ourselves; the caller may still use theirs
+    owned = not isinstance(item, FileDetail)
+    detail = FileDetail.model_validate(item) if owned else item
+    recording = Recording.from_file_detail(detail, columnar=columnar, release=owned)
+    recording.transcript  # parse now, inside the worker
+    return recording
+
+
+def parse_recordings(
+    details: Iterable[FileDetail | dict],
+    columnar: bool = False,
+    executor: Executor | None = None,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+) -> list[Recording]:
+    """Convert file details (models or raw /file/list dicts) to Recordings in parallel.
+
+    Unlike Recording.from_file_detail, transcripts are parsed eagerly, in
+    the workers.
+
+    Args:
+        details: FileDetail objects or raw API dicts.
+        columnar: Build ColumnarTranscript transcripts (cheaper to pickle back).
+        executor, workers, chunk_size: See parallel_map().
+    """
+    return parallel_map(
+        partial(_parse_recording, columnar=columnar),
+        details,
+        executor=executor,
+        workers=workers,
+        chunk_size=chunk_size,
+    )
+
+
+def _render_recording(recording: Recording, format: str, options: dict[str, Any]) -> str:
+    from .export import FORMATS  # deferred: export -> utils -> client imports this module
+
+    _, writer = FORMATS[format]
+    buf = io.StringIO()
+    writer(recording, buf, **options)
+    return buf.getvalue()
+
+
+def render_recordings(
+    recordings: Iterable[Recording],
+    format: str = "markdown",
+    executor: Executor | None = None,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    **options,
+) -> list[str]:
+    """Render recordings to strings in parallel.
+
+    Args:
+        recordings: Recordings to render.
+        format: Any format from plaudpy.export.FORMATS ("markdown", "srt", ...).
+        executor, workers, chunk_size: See parallel_map().
+        **options: Passed to the format's writer.
+    """
+    from .export import check_format  # deferred, see _render_recording
+
+    check_format(format)
+    return parallel_map(
+        partial(_render_recording, format=format, options=options),
+        recordings,
+        executor=executor,
+        workers=workers,
+        chunk_size=chunk_size,
+    )
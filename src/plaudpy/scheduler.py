@@ -0,0 +1,259 @@
+"""Quota-aware batch transcription scheduling."""
+
+import json
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+from pydantic import BaseModel, Field
+
+from . import utils
+from .client import PlaudClient
+from .exceptions import PlaudError
+from .models import FileSimple
+
+
+class TranscriptionPlan(BaseModel):
+    """What a TranscriptionScheduler would do with a set of file IDs."""
+
+    to_submit: list[str] = Field(default_factory=list)
+    already_done: list[str] = Field(default_factory=list)
+    recently_triggered: list[str] = Field(default_factory=list)
+    over_budget: list[str] = Field(default_factory=list)
+    unknown: list[str] = Field(default_factory=list)
+    budget: float | None = None
+    planned_cost: float = 0
+
+
+class TranscriptionRun(TranscriptionPlan):
+    """Outcome of TranscriptionScheduler.run()."""
+
+    submitted: list[str] = Field(default_factory=list)
+    failed: dict[str, str] = Field(default_factory=dict)
+
+
+class TranscriptionScheduler:
+    """Trigger transcription for many files without wasting quota.
+
+    Files already transcribed (or summarized, per the listing's is_trans /
+    is_summary flags) are dropped. The rest are ordered by priority (higher
+    first) and then duration (shorter first), and admitted greedily while
+    their cost fits the remaining transcription quota. Submissions run with
+    bounded concurrency.
+
+    Every trigger is journalled, in memory or, when db_path is given, in
+    the local SQLite store, so a file is not triggered again until
+    retrigger_after has passed, even across processes or restarts.
+
+    Example:
+        with PlaudClient() as client:
+            scheduler = TranscriptionScheduler(client, concurrency=4, db_path="plaud.db")
+            run = scheduler.run(file_ids, priorities={"urgent-id": 10})
+            print(run.submitted, run.over_budget)
+    """
+
+    def __init__(
+        self,
+        client: PlaudClient,
+        concurrency: int = 4,
+        db_path: str | Path | None = None,
+        retrigger_after: timedelta = timedelta(hours=6),
+        cost: Callable[[FileSimple], float] | None = None,
+        **trigger_options,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            client: Authenticated client.
+            concurrency: Maximum simultaneous trigger requests.
+            db_path: Local database for the trigger journal. None keeps the
+                journal in memory only.
+            retrigger_after: How long a triggered file is protected from
+                being triggered again.
+            cost: Quota cost of a file, in the unit of
+                TranscriptionQuota.remaining. Defaults to its listing duration.
+            **trigger_options: Passed to AIAPI.trigger_transcription
+                (language, diarization, llm, ...).
+        """
+        self.client = client
+        self.concurrency = max(1, concurrency)
+        self.db_path = db_path
+        self.retrigger_after = retrigger_after
+        self.cost = cost or (lambda f: f.duration)
+        self.trigger_options = trigger_options
+        self._lock = threading.Lock()
+        self._triggered: dict[str, datetime] = {}
+
+    def _journal(self, file_ids: list[str]) -> dict[str, datetime]:
+        """When each of file_ids was last triggered, if it is journalled."""
+        if self.db_path is None:
+            with self._lock:
+                return {i: self._triggered[i] for i in file_ids if i in self._triggered}
+        conn = utils.get_db(self.db_path)
+        try:
+            return {
+                r["file_id"]: datetime.fromisoformat(r["triggered_at"])
+                for r in conn.execute(
+                    """SELECT file_id, triggered_at FROM transcription_jobs
+                       WHERE file_id IN (SELECT value FROM json_each(?))""",
+                    (json.dumps(file_ids),),
+                )
+            }
+        finally:
+            conn.close()
+
+    def _claim(self, file_ids: list[str], now: datetime) -> list[str]:
+        """Journal a trigger for each file not triggered since the cutoff.
+
+        With a database the claim is a single conditional upsert per file,
+        so schedulers in other processes never trigger the same file twice.
+        """
+        cutoff = now - self.retrigger_after
+        if self.db_path is None:
+            claimed = []
+            with self._lock:
+                for file_id in file_ids:
+                    when = self._triggered.get(file_id)
+                    if when is None or when <= cutoff:
+                        self._triggered[file_id] = now
+                        claimed.append(file_id)
+            return claimed
+
+        conn = utils.get_db(self.db_path)
+        try:
+            with conn:
+                return [
+                    file_id
+                    for file_id in file_ids
+                    if conn.execute(
+                        """INSERT INTO transcription_jobs (file_id, triggered_at)
+                           VALUES (:file_id, :now)
+                           ON CONFLICT(file_id) DO UPDATE SET triggered_at=excluded.triggered_at
+                           WHERE triggered_at <= :cutoff""",
+                        {"file_id": file_id, "now": _timestamp(now),
+                         "cutoff": _timestamp(cutoff)},
+                    ).rowcount == 1
+                ]
+        finally:
+            conn.close()
+
+    def _release(self, file_id: str, now: datetime) -> None:
+        """Forget the claim made at now, so the file can be retried."""
+        if self.db_path is None:
+            with self._lock:
+                if self._triggered.get(file_id) == now:
+                    del self._triggered[file_id]
+            return
+        conn = utils.get_db(self.db_path)
+        try:
+            with conn:
+                conn.execute(
+                    "DELETE FROM transcription_jobs WHERE file_id = ? AND triggered_at = ?",
+                    (file_id, _timestamp(now)),
+                )
+        finally:
+            conn.close()
+
+    def plan(
+        self,
+        file_ids: Iterable[str],
+        priorities: dict[str, int] | None = None,
+        budget: float | None = None,
+        listing: list[FileSimple] | None = None,
+    ) -> TranscriptionPlan:
+        """Decide which files to trigger, without sending anything.
+
+        Args:
+            file_ids: Candidate file IDs.
+            priorities: Optional file ID -> priority (default 0, higher first).
+            budget: Quota to plan against. Defaults to the account's
+                remaining transcription quota (unlimited if not reported).
+            listing: Listing to check against, to avoid fetching it again.
+        """
+        priorities = priorities or {}
+        if listing is None:
+            listing = self.client.files.list_simple()
+        by_id = {f.id: f for f in listing}
+        if budget is None:
+            budget = self.client.users.get_transcription_quota().remaining
+
+        plan = TranscriptionPlan(budget=budget)
+        cutoff = datetime.now(timezone.utc) - self.retrigger_after
+        file_ids = list(dict.fromkeys(file_ids))
+        journal = self._journal(file_ids)
+        candidates: list[FileSimple] = []
+        for file_id in file_ids:
+            f = by_id.get(file_id)
+            if f is None:
+                plan.unknown.append(file_id)
+            elif f.is_trans or f.is_summary:
+                plan.already_done.append(file_id)
+            elif file_id in journal and journal[file_id] > cutoff:
+                plan.recently_triggered.append(file_id)
+            else:
+                candidates.append(f)
+
+        candidates.sort(key=lambda f: (-priorities.get(f.id, 0), self.cost(f)))
+        remaining = budget
+        for f in candidates:
+            cost = self.cost(f)
+            if remaining is not None and cost > remaining:
+                plan.over_budget.append(f.id)
+                continue
+            plan.to_submit.append(f.id)
+            plan.planned_cost += cost
+            if remaining is not None:
+                remaining -= cost
+        return plan
+
+    def run(
+        self,
+        file_ids: Iterable[str],
+        priorities: dict[str, int] | None = None,
+        budget: float | None = None,
+        listing: list[FileSimple] | None = None,
+    ) -> TranscriptionRun:
+        """Plan and submit transcription triggers.
+
+        Arguments are the same as plan(). A failed trigger is removed from
+        the journal so it can be retried.
+        """
+        if listing is None:
+            listing = self.client.files.list_simple()
+        plan = self.plan(file_ids, priorities=priorities, budget=budget, listing=listing)
+        run = TranscriptionRun(**plan.model_dump())
+
+        # Claim IDs before sending so concurrent runs never double-trigger;
+        # IDs another run claimed first are moved out of to_submit
+        now = datetime.now(timezone.utc)
+        claimed = self._claim(plan.to_submit, now)
+        order = {file_id: i for i, file_id in enumerate(claimed)}
+        lost = [i for i in plan.to_submit if i not in order]
+        if lost:
+            by_id = {f.id: f for f in listing}
+            run.to_submit = claimed
+            run.recently_triggered.extend(lost)
+            run.planned_cost -= sum(self.cost(by_id[i]) for i in lost)
+
+        def trigger(file_id: str) -> None:
+            try:
+                self.client.ai.trigger_transcription(file_id, **self.trigger_options)
+            except (PlaudError, httpx.HTTPError) as e:
+                self._release(file_id, now)
+                run.failed[file_id] = str(e)
+            else:
+                run.submitted.append(file_id)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            list(pool.map(trigger, claimed))
+
+        run.submitted.sort(key=order.__getitem__)
+        return run
+
+
+def _timestamp(when: datetime) -> str:
+    # Fixed precision, so journal timestamps compare correctly as text
+    return when.isoformat(timespec="microseconds")
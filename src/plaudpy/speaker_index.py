@@ -0,0 +1,207 @@
+"""Local speaker-embedding index for matching speakers across recordings.
+
+Embeddings (from AIAPI.extract_speaker_embedding) are stored L2-normalized
+in a memory-mapped .npy file, so cosine similarity is a single matrix
+product and opening an index does not read it into memory. Labels live in
+a JSON file next to it.
+
+Requires NumPy (``pip install plaudpy[analytics]``).
+"""
+
+import json
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .analytics import require_numpy
+from .export import write_atomic
+from .models import Speaker
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .api.ai import AIAPI
+
+VECTORS_NAME = "vectors.npy"
+LABELS_NAME = "labels.json"
+
+# Rows allocated when an index is created; capacity doubles when full
+INITIAL_CAPACITY = 256
+
+
+def embedding_from_response(data: Any) -> list[float]:
+    """Pull the embedding vector out of an extract_speaker_embedding response."""
+    if isinstance(data, dict):
+        for key in ("embedding", "speaker_embedding", "vector"):
+            if key in data:
+                return embedding_from_response(data[key])
+        if "data" in data:
+            return embedding_from_response(data["data"])
+    if isinstance(data, list) and data and all(isinstance(x, (int, float)) for x in data):
+        return data
+    raise ValueError("No embedding found in speaker-embedding response")
+
+
+def extract_embeddings(
+    ai: "AIAPI", clips: Iterable[dict], workers: int = 4
+) -> "np.ndarray":
+    """Extract embeddings for many clips concurrently.
+
+    Args:
+        ai: AI API of an authenticated client.
+        clips: Keyword arguments for each extract_speaker_embedding call
+            (e.g. file_id, start/end of the clip).
+        workers: Maximum simultaneous requests.
+
+    Returns:
+        float32 array of shape (len(clips), dim), in input order.
+    """
+    np = require_numpy()
+
+    def extract(clip: dict) -> list[float]:
+        return embedding_from_response(ai.extract_speaker_embedding(**clip))
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        vectors = list(pool.map(extract, clips))
+    return np.asarray(vectors, dtype=np.float32)
+
+
+class SpeakerIndex:
+    """On-disk, memory-mapped index of labelled speaker embeddings.
+
+    Example:
+        index = SpeakerIndex("speakers.idx")
+        index.add(extract_embeddings(client.ai, profile_clips), [{"speaker_id": ..., "name": ...}])
+        matches = index.match(extract_embeddings(client.ai, new_clips), threshold=0.75)
+    """
+
+    def __init__(self, path: str | Path):
+        """Open (or prepare to create) the index in directory path."""
+        self.path = Path(path)
+        self._vectors: "np.ndarray | None" = None
+        self.labels: list[dict] = []
+        if (self.path / VECTORS_NAME).exists():
+            np = require_numpy()
+            self._vectors = np.load(self.path / VECTORS_NAME, mmap_mode="r+")
+            self.labels = json.loads((self.path / LABELS_NAME).read_text(encoding="utf-8"))
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @property
+    def dim(self) -> int | None:
+        """Embedding dimension, or None for an empty new index."""
+        return None if self._vectors is None else self._vectors.shape[1]
+
+    @property
+    def vectors(self) -> "np.ndarray":
+        """The stored (normalized) embeddings, as a view of the mapped file."""
+        if self._vectors is None:
+            np = require_numpy()
+            return np.empty((0, 0), dtype=np.float32)
+        return self._vectors[: len(self.labels)]
+
+    def _normalize(self, embeddings: "np.ndarray | Sequence") -> "np.ndarray":
+        np = require_numpy()
+        vectors = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        if self.dim is not None and vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected embeddings of dimension {self.dim}, got {vectors.shape[1]}")
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def _reserve(self, rows: int, dim: int) -> None:
+        """Make room for rows more vectors, growing the mapped file if needed."""
+        np = require_numpy()
+        needed = len(self.labels) + rows
+        if self._vectors is not None and needed <= len(self._vectors):
+            return
+        capacity = max(INITIAL_CAPACITY, len(self._vectors) if self._vectors is not None else 0)
+        while capacity < needed:
+            capacity *= 2
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp = self.path / f".{VECTORS_NAME}.tmp"
+        grown = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float32, shape=(capacity, dim))
+        if self._vectors is not None:
+            grown[: len(self.labels)] = self.vectors
+        grown.flush()
+        del grown
+        self._vectors = None
+        tmp.replace(self.path / VECTORS_NAME)
+        self._vectors = np.load(self.path / VECTORS_NAME, mmap_mode="r+")
+
+    def add(self, embeddings: "np.ndarray | Sequence", labels: Sequence[dict]) -> None:
+        """Insert embeddings with their labels and persist them.
+
+        Args:
+            embeddings: Array of shape (n, dim) (or a single vector).
+            labels: One dict per embedding, e.g. {"speaker_id", "name",
+                "file_id"}; stored as JSON.
+        """
+        vectors = self._normalize(embeddings)
+        if len(vectors) != len(labels):
+            raise ValueError(f"Got {len(vectors)} embeddings but {len(labels)} labels")
+        if not len(vectors):
+            return
+        self._reserve(len(vectors), vectors.shape[1])
+        start = len(self.labels)
+        self._vectors[start:start + len(vectors)] = vectors
+        self._vectors.flush()
+        self.labels.extend(dict(label) for label in labels)
+        write_atomic(self.path / LABELS_NAME, lambda fp: json.dump(self.labels, fp))
+
+    def add_profiles(self, speakers: Sequence[Speaker], embeddings: "np.ndarray | Sequence") -> None:
+        """Insert one embedding per SpeakersAPI profile, labelled with its id and name."""
+        self.add(embeddings, [{"speaker_id": s.id, "name": s.name} for s in speakers])
+
+    def search(
+        self, queries: "np.ndarray | Sequence", k: int = 5
+    ) -> list[list[tuple[dict, float]]]:
+        """Cosine top-k lookup for one or more query embeddings.
+
+        Returns:
+            For each query, up to k (label, similarity) pairs, best first.
+        """
+        np = require_numpy()
+        if not self.labels:
+            return [[] for _ in np.atleast_2d(np.asarray(queries))]
+        q = self._normalize(queries)
+        scores = q @ self.vectors.T
+        k = min(k, scores.shape[1])
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        results = []
+        for row, candidates in zip(scores, top):
+            ordered = candidates[np.argsort(-row[candidates], kind="stable")]
+            results.append([(self.labels[i], float(row[i])) for i in ordered])
+        return results
+
+    def match(
+        self,
+        queries: "np.ndarray | Sequence",
+        threshold: float = 0.7,
+        speakers: Sequence[Speaker] | None = None,
+    ) -> list[dict | None]:
+        """Best-matching speaker label for each query, or None below threshold.
+
+        Args:
+            queries: Embeddings of unknown speakers (e.g. "Speaker 2" clips).
+            threshold: Minimum cosine similarity to accept a match.
+            speakers: Current SpeakersAPI.list_speakers() profiles; when
+                given, only entries whose speaker_id is among them match.
+        """
+        np = require_numpy()
+        n_queries = len(np.atleast_2d(np.asarray(queries)))
+        if not self.labels:
+            return [None] * n_queries
+        scores = self._normalize(queries) @ self.vectors.T
+        if speakers is not None:
+            allowed = {s.id for s in speakers}
+            live = np.fromiter(
+                (label.get("speaker_id") in allowed for label in self.labels), bool, len(self.labels)
+            )
+            scores[:, ~live] = -np.inf
+        best = scores.argmax(axis=1)
+        return [
+            {**self.labels[i], "score": float(row[i])} if row[i] >= threshold else None
+            for row, i in zip(scores, best)
+        ]
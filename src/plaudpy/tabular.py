@@ -0,0 +1,251 @@
+"""Columnar export of the local recordings store (NumPy, Arrow, Parquet).
+
+Rows are streamed from SQLite in batches as plain tuples and turned into
+columns per batch, skipping the per-row dicts of the query helpers. The
+column set and types follow the `recordings` table (see utils._SCHEMA).
+
+Requires NumPy (``pip install plaudpy[analytics]``) for the NumPy helpers
+and PyArrow (``pip install plaudpy[arrow]``) for Arrow and Parquet.
+"""
+
+import sqlite3
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from . import utils
+from .analytics import require_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
+# Rows fetched from SQLite per batch
+BATCH_SIZE = 65_536
+
+# Value stored for NULL in INTEGER columns of NumPy arrays (hour, weekday, ...)
+INT_NULL = -1
+
+# Parquet partition name for recordings without a local date (Hive convention)
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Arrow/Parquet export requires PyArrow; install it with `pip install plaudpy[arrow]`"
+        ) from e
+    return pyarrow
+
+
+def recording_columns(conn: sqlite3.Connection) -> list[tuple[str, str]]:
+    """(name, declared SQLite type) of each recordings column, in table order."""
+    return [(r[1], (r[2] or "").upper()) for r in conn.execute("PRAGMA table_info(recordings)")]
+
+
+def _schema(conn: sqlite3.Connection, columns: Sequence[str] | None) -> list[tuple[str, str]]:
+    schema = recording_columns(conn)
+    if columns is None:
+        return schema
+    known = dict(schema)
+    unknown = [c for c in columns if c not in known]
+    if unknown:
+        raise ValueError(f"Unknown recordings columns {unknown}; expected some of {list(known)}")
+    return [(c, known[c]) for c in columns]
+
+
+def _select(
+    conn: sqlite3.Connection,
+    schema: Sequence[tuple[str, str]],
+    order_by: str = "start_time_ms, id",
+    key: str | None = None,
+) -> sqlite3.Cursor:
+    """Cursor over schema's columns as plain tuples, with key (an SQL expression) last if given."""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    names = ", ".join([name for name, _ in schema] + ([key] if key else []))
+    return cursor.execute(f"SELECT {names} FROM recordings ORDER BY {order_by}")
+
+
+# --- NumPy ---
+
+
+def numpy_dtype(schema: Sequence[tuple[str, str]]) -> "np.dtype":
+    """Structured dtype for recordings columns (INTEGER -> int64, REAL -> float64, TEXT -> object)."""
+    np = require_numpy()
+    kinds = {"INTEGER": np.int64, "REAL": np.float64}
+    return np.dtype([(name, kinds.get(decl, object)) for name, decl in schema])
+
+
+def iter_numpy_batches(
+    db_path: str | Path | None = None,
+    columns: Sequence[str] | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> Iterator["np.ndarray"]:
+    """Stream the recordings table as NumPy structured arrays.
+
+    NULLs become INT_NULL in integer columns, NaN in REAL columns and None
+    in text columns. Rows are ordered by start time.
+
+    Args:
+        db_path: Path to the database file.
+        columns: Subset of recordings columns (default: all).
+        batch_size: Rows per yielded array.
+    """
+    np = require_numpy()
+    conn = utils.get_db(db_path)
+    try:
+        schema = _schema(conn, columns)
+        cursor = _select(conn, schema)
+        dtype = numpy_dtype(schema)
+        fills = [
+            INT_NULL if decl == "INTEGER" else float("nan") if decl == "REAL" else None
+            for _, decl in schema
+        ]
+        while rows := cursor.fetchmany(batch_size):
+            rows = [
+                tuple(fill if v is None else v for v, fill in zip(row, fills)) if None in row else row
+                for row in rows
+            ]
+            yield np.array(rows, dtype=dtype)
+    finally:
+        conn.close()
+
+
+def to_numpy(
+    db_path: str | Path | None = None,
+    columns: Sequence[str] | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> "np.ndarray":
+    """The whole recordings table as one NumPy structured array (see iter_numpy_batches)."""
+    np = require_numpy()
+    batches = list(iter_numpy_batches(db_path, columns=columns, batch_size=batch_size))
+    if batches:
+        return np.concatenate(batches)
+    conn = utils.get_db(db_path)
+    try:
+        return np.empty(0, dtype=numpy_dtype(_schema(conn, columns)))
+    finally:
+        conn.close()
+
+
+# --- Arrow / Parquet ---
+
+
+def arrow_schema(schema: Sequence[tuple[str, str]]) -> "pa.Schema":
+    """Arrow schema for recordings columns (INTEGER -> int64, REAL -> float64, TEXT -> string)."""
+    pa = _pyarrow()
+    kinds = {"INTEGER": pa.int64(), "REAL": pa.float64()}
+    return pa.schema([(name, kinds.get(decl, pa.string())) for name, decl in schema])
+
+
+def _record_batch(rows: Sequence[tuple], schema: "pa.Schema") -> "pa.RecordBatch":
+    """Transpose row tuples into one typed Arrow array per column."""
+    pa = _pyarrow()
+    columns = zip(*rows) if rows else [()] * len(schema)
+    return pa.RecordBatch.from_arrays(
+        [pa.array(values, type=field.type) for values, field in zip(columns, schema)], schema=schema
+    )
+
+
+def iter_arrow_batches(
+    db_path: str | Path | None = None,
+    columns: Sequence[str] | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> Iterator["pa.RecordBatch"]:
+    """Stream the recordings table as Arrow record batches (NULLs preserved)."""
+    conn = utils.get_db(db_path)
+    try:
+        schema = _schema(conn, columns)
+        cursor = _select(conn, schema)
+        arrow = arrow_schema(schema)
+        while rows := cursor.fetchmany(batch_size):
+            yield _record_batch(rows, arrow)
+    finally:
+        conn.close()
+
+
+def to_arrow(
+    db_path: str | Path | None = None,
+    columns: Sequence[str] | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> "pa.Table":
+    """The whole recordings table as an Arrow table (pandas: .to_pandas())."""
+    pa = _pyarrow()
+    conn = utils.get_db(db_path)
+    try:
+        schema = arrow_schema(_schema(conn, columns))
+    finally:
+        conn.close()
+    return pa.Table.from_batches(
+        iter_arrow_batches(db_path, columns=columns, batch_size=batch_size), schema=schema
+    )
+
+
+def write_parquet(
+    dest: str | Path,
+    db_path: str | Path | None = None,
+    columns: Sequence[str] | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> list[Path]:
+    """Write the recordings table as Parquet, partitioned by local month.
+
+    Produces dest/month=YYYY-MM/part-0.parquet (Hive layout, readable by
+    pyarrow.dataset, pandas, DuckDB, Spark); recordings without a local
+    date go to month=__HIVE_DEFAULT_PARTITION__. Batches are streamed
+    straight into one writer per month, so memory stays bounded by
+    batch_size. Partition files from a previous run are replaced, and
+    months that no longer have recordings are removed.
+
+    Returns:
+        Paths of the written files, in month order.
+    """
+    pa = _pyarrow()
+    dest = Path(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+    previous = set(dest.glob("month=*/part-0.parquet"))
+
+    conn = utils.get_db(db_path)
+    try:
+        schema = _schema(conn, columns)
+        arrow = arrow_schema(schema)
+        month = "substr(local_datetime, 1, 7)"
+        # The partition key rides along as an extra last column
+        cursor = _select(
+            conn, schema, order_by=f"local_datetime IS NULL, {month}, start_time_ms, id", key=month
+        )
+        written: list[Path] = []
+        writer = None
+        current = object()
+        try:
+            while rows := cursor.fetchmany(batch_size):
+                start = 0
+                while start < len(rows):
+                    key = rows[start][-1]
+                    end = start + 1
+                    while end < len(rows) and rows[end][-1] == key:
+                        end += 1
+                    if key != current:
+                        if writer is not None:
+                            writer.close()
+                        part = dest / f"month={key or NULL_PARTITION}" / "part-0.parquet"
+                        part.parent.mkdir(exist_ok=True)
+                        writer = pa.parquet.ParquetWriter(part, arrow)
+                        written.append(part)
+                        current = key
+                    writer.write_batch(_record_batch([row[:-1] for row in rows[start:end]], arrow))
+                    start = end
+        finally:
+            if writer is not None:
+                writer.close()
+    finally:
+        conn.close()
+
+    for stale in previous - set(written):
+        stale.unlink()
+        if not any(stale.parent.iterdir()):
+            stale.parent.rmdir()
+    return written
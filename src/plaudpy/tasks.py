@@ -0,0 +1,209 @@
+"""Shared background polling of AI task status.
+
+Instead of every caller running its own sleep loop against
+/ai/file-task-status, one TaskPoller per client polls on behalf of all
+waiters and resolves a future per file ID. The polling interval starts
+short, grows while nothing changes and resets when a task finishes or a
+new file is waited on.
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from .exceptions import APIError, AuthenticationError, PlaudError
+from .models import TaskStatus
+
+if TYPE_CHECKING:
+    from .api.ai import AIAPI
+    from .api.files import FilesAPI
+
+logger = logging.getLogger(__name__)
+
+SUCCESS_STATUSES = frozenset({"success", "succeeded", "done", "complete", "completed", "finished"})
+FAILED_STATUSES = frozenset({"failed", "failure", "error", "cancelled", "canceled"})
+
+
+def is_terminal(status: TaskStatus) -> bool:
+    """True if the task has finished, successfully or not."""
+    value = str(status.status or "").lower()
+    return value in SUCCESS_STATUSES or value in FAILED_STATUSES
+
+
+def parse_task_statuses(payload: Any) -> dict[str, TaskStatus]:
+    """Extract per-file statuses from a task-status response.
+
+    Accepts a list of task dicts, a dict keyed by file ID, or either one
+    wrapped in a "data" envelope. Tasks without a file ID are ignored.
+    """
+    if isinstance(payload, dict) and "data" in payload:
+        payload = payload["data"]
+    if isinstance(payload, dict):
+        items = [
+            {"file_id": key, **value} if isinstance(value, dict) else {"file_id": key, "status": value}
+            for key, value in payload.items()
+        ]
+    elif isinstance(payload, list):
+        items = [item for item in payload if isinstance(item, dict)]
+    else:
+        return {}
+
+    statuses: dict[str, TaskStatus] = {}
+    for item in items:
+        file_id = item.get("file_id") or item.get("fileId") or item.get("id")
+        if not file_id:
+            continue
+        status = item.get("status", item.get("task_status", item.get("state")))
+        statuses[str(file_id)] = TaskStatus.model_validate(
+            {**item, "file_id": str(file_id), "status": None if status is None else str(status)}
+        )
+    return statuses
+
+
+class TaskPoller:
+    """One polling loop serving every waiter on a client.
+
+    The loop runs in a daemon thread only while there are pending files.
+    Each round makes a single /ai/file-task-status request for all of them.
+    Files the endpoint no longer reports are confirmed against the file
+    listing (is_trans / is_summary) every confirm_every rounds, when a
+    FilesAPI is available.
+
+    Futures resolve to the final TaskStatus; failed tasks resolve too,
+    with a status in FAILED_STATUSES. Polling errors are retried with
+    backoff, but after max_failures in a row, or on an authentication
+    error, every pending future is failed with the error instead.
+    """
+
+    def __init__(
+        self,
+        ai: "AIAPI",
+        files: "FilesAPI | None" = None,
+        min_interval: float = 2.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        confirm_every: int = 5,
+        max_failures: int = 5,
+    ):
+        self.ai = ai
+        self.files = files
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.confirm_every = confirm_every
+        self.max_failures = max_failures
+        self.interval = min_interval
+        self._futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def pending(self) -> list[str]:
+        """File IDs still being waited on."""
+        with self._lock:
+            return list(self._futures)
+
+    def watch(self, file_id: str) -> Future:
+        """Return the shared future for a file, starting the loop if needed."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("TaskPoller is closed")
+            future = self._futures.get(file_id)
+            if future is None:
+                future = self._futures[file_id] = Future()
+                self.interval = self.min_interval
+                self._wake.set()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="plaudpy-task-poller", daemon=True
+                )
+                self._thread.start()
+            return future
+
+    def wait_for(self, file_id: str, timeout: float | None = None) -> TaskStatus:
+        """Block until the file's task finishes.
+
+        Raises:
+            concurrent.futures.TimeoutError: If timeout elapses first. The
+                file stays watched for other waiters.
+            PlaudError: If polling keeps failing or the session expired.
+        """
+        return self.watch(file_id).result(timeout=timeout)
+
+    async def completions(self, file_ids: Iterable[str]) -> AsyncIterator[TaskStatus]:
+        """Yield each file's final TaskStatus as soon as it finishes."""
+        waiters = [asyncio.wrap_future(self.watch(file_id)) for file_id in dict.fromkeys(file_ids)]
+        for next_done in asyncio.as_completed(waiters):
+            yield await next_done
+
+    def close(self) -> None:
+        """Stop polling and cancel every pending future."""
+        with self._lock:
+            self._closed = True
+            futures, self._futures = self._futures, {}
+        self._wake.set()
+        for future in futures.values():
+            future.cancel()
+
+    def _fail_pending(self, error: BaseException) -> None:
+        with self._lock:
+            futures, self._futures = self._futures, {}
+        for future in futures.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def poll_once(self, confirm: bool = False) -> int:
+        """Run one polling round; returns the number of futures resolved."""
+        pending = set(self.pending)
+        if not pending:
+            return 0
+        statuses = parse_task_statuses(self.ai.get_file_task_status())
+        finished = {fid: s for fid, s in statuses.items() if fid in pending and is_terminal(s)}
+
+        unreported = pending - statuses.keys()
+        if confirm and unreported and self.files is not None:
+            for f in self.files.list_simple():
+                if f.id in unreported and (f.is_trans or f.is_summary):
+                    finished[f.id] = TaskStatus(file_id=f.id, status="success", progress=1.0)
+
+        for file_id, status in finished.items():
+            with self._lock:
+                future = self._futures.pop(file_id, None)
+            if future is not None and not future.done():
+                future.set_result(status)
+        return len(finished)
+
+    def _run(self) -> None:
+        rounds = 0
+        failures = 0
+        while True:
+            with self._lock:
+                if self._closed or not self._futures:
+                    self._thread = None
+                    return
+            self._wake.clear()
+            rounds += 1
+            try:
+                resolved = self.poll_once(confirm=rounds % self.confirm_every == 0)
+            except (PlaudError, httpx.HTTPError) as e:
+                failures += 1
+                logger.warning("Task status poll failed (%d in a row): %s", failures, e)
+                if failures >= self.max_failures or isinstance(e, AuthenticationError) or (
+                    isinstance(e, APIError) and e.status_code == 401
+                ):
+                    self._fail_pending(e)
+                resolved = 0
+            else:
+                failures = 0
+            if resolved:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.interval * self.backoff, self.max_interval)
+            self._wake.wait(self.interval)
@@ -4,12 +4,17 @@ Functions here are added on-demand as needed during sessions.
 Each function should be self-contained and well-documented.
 """
 
+import hashlib
+import json
 import sqlite3
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, tzinfo
 from pathlib import Path
 
 from .client import PlaudClient
-from .models import FileSimple
+from .exceptions import APIError, ConfigurationError
+from .models import FileDetail, FileSimple, FileTag, Recording, Transcript, TranscriptEntry
 
 DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / "plaud_data.db"
 
@@ -25,6 +30,7 @@ CREATE TABLE IF NOT EXISTS recordings (
     weekday_name    TEXT,
     is_working_hours INTEGER DEFAULT 0,
     directory       TEXT,
+    is_trash        INTEGER NOT NULL DEFAULT 0,
     synced_at       TEXT NOT NULL
 );
 
@@ -33,12 +39,263 @@ CREATE TABLE IF NOT EXISTS sync_log (
     synced_at   TEXT NOT NULL,
     total_files INTEGER NOT NULL
 );
+
+-- Detail store, filled by sync_recordings(details=True)
+CREATE TABLE IF NOT EXISTS recording_details (
+    id              TEXT PRIMARY KEY,
+    listing_sig     TEXT NOT NULL,   -- edit_time:is_trans:is_summary from the listing
+    content_hash    TEXT NOT NULL,   -- sha256 of trans_result + ai_content
+    language        TEXT,
+    fetched_at      TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS transcript_segments (
+    id              INTEGER PRIMARY KEY,
+    recording_id    TEXT NOT NULL,
+    seq             INTEGER NOT NULL,
+    speaker         TEXT NOT NULL DEFAULT '',
+    content         TEXT NOT NULL DEFAULT '',
+    start_ms        INTEGER NOT NULL DEFAULT 0,
+    end_ms          INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (recording_id, seq)
+);
+
+CREATE TABLE IF NOT EXISTS summaries (
+    recording_id    TEXT PRIMARY KEY,
+    content         TEXT NOT NULL
+);
+
+-- Tag membership as reported by the listing (filetag_id_list)
+CREATE TABLE IF NOT EXISTS recording_tags (
+    tag_id          TEXT NOT NULL,
+    recording_id    TEXT NOT NULL,
+    PRIMARY KEY (tag_id, recording_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_recording_tags_recording ON recording_tags (recording_id);
+
+-- Cached Plaud tag definitions, for resolving tag names without an API call
+CREATE TABLE IF NOT EXISTS tags (
+    id              TEXT PRIMARY KEY,
+    name            TEXT NOT NULL,
+    color           TEXT,
+    synced_at       TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_tags_name ON tags (name);
+
+-- Per-recording speaker metrics, filled by plaudpy.analytics.analyze_library()
+CREATE TABLE IF NOT EXISTS speaker_stats (
+    recording_id        TEXT NOT NULL,
+    speaker             TEXT NOT NULL,
+    talk_time           REAL NOT NULL,   -- seconds
+    segments            INTEGER NOT NULL,
+    turns               INTEGER NOT NULL,
+    interruptions       INTEGER NOT NULL,
+    longest_monologue   REAL NOT NULL,   -- seconds
+    content_hash        TEXT NOT NULL,   -- recording_details.content_hash analysed
+    PRIMARY KEY (recording_id, speaker)
+) WITHOUT ROWID;
+
+-- Transcription triggers sent by plaudpy.scheduler.TranscriptionScheduler
+CREATE TABLE IF NOT EXISTS transcription_jobs (
+    file_id         TEXT PRIMARY KEY,
+    triggered_at    TEXT NOT NULL
+);
+
+-- Raw /file/simple/web entries, so the listing can be served from the store
+CREATE TABLE IF NOT EXISTS listing_entries (
+    id              TEXT PRIMARY KEY,
+    payload         TEXT NOT NULL    -- FileSimple JSON
+);
+
+-- Writes queued by plaudpy.cached.CachedPlaudClient while the API was unreachable
+CREATE TABLE IF NOT EXISTS pending_writes (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    api             TEXT NOT NULL,   -- "files" or "tags"
+    method          TEXT NOT NULL,
+    args            TEXT NOT NULL,   -- JSON [args, kwargs]
+    queued_at       TEXT NOT NULL,
+    error           TEXT             -- set when the API rejected the write
+);
+"""
+
+# Full-text index over filenames, transcript segments and summaries. These are
+# external-content FTS5 tables kept in step by triggers, so every write to the
+# source tables (including sync_recordings upserts) updates the index in place.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS titles_fts USING fts5(
+    filename, content='recordings', content_rowid='rowid'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5(
+    content, content='transcript_segments', content_rowid='id'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS summaries_fts USING fts5(
+    content, content='summaries', content_rowid='rowid'
+);
+
+CREATE TRIGGER IF NOT EXISTS recordings_fts_ai AFTER INSERT ON recordings BEGIN
+    INSERT INTO titles_fts(rowid, filename) VALUES (new.rowid, new.filename);
+END;
+CREATE TRIGGER IF NOT EXISTS recordings_fts_ad AFTER DELETE ON recordings BEGIN
+    INSERT INTO titles_fts(titles_fts, rowid, filename) VALUES ('delete', old.rowid, old.filename);
+END;
+CREATE TRIGGER IF NOT EXISTS recordings_fts_au AFTER UPDATE OF filename ON recordings
+WHEN old.filename IS NOT new.filename BEGIN
+    INSERT INTO titles_fts(titles_fts, rowid, filename) VALUES ('delete', old.rowid, old.filename);
+    INSERT INTO titles_fts(rowid, filename) VALUES (new.rowid, new.filename);
+END;
+
+CREATE TRIGGER IF NOT EXISTS segments_fts_ai AFTER INSERT ON transcript_segments BEGIN
+    INSERT INTO segments_fts(rowid, content) VALUES (new.id, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS segments_fts_ad AFTER DELETE ON transcript_segments BEGIN
+    INSERT INTO segments_fts(segments_fts, rowid, content) VALUES ('delete', old.id, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS segments_fts_au AFTER UPDATE OF content ON transcript_segments BEGIN
+    INSERT INTO segments_fts(segments_fts, rowid, content) VALUES ('delete', old.id, old.content);
+    INSERT INTO segments_fts(rowid, content) VALUES (new.id, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS summaries_fts_ai AFTER INSERT ON summaries BEGIN
+    INSERT INTO summaries_fts(rowid, content) VALUES (new.rowid, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS summaries_fts_ad AFTER DELETE ON summaries BEGIN
+    INSERT INTO summaries_fts(summaries_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS summaries_fts_au AFTER UPDATE OF content ON summaries BEGIN
+    INSERT INTO summaries_fts(summaries_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+    INSERT INTO summaries_fts(rowid, content) VALUES (new.rowid, new.content);
+END;
+
+INSERT INTO titles_fts(titles_fts) VALUES ('rebuild');
+INSERT INTO segments_fts(segments_fts) VALUES ('rebuild');
+INSERT INTO summaries_fts(summaries_fts) VALUES ('rebuild');
+"""
+
+# Rollups of recording count and total duration, kept exact by triggers on
+# recordings so every write (sync_recordings upserts, directory assignment,
+# recompute_local_fields) updates them in the same transaction. Time buckets
+# use the local date: 'day' YYYY-MM-DD, 'week' the Monday's date, 'month' YYYY-MM.
+_ROLLUP_TABLES = """
+CREATE TABLE IF NOT EXISTS rollup_time (
+    grain           TEXT NOT NULL,   -- 'day' | 'week' | 'month'
+    bucket          TEXT NOT NULL,
+    count           INTEGER NOT NULL,
+    total_duration  INTEGER NOT NULL,
+    PRIMARY KEY (grain, bucket)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS rollup_hour_weekday (
+    hour            INTEGER NOT NULL,
+    weekday         INTEGER NOT NULL,
+    count           INTEGER NOT NULL,
+    total_duration  INTEGER NOT NULL,
+    PRIMARY KEY (hour, weekday)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS rollup_directory (
+    directory       TEXT PRIMARY KEY,   -- '' for unassigned
+    count           INTEGER NOT NULL,
+    total_duration  INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+_ROLLUP_GRAINS = {
+    "day": "substr({r}.local_datetime, 1, 10)",
+    "week": "date(substr({r}.local_datetime, 1, 10), '-' || {r}.weekday || ' days')",
+    "month": "substr({r}.local_datetime, 1, 7)",
+}
+
+
+def _rollup_statements(r: str, sign: int) -> str:
+    """Trigger statements adding (sign=1) or removing (sign=-1) row r from the rollups."""
+    stmts = []
+    for grain, bucket in _ROLLUP_GRAINS.items():
+        stmts.append(
+            f"""INSERT INTO rollup_time (grain, bucket, count, total_duration)
+                SELECT '{grain}', {bucket.format(r=r)}, {sign}, {sign} * {r}.duration
+                WHERE {r}.local_datetime IS NOT NULL
+                ON CONFLICT (grain, bucket) DO UPDATE SET
+                    count = count + excluded.count,
+                    total_duration = total_duration + excluded.total_duration;"""
+        )
+    stmts.append(
+        f"""INSERT INTO rollup_hour_weekday (hour, weekday, count, total_duration)
+            SELECT {r}.hour, {r}.weekday, {sign}, {sign} * {r}.duration
+            WHERE {r}.hour IS NOT NULL AND {r}.weekday IS NOT NULL
+            ON CONFLICT (hour, weekday) DO UPDATE SET
+                count = count + excluded.count,
+                total_duration = total_duration + excluded.total_duration;"""
+    )
+    stmts.append(
+        f"""INSERT INTO rollup_directory (directory, count, total_duration)
+            SELECT COALESCE({r}.directory, ''), {sign}, {sign} * {r}.duration WHERE 1
+            ON CONFLICT (directory) DO UPDATE SET
+                count = count + excluded.count,
+                total_duration = total_duration + excluded.total_duration;"""
+    )
+    if sign < 0:
+        stmts.extend(
+            f"DELETE FROM rollup_time WHERE grain = '{grain}' AND bucket = {bucket.format(r=r)} AND count = 0;"
+            for grain, bucket in _ROLLUP_GRAINS.items()
+        )
+        stmts.append(
+            f"DELETE FROM rollup_hour_weekday WHERE hour = {r}.hour AND weekday = {r}.weekday AND count = 0;"
+        )
+        stmts.append(
+            f"DELETE FROM rollup_directory WHERE directory = COALESCE({r}.directory, '') AND count = 0;"
+        )
+    return "\n    ".join(stmts)
+
+
+_ROLLUP_TRIGGERS = f"""
+CREATE TRIGGER IF NOT EXISTS recordings_rollup_ai AFTER INSERT ON recordings BEGIN
+    {_rollup_statements("new", 1)}
+END;
+CREATE TRIGGER IF NOT EXISTS recordings_rollup_ad AFTER DELETE ON recordings BEGIN
+    {_rollup_statements("old", -1)}
+END;
+CREATE TRIGGER IF NOT EXISTS recordings_rollup_au
+AFTER UPDATE OF duration, local_datetime, hour, weekday, directory ON recordings
+WHEN old.duration IS NOT new.duration
+  OR old.local_datetime IS NOT new.local_datetime
+  OR old.hour IS NOT new.hour
+  OR old.weekday IS NOT new.weekday
+  OR old.directory IS NOT new.directory
+BEGIN
+    {_rollup_statements("old", -1)}
+    {_rollup_statements("new", 1)}
+END;
 """
 
 _MIGRATIONS = [
     "ALTER TABLE recordings ADD COLUMN directory TEXT",
+    "ALTER TABLE recordings ADD COLUMN is_trash INTEGER NOT NULL DEFAULT 0",
 ]
 
+# Secondary indexes on `recordings`, versioned through PRAGMA user_version.
+# Each index covers one family of query helpers below so that they are answered
+# from the index b-tree alone. Bump _INDEX_VERSION whenever this set changes;
+# get_db() then drops stale idx_recordings_* indexes and rebuilds the set.
+_INDEX_VERSION = 1
+
+_INDEXES = {
+    # count_recordings_during_hours, recordings_by_hour
+    "idx_recordings_hour_weekday": "recordings (hour, weekday)",
+    # recordings_by_weekday
+    "idx_recordings_weekday_name": "recordings (weekday, weekday_name)",
+    # assign_directory (date windows, weekday / working-hours filters)
+    "idx_recordings_local_datetime": "recordings (local_datetime)",
+    "idx_recordings_working_local": "recordings (is_working_hours, local_datetime)",
+    # recordings_by_directory, assign_directory_and_tag
+    "idx_recordings_directory_id": "recordings (directory, id)",
+}
+
+# File IDs per /file/update-tags call, and how many calls run at once
+TAG_CHUNK_SIZE = 200
+TAG_WORKERS = 4
+
 WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
 
@@ -48,17 +305,39 @@ def _get_all_files() -> list[FileSimple]:
         return client.files.list_simple()
 
 
-def get_db(db_path: str | Path | None = None) -> sqlite3.Connection:
+def _iter_details(
+    file_ids: list[str],
+    listing: list[FileSimple] | None = None,
+    client: PlaudClient | None = None,
+) -> Iterator[list[FileDetail]]:
+    """Fetch details (transcript + summary) for the given files, one chunk at a time.
+
+    Chunks are sized adaptively (see plaudpy.batching) from the durations
+    of the matching listing entries, when given. Uses client if given,
+    otherwise logs in with a new one.
+    """
+    by_id = {f.id: f for f in listing or []}
+    files = [by_id.get(file_id, file_id) for file_id in file_ids]
+    if client is not None:
+        yield from client.files.iter_details(files)
+        return
+    with PlaudClient() as client:
+        yield from client.files.iter_details(files)
+
+
+def get_db(db_path: str | Path | None = None, check_same_thread: bool = True) -> sqlite3.Connection:
     """Open (and initialize if needed) the PlaudPy SQLite database.
 
     Args:
         db_path: Path to the database file. Defaults to <project>/plaud_data.db.
+        check_same_thread: Passed to sqlite3.connect. Pass False only when
+            the caller serializes all use of the connection itself.
 
     Returns:
         sqlite3.Connection with row_factory set to sqlite3.Row.
     """
     path = Path(db_path) if db_path else DEFAULT_DB_PATH
-    conn = sqlite3.connect(str(path))
+    conn = sqlite3.connect(str(path), check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
     conn.executescript(_SCHEMA)
     # Run migrations for existing DBs that lack newer columns
@@ -68,14 +347,104 @@ def get_db(db_path: str | Path | None = None) -> sqlite3.Connection:
             conn.commit()
         except sqlite3.OperationalError:
             pass  # column already exists
+    _ensure_indexes(conn)
+    _ensure_fts(conn)
+    _ensure_rollups(conn)
     return conn
 
 
+def _ensure_rollups(conn: sqlite3.Connection) -> None:
+    """Create the rollup tables and triggers, backfilling them on first use."""
+    if conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'recordings_rollup_ai'"
+    ).fetchone():
+        return
+    conn.executescript(f"BEGIN; {_ROLLUP_TABLES} {_ROLLUP_TRIGGERS} COMMIT;")
+    rebuild_rollups(conn=conn)
+
+
+def rebuild_rollups(db_path: str | Path | None = None, conn: sqlite3.Connection | None = None) -> None:
+    """Recompute all rollup tables from recordings.
+
+    Normally unnecessary, since triggers keep the rollups in step; useful
+    after writing to the database with triggers disabled.
+    """
+    own = conn is None
+    if own:
+        conn = get_db(db_path)
+    try:
+        with conn:
+            conn.execute("DELETE FROM rollup_time")
+            conn.execute("DELETE FROM rollup_hour_weekday")
+            conn.execute("DELETE FROM rollup_directory")
+            for grain, bucket in _ROLLUP_GRAINS.items():
+                conn.execute(
+                    f"""INSERT INTO rollup_time (grain, bucket, count, total_duration)
+                        SELECT '{grain}', {bucket.format(r='r')}, COUNT(*), SUM(r.duration)
+                        FROM recordings r WHERE r.local_datetime IS NOT NULL
+                        GROUP BY 2"""
+                )
+            conn.execute(
+                """INSERT INTO rollup_hour_weekday (hour, weekday, count, total_duration)
+                   SELECT hour, weekday, COUNT(*), SUM(duration) FROM recordings
+                   WHERE hour IS NOT NULL AND weekday IS NOT NULL
+                   GROUP BY hour, weekday"""
+            )
+            conn.execute(
+                """INSERT INTO rollup_directory (directory, count, total_duration)
+                   SELECT COALESCE(directory, ''), COUNT(*), SUM(duration) FROM recordings
+                   GROUP BY 1"""
+            )
+    finally:
+        if own:
+            conn.close()
+
+
+def _ensure_fts(conn: sqlite3.Connection) -> None:
+    """Create and backfill the FTS5 search index on first use.
+
+    Skipped silently when the SQLite build lacks FTS5; search_local() then
+    raises ConfigurationError.
+    """
+    if conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'segments_fts'"
+    ).fetchone():
+        return
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp._fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp._fts5_probe")
+    except sqlite3.OperationalError:
+        return
+    conn.executescript(f"BEGIN; {_FTS_SCHEMA} COMMIT;")
+
+
+def _ensure_indexes(conn: sqlite3.Connection) -> None:
+    """Bring the secondary index set up to _INDEX_VERSION."""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= _INDEX_VERSION:
+        return
+    existing = {
+        r[0]
+        for r in conn.execute(
+            "SELECT name FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = 'recordings' AND name LIKE 'idx_recordings_%'"
+        )
+    }
+    with conn:
+        for name in existing - _INDEXES.keys():
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+        for name, target in _INDEXES.items():
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+        conn.execute("ANALYZE recordings")
+        conn.execute(f"PRAGMA user_version = {_INDEX_VERSION}")
+
+
 def sync_recordings(
     db_path: str | Path | None = None,
     tz: tzinfo | None = None,
     work_start: int = 9,
     work_end: int = 18,
+    details: bool = False,
 ) -> int:
     """Fetch all recordings from Plaud and upsert them into the local database.
 
@@ -84,6 +453,9 @@ def sync_recordings(
         tz: Timezone for computing local time fields. Defaults to system local tz.
         work_start: Start of working hours (inclusive, 24h). Default 9.
         work_end: End of working hours (exclusive, 24h). Default 18.
+        details: Also persist transcripts and summaries. Only files whose
+            edit_time / is_trans / is_summary changed since the last detail
+            sync are refetched, and only changed content is rewritten.
 
     Returns:
         Number of recordings synced.
@@ -96,42 +468,12 @@ def sync_recordings(
 
     conn = get_db(db_path)
     try:
-        for f in files:
-            if f.start_time:
-                dt = datetime.fromtimestamp(f.start_time / 1000.0, tz=timezone.utc).astimezone(tz)
-                local_dt = dt.isoformat()
-                hour = dt.hour
-                weekday = dt.weekday()
-                weekday_name = WEEKDAY_NAMES[weekday]
-                is_working = 1 if (weekday < 5 and work_start <= hour < work_end) else 0
-            else:
-                local_dt = None
-                hour = None
-                weekday = None
-                weekday_name = None
-                is_working = 0
+        upsert_recordings(conn, files, tz, work_start, work_end, now_iso)
+        prune_listing(conn, files)
+        sync_recording_tags(conn, files)
 
-            conn.execute(
-                """INSERT INTO recordings
-                       (id, filename, duration, start_time_ms,
-                        local_datetime, hour, weekday, weekday_name,
-                        is_working_hours, synced_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                   ON CONFLICT(id) DO UPDATE SET
-                       filename=excluded.filename,
-                       duration=excluded.duration,
-                       start_time_ms=excluded.start_time_ms,
-                       local_datetime=excluded.local_datetime,
-                       hour=excluded.hour,
-                       weekday=excluded.weekday,
-                       weekday_name=excluded.weekday_name,
-                       is_working_hours=excluded.is_working_hours,
-                       synced_at=excluded.synced_at
-                """,
-                (f.id, f.filename, f.duration, f.start_time,
-                 local_dt, hour, weekday, weekday_name,
-                 is_working, now_iso),
-            )
+        if details:
+            sync_details(conn, files, now_iso)
 
         conn.execute(
             "INSERT INTO sync_log (synced_at, total_files) VALUES (?, ?)",
@@ -144,6 +486,339 @@ def sync_recordings(
     return len(files)
 
 
+def upsert_recordings(
+    conn: sqlite3.Connection,
+    files: list[FileSimple],
+    tz: tzinfo,
+    work_start: int,
+    work_end: int,
+    now_iso: str,
+) -> None:
+    """Insert or update the recordings rows (and stored listing entries) of listing entries.
+
+    Like the other store helpers that take a connection, this leaves
+    committing to the caller.
+
+    Args:
+        conn: Open store connection (see get_db).
+        files: Listing entries to write.
+        tz: Timezone for the local time fields.
+        work_start: Start of working hours (inclusive, 24h).
+        work_end: End of working hours (exclusive, 24h).
+        now_iso: Sync timestamp to record.
+    """
+    for f in files:
+        if f.start_time:
+            dt = datetime.fromtimestamp(f.start_time / 1000.0, tz=timezone.utc).astimezone(tz)
+            local_dt = dt.isoformat()
+            hour = dt.hour
+            weekday = dt.weekday()
+            weekday_name = WEEKDAY_NAMES[weekday]
+            is_working = 1 if (weekday < 5 and work_start <= hour < work_end) else 0
+        else:
+            local_dt = None
+            hour = None
+            weekday = None
+            weekday_name = None
+            is_working = 0
+
+        conn.execute(
+            """INSERT INTO recordings
+                   (id, filename, duration, start_time_ms,
+                    local_datetime, hour, weekday, weekday_name,
+                    is_working_hours, is_trash, synced_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET
+                   filename=excluded.filename,
+                   duration=excluded.duration,
+                   start_time_ms=excluded.start_time_ms,
+                   local_datetime=excluded.local_datetime,
+                   hour=excluded.hour,
+                   weekday=excluded.weekday,
+                   weekday_name=excluded.weekday_name,
+                   is_working_hours=excluded.is_working_hours,
+                   is_trash=excluded.is_trash,
+                   synced_at=excluded.synced_at
+            """,
+            (f.id, f.filename, f.duration, f.start_time,
+             local_dt, hour, weekday, weekday_name,
+             is_working, int(f.is_trash), now_iso),
+        )
+        conn.execute(
+            """INSERT INTO listing_entries (id, payload) VALUES (?, ?)
+               ON CONFLICT(id) DO UPDATE SET payload=excluded.payload""",
+            (f.id, f.model_dump_json()),
+        )
+
+
+def prune_listing(conn: sqlite3.Connection, files: list[FileSimple]) -> None:
+    """Drop stored listing entries of files no longer in a full listing.
+
+    files must be the complete listing; the caller commits.
+    """
+    conn.execute(
+        "DELETE FROM listing_entries WHERE id NOT IN (SELECT value FROM json_each(?))",
+        (json.dumps([f.id for f in files]),),
+    )
+
+
+def _utc_offset(tz: tzinfo, ms: int) -> int:
+    """UTC offset of tz, in seconds, at a millisecond epoch timestamp."""
+    offset = datetime.fromtimestamp(ms / 1000.0, tz=timezone.utc).astimezone(tz).utcoffset()
+    return int(offset.total_seconds()) if offset is not None else 0
+
+
+def _offset_table(tz: tzinfo, lo_ms: int, hi_ms: int) -> list[tuple[int, int]]:
+    """(from_ms, offset_seconds) rows covering [lo_ms, hi_ms] in tz.
+
+    Offsets are sampled daily; each change is bisected down to the
+    millisecond, so every DST transition in the range gets its own row.
+    """
+    day = 86_400_000
+    table = [(lo_ms, _utc_offset(tz, lo_ms))]
+    t = lo_ms
+    while t < hi_ms:
+        nxt = min(t + day, hi_ms)
+        if _utc_offset(tz, nxt) != table[-1][1]:
+            lo, hi = t, nxt  # offset(lo) is current, offset(hi) is new
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if _utc_offset(tz, mid) == table[-1][1]:
+                    lo = mid
+                else:
+                    hi = mid
+            table.append((hi, _utc_offset(tz, hi)))
+        t = nxt
+    return table
+
+
+def recompute_local_fields(
+    tz: tzinfo | None = None,
+    work_start: int = 9,
+    work_end: int = 18,
+    db_path: str | Path | None = None,
+) -> int:
+    """Rebuild local time fields from start_time_ms without contacting Plaud.
+
+    Use after changing timezone or working hours: local_datetime, hour,
+    weekday, weekday_name and is_working_hours are recomputed in bulk
+    inside SQLite, with the same values sync_recordings would produce. UTC
+    offsets come from a precomputed table of the timezone's transitions
+    over the stored time range, so DST is handled without per-row Python.
+
+    Args:
+        tz: Timezone for local fields. Defaults to system local tz.
+        work_start: Start of working hours (inclusive, 24h). Default 9.
+        work_end: End of working hours (exclusive, 24h). Default 18.
+        db_path: Path to the database file.
+
+    Returns:
+        Number of recordings recomputed.
+    """
+    if tz is None:
+        tz = datetime.now().astimezone().tzinfo
+
+    conn = get_db(db_path)
+    try:
+        lo, hi = conn.execute(
+            "SELECT MIN(start_time_ms), MAX(start_time_ms) FROM recordings WHERE start_time_ms > 0"
+        ).fetchone()
+        with conn:
+            if lo is None:
+                offsets: list[tuple[int, int]] = []
+            else:
+                offsets = _offset_table(tz, lo, hi)
+            conn.execute("DROP TABLE IF EXISTS temp.tz_offsets")
+            conn.execute(
+                "CREATE TEMP TABLE tz_offsets (from_ms INTEGER PRIMARY KEY, offset_s INTEGER NOT NULL)"
+            )
+            conn.executemany("INSERT INTO temp.tz_offsets VALUES (?, ?)", offsets)
+
+            # Offset for each row from the table, then every field from local epoch seconds
+            conn.execute(
+                """UPDATE recordings SET
+                       local_datetime =
+                           strftime('%Y-%m-%dT%H:%M:%S', f.ms / 1000 + f.off, 'unixepoch')
+                           || CASE WHEN f.ms % 1000 THEN printf('.%06d', f.ms % 1000 * 1000) ELSE '' END
+                           || CASE WHEN f.off < 0 THEN '-' ELSE '+' END
+                           || printf('%02d:%02d', abs(f.off) / 3600, abs(f.off) % 3600 / 60)
+                           || CASE WHEN abs(f.off) % 60 THEN printf(':%02d', abs(f.off) % 60) ELSE '' END,
+                       hour = CAST(strftime('%H', f.ms / 1000 + f.off, 'unixepoch') AS INTEGER),
+                       weekday = (CAST(strftime('%w', f.ms / 1000 + f.off, 'unixepoch') AS INTEGER) + 6) % 7
+                   FROM (
+                       SELECT r.id,
+                              r.start_time_ms AS ms,
+                              (SELECT o.offset_s FROM temp.tz_offsets o
+                               WHERE o.from_ms <= r.start_time_ms
+                               ORDER BY o.from_ms DESC LIMIT 1) AS off
+                       FROM recordings r WHERE r.start_time_ms > 0
+                   ) AS f
+                   WHERE recordings.id = f.id"""
+            )
+            conn.execute(
+                """UPDATE recordings SET
+                       weekday_name = json_extract(?, '$[' || weekday || ']'),
+                       is_working_hours = CASE
+                           WHEN weekday < 5 AND hour >= ? AND hour < ? THEN 1 ELSE 0 END
+                   WHERE start_time_ms > 0""",
+                (json.dumps(WEEKDAY_NAMES), work_start, work_end),
+            )
+            conn.execute(
+                """UPDATE recordings SET local_datetime = NULL, hour = NULL, weekday = NULL,
+                                         weekday_name = NULL, is_working_hours = 0
+                   WHERE start_time_ms <= 0"""
+            )
+            conn.execute("DROP TABLE temp.tz_offsets")
+        return conn.execute("SELECT COUNT(*) FROM recordings").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def sync_recording_tags(conn: sqlite3.Connection, files: list[FileSimple]) -> None:
+    """Mirror each file's filetag_id_list into recording_tags; the caller commits."""
+    stored: dict[str, set[str]] = {}
+    for r in conn.execute("SELECT tag_id, recording_id FROM recording_tags"):
+        stored.setdefault(r["recording_id"], set()).add(r["tag_id"])
+    for f in files:
+        tags = set(f.filetag_id_list)
+        if stored.get(f.id, set()) == tags:
+            continue
+        conn.execute("DELETE FROM recording_tags WHERE recording_id = ?", (f.id,))
+        conn.executemany(
+            "INSERT INTO recording_tags (tag_id, recording_id) VALUES (?, ?)",
+            ((tag_id, f.id) for tag_id in tags),
+        )
+
+
+def listing_signature(f: FileSimple) -> str:
+    """The listing fields whose change means a file's details must be refetched."""
+    return f"{f.edit_time}:{int(f.is_trans)}:{int(f.is_summary)}"
+
+
+def detail_content_hash(detail: FileDetail) -> str:
+    """Hash of a detail's transcript and summary, as stored in recording_details."""
+    payload = json.dumps(
+        [detail.transcript_data or [], detail.summary or ""],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def sync_details(
+    conn: sqlite3.Connection,
+    files: list[FileSimple],
+    now_iso: str,
+    client: PlaudClient | None = None,
+) -> int:
+    """Refresh the detail store for files whose listing signature changed.
+
+    Commits after each fetched chunk (and so also anything the caller
+    wrote before), so an interrupted sync resumes where it stopped.
+
+    Args:
+        conn: Open store connection (see get_db).
+        files: Listing entries to check.
+        now_iso: Sync timestamp to record.
+        client: Client to fetch with; a new one is logged in if not given.
+
+    Returns:
+        Number of recordings whose stored transcript/summary was rewritten.
+    """
+    stored = {
+        r["id"]: r["listing_sig"]
+        for r in conn.execute("SELECT id, listing_sig FROM recording_details")
+    }
+    stale = {f.id: listing_signature(f) for f in files if stored.get(f.id) != listing_signature(f)}
+    if not stale:
+        return 0
+
+    hashes = {
+        r["id"]: r["content_hash"]
+        for r in conn.execute("SELECT id, content_hash FROM recording_details")
+    }
+    written = 0
+
+    def store(detail: FileDetail) -> None:
+        nonlocal written
+        content_hash = detail_content_hash(detail)
+        if hashes.get(detail.id) != content_hash:
+            write_detail(conn, detail)
+            written += 1
+        upsert_detail_row(conn, detail.id, stale[detail.id], content_hash, detail.language, now_iso)
+
+    # Files with neither transcript nor summary have nothing to fetch
+    to_fetch = []
+    for f in files:
+        if f.id not in stale:
+            continue
+        if f.is_trans or f.is_summary:
+            to_fetch.append(f.id)
+        else:
+            store(FileDetail(id=f.id))
+
+    # Write and commit each chunk as it arrives, so memory stays bounded and
+    # an interrupted sync resumes from the first chunk it did not store.
+    # Files /file/list does not return keep their old signature and are
+    # retried on the next sync.
+    if to_fetch:
+        for chunk in _iter_details(to_fetch, listing=files, client=client):
+            for detail in chunk:
+                if detail.id in stale:
+                    store(detail)
+            conn.commit()
+    return written
+
+
+def upsert_detail_row(
+    conn: sqlite3.Connection,
+    file_id: str,
+    listing_sig: str,
+    content_hash: str,
+    language: str | None,
+    now_iso: str,
+) -> None:
+    """Record when and at which listing signature a file's details were stored.
+
+    The caller commits.
+    """
+    conn.execute(
+        """INSERT INTO recording_details (id, listing_sig, content_hash, language, fetched_at)
+           VALUES (?, ?, ?, ?, ?)
+           ON CONFLICT(id) DO UPDATE SET
+               listing_sig=excluded.listing_sig,
+               content_hash=excluded.content_hash,
+               language=excluded.language,
+               fetched_at=excluded.fetched_at
+        """,
+        (file_id, listing_sig, content_hash, language, now_iso),
+    )
+
+
+def write_detail(conn: sqlite3.Connection, detail: FileDetail) -> None:
+    """Replace the stored segments and summary of one recording; the caller commits."""
+    conn.execute("DELETE FROM transcript_segments WHERE recording_id = ?", (detail.id,))
+    conn.executemany(
+        """INSERT INTO transcript_segments
+               (recording_id, seq, speaker, content, start_ms, end_ms)
+           VALUES (?, ?, ?, ?, ?, ?)""",
+        (
+            (detail.id, seq, item.get("speaker") or "", item.get("content") or "",
+             item.get("start_time") or 0, item.get("end_time") or 0)
+            for seq, item in enumerate(detail.transcript_data or [])
+        ),
+    )
+    if detail.summary:
+        conn.execute(
+            """INSERT INTO summaries (recording_id, content) VALUES (?, ?)
+               ON CONFLICT(recording_id) DO UPDATE SET content=excluded.content""",
+            (detail.id, detail.summary),
+        )
+    else:
+        conn.execute("DELETE FROM summaries WHERE recording_id = ?", (detail.id,))
+
+
 # --- Query helpers (work against the local DB, no API calls) ---
 
 
@@ -244,35 +919,161 @@ def assign_directory(
     Returns:
         Number of recordings updated.
     """
+    where, params = _rule_clause(
+        {
+            "before": before,
+            "after": after,
+            "working_hours_only": working_hours_only,
+            "weekdays_only": weekdays_only,
+        }
+    )
     conn = get_db(db_path)
     try:
-        clauses = []
-        params: list = []
-
-        if before:
-            clauses.append("local_datetime < ?")
-            params.append(before)
-        if after:
-            clauses.append("local_datetime >= ?")
-            params.append(after)
-        if working_hours_only:
-            clauses.append("is_working_hours = 1")
-        elif weekdays_only:
-            clauses.append("weekday < 5")
-
-        where = " AND ".join(clauses) if clauses else "1=1"
-        params.append(directory)
-
-        cur = conn.execute(
-            f"UPDATE recordings SET directory = ? WHERE {where}",
-            [directory] + params[:-1],
-        )
+        cur = conn.execute(f"UPDATE recordings SET directory = ? WHERE {where}", [directory, *params])
         conn.commit()
         return cur.rowcount
     finally:
         conn.close()
 
 
+# Criteria a directory rule may combine (all must hold for a match)
+RULE_CRITERIA = (
+    "before", "after", "working_hours_only", "weekdays_only",
+    "weekdays", "hours", "min_duration", "max_duration", "keywords",
+)
+
+
+def _rule_clause(rule: dict) -> tuple[str, list]:
+    """Compile a rule's criteria into a WHERE expression and its parameters."""
+    unknown = set(rule) - set(RULE_CRITERIA) - {"directory"}
+    if unknown:
+        raise ValueError(f"Unknown rule criteria {sorted(unknown)}; expected {list(RULE_CRITERIA)}")
+
+    clauses: list[str] = []
+    params: list = []
+    if rule.get("before"):
+        clauses.append("local_datetime < ?")
+        params.append(rule["before"])
+    if rule.get("after"):
+        clauses.append("local_datetime >= ?")
+        params.append(rule["after"])
+    if rule.get("working_hours_only"):
+        clauses.append("is_working_hours = 1")
+    elif rule.get("weekdays_only"):
+        clauses.append("weekday < 5")
+    if rule.get("weekdays"):
+        days = list(rule["weekdays"])
+        clauses.append(f"weekday IN ({', '.join('?' * len(days))})")
+        params.extend(days)
+    if rule.get("hours"):
+        start, end = rule["hours"]
+        if not (0 <= start <= 24 and 0 <= end <= 24):
+            raise ValueError(f"hours must lie within 0-24, got {rule['hours']!r}")
+        # A window such as (22, 6) wraps past midnight
+        clauses.append("(hour >= ? AND hour < ?)" if start <= end else "(hour >= ? OR hour < ?)")
+        params.extend([start, end])
+    if rule.get("min_duration") is not None:
+        clauses.append("duration >= ?")
+        params.append(rule["min_duration"])
+    if rule.get("max_duration") is not None:
+        clauses.append("duration < ?")
+        params.append(rule["max_duration"])
+    if rule.get("keywords"):
+        words = list(rule["keywords"])
+        clauses.append("(" + " OR ".join(["filename LIKE ? ESCAPE '\\'"] * len(words)) + ")")
+        params.extend(
+            "%" + w.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            for w in words
+        )
+
+    return (" AND ".join(clauses) if clauses else "1=1"), params
+
+
+def apply_directory_rules(
+    rules: list[dict],
+    tag: bool = False,
+    db_path: str | Path | None = None,
+) -> list[dict]:
+    """Assign directories from an ordered rule set in a single pass.
+
+    Each rule is a dict with a 'directory' plus any of RULE_CRITERIA:
+    before/after (ISO dates on local_datetime), working_hours_only,
+    weekdays_only, weekdays (list of 0=Mon … 6=Sun), hours ((start, end),
+    end exclusive; (22, 6) wraps past midnight), min_duration/max_duration, keywords (any of them in
+    the filename, case-insensitive). All criteria of a rule must match.
+
+    The rules compile into one CASE expression evaluated in one scan of
+    recordings, so precedence is deterministic: a recording goes to the
+    first rule it matches. Only recordings whose directory changes are
+    written.
+
+    Args:
+        rules: Ordered rules; earlier rules win.
+        tag: Also apply each directory as a Plaud tag to its recordings,
+            via apply_tag (only files missing the tag are sent). One
+            client serves every rule, and none is opened when no
+            recording is missing its tag.
+        db_path: Path to the database file.
+
+    Returns:
+        One dict per rule with 'directory', 'matched' (recordings won by
+        the rule), 'updated' (whose directory changed) and, with tag,
+        'tagged'.
+    """
+    if not rules:
+        return []
+    whens: list[str] = []
+    params: list = []
+    for i, rule in enumerate(rules):
+        if not rule.get("directory"):
+            raise ValueError(f"Rule {i} has no directory")
+        where, rule_params = _rule_clause(rule)
+        whens.append(f"WHEN {where} THEN {i}")
+        params.extend(rule_params)
+
+    report = [{"directory": r["directory"], "matched": 0, "updated": 0} for r in rules]
+    matched: dict[int, list[str]] = {}
+    conn = get_db(db_path)
+    try:
+        rows = conn.execute(
+            f"""SELECT id, directory, rule FROM (
+                    SELECT id, directory, CASE {' '.join(whens)} END AS rule FROM recordings
+                ) WHERE rule IS NOT NULL""",
+            params,
+        ).fetchall()
+        updates = []
+        for r in rows:
+            matched.setdefault(r["rule"], []).append(r["id"])
+            target = rules[r["rule"]]["directory"]
+            report[r["rule"]]["matched"] += 1
+            if r["directory"] != target:
+                report[r["rule"]]["updated"] += 1
+                updates.append((target, r["id"]))
+        with conn:
+            conn.executemany("UPDATE recordings SET directory = ? WHERE id = ?", updates)
+    finally:
+        conn.close()
+
+    if tag:
+        for row in report:
+            row["tagged"] = 0
+        conn = get_db(db_path)
+        try:
+            stale = [
+                i for i, row in enumerate(report)
+                if matched.get(i) and _needs_tagging(conn, row["directory"], matched[i])
+            ]
+        finally:
+            conn.close()
+        if stale:
+            with PlaudClient() as client:
+                for i in stale:
+                    report[i]["tagged"] = len(apply_tag(
+                        report[i]["directory"], matched[i], db_path=db_path, client=client
+                    ))
+    return report
+
+
 def assign_directory_and_tag(
     directory: str,
     before: str | None = None,
@@ -283,8 +1084,9 @@ def assign_directory_and_tag(
 ) -> dict:
     """Assign a directory locally AND apply a matching Plaud tag via the API.
 
-    Creates the tag on Plaud if it doesn't exist, then applies it to every
-    matching recording in one batch call.
+    Creates the tag on Plaud if it doesn't exist, then applies it to the
+    matching recordings that don't carry it yet (see apply_tag). Re-running
+    an already applied assignment makes no API calls.
 
     Args:
         directory: Directory / tag name.
@@ -317,20 +1119,164 @@ def assign_directory_and_tag(
     finally:
         conn.close()
 
+    # 3. Tag only what is missing the tag
+    tagged = apply_tag(directory, file_ids, db_path=db_path)
+    return {"db_updated": db_count, "api_tagged": len(tagged)}
+
+
+def cache_tags(conn: sqlite3.Connection, tags: list[FileTag]) -> None:
+    """Replace the cached tag definitions with a fresh /filetag/ listing; the caller commits."""
+    now_iso = datetime.now(timezone.utc).isoformat()
+    conn.execute("DELETE FROM tags")
+    conn.executemany(
+        "INSERT INTO tags (id, name, color, synced_at) VALUES (?, ?, ?, ?)",
+        [(t.id, t.name or "", t.color, now_iso) for t in tags if t.id],
+    )
+
+
+def tag_ids_by_name(db_path: str | Path | None = None) -> dict[str, str]:
+    """Cached tag name -> tag ID map (filled by apply_tag)."""
+    conn = get_db(db_path)
+    try:
+        return {r["name"]: r["id"] for r in conn.execute("SELECT id, name FROM tags")}
+    finally:
+        conn.close()
+
+
+def tagged_recordings(tag_id: str, db_path: str | Path | None = None) -> list[str]:
+    """IDs of recordings carrying a tag, from the local tag index."""
+    conn = get_db(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT recording_id FROM recording_tags WHERE tag_id = ? ORDER BY recording_id",
+            (tag_id,),
+        ).fetchall()
+        return [r["recording_id"] for r in rows]
+    finally:
+        conn.close()
+
+
+def _missing_tag(conn: sqlite3.Connection, tag_id: str, file_ids: list[str]) -> list[str]:
+    """The file_ids (deduplicated, in order) the local index doesn't list under tag_id."""
+    have = {
+        r["recording_id"]
+        for r in conn.execute("SELECT recording_id FROM recording_tags WHERE tag_id = ?", (tag_id,))
+    }
+    return [fid for fid in dict.fromkeys(file_ids) if fid not in have]
+
+
+def _needs_tagging(conn: sqlite3.Connection, tag_name: str, file_ids: list[str]) -> bool:
+    """False only if the tag is cached and the local index lists every file under it."""
+    row = conn.execute("SELECT id FROM tags WHERE name = ? LIMIT 1", (tag_name,)).fetchone()
+    return row is None or bool(_missing_tag(conn, row["id"], file_ids))
+
+
+def apply_tag(
+    tag_name: str,
+    file_ids: list[str],
+    db_path: str | Path | None = None,
+    chunk_size: int = TAG_CHUNK_SIZE,
+    workers: int = TAG_WORKERS,
+    client: PlaudClient | None = None,
+) -> list[str]:
+    """Apply a Plaud tag to files, sending only the files that lack it.
+
+    The tag name is resolved through the local tag cache; the tag list is
+    fetched (and the tag created) only when the name is unknown. Files
+    already carrying the tag according to the local index (recording_tags,
+    refreshed from the listing by sync_recordings) are skipped, and the
+    rest are tagged in chunked, concurrent update-tags calls and recorded
+    in the index. When nothing is missing, no API call is made. If Plaud
+    rejects a cached tag ID as unknown, the tag list is refreshed and the
+    update retried once.
+
+    Args:
+        tag_name: Tag name; created on Plaud if needed.
+        file_ids: Files that should carry the tag.
+        db_path: Path to the database file.
+        chunk_size: File IDs per update-tags call.
+        workers: Concurrent update-tags calls.
+        client: Client to use; a new one is logged in if needed and not given.
+
+    Returns:
+        IDs that were tagged by this call.
+    """
     if not file_ids:
-        return {"db_updated": db_count, "api_tagged": 0}
+        return []
+    conn = get_db(db_path)
+    try:
+        if not _needs_tagging(conn, tag_name, file_ids):
+            return []
+        if client is None:
+            with PlaudClient() as client:
+                return _send_tag(conn, client, tag_name, file_ids, chunk_size, workers)
+        return _send_tag(conn, client, tag_name, file_ids, chunk_size, workers)
+    finally:
+        conn.close()
 
-    # 3. Find or create the tag on Plaud
-    with PlaudClient() as client:
-        existing_tags = client.tags.list_tags()
-        tag = next((t for t in existing_tags if t.name == directory), None)
-        if tag is None:
-            tag = client.tags.create_tag(directory)
 
-        # 4. Apply the tag to all matching recordings in one call
-        client.files.update_tags(file_ids, tag.id)
+def _send_tag(
+    conn: sqlite3.Connection,
+    client: PlaudClient,
+    tag_name: str,
+    file_ids: list[str],
+    chunk_size: int,
+    workers: int,
+) -> list[str]:
+    tag_id = _resolve_tag(conn, client, tag_name)
+    missing = _missing_tag(conn, tag_id, file_ids)
+    try:
+        _update_tags(client, tag_id, missing, chunk_size, workers)
+    except APIError as e:
+        if not _is_unknown_tag(e):
+            raise
+        # The cached tag was deleted on Plaud; refresh the cache and retry once
+        stale_id = tag_id
+        tag_id = _resolve_tag(conn, client, tag_name, refresh=True)
+        with conn:
+            conn.execute("DELETE FROM recording_tags WHERE tag_id = ?", (stale_id,))
+        missing = _missing_tag(conn, tag_id, file_ids)
+        _update_tags(client, tag_id, missing, chunk_size, workers)
+
+    with conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO recording_tags (tag_id, recording_id) VALUES (?, ?)",
+            [(tag_id, fid) for fid in missing],
+        )
+    return missing
+
+
+def _resolve_tag(
+    conn: sqlite3.Connection, client: PlaudClient, tag_name: str, refresh: bool = False
+) -> str:
+    """Tag ID for a name, from the cache unless refresh; creates the tag if needed."""
+    if not refresh:
+        row = conn.execute("SELECT id FROM tags WHERE name = ? LIMIT 1", (tag_name,)).fetchone()
+        if row is not None:
+            return row["id"]
+    tags = client.tags.list_tags()
+    tag = next((t for t in tags if t.name == tag_name), None)
+    if tag is None:
+        tag = client.tags.create_tag(tag_name)
+        tags.append(tag)
+    with conn:
+        cache_tags(conn, tags)
+    return tag.id
+
 
-    return {"db_updated": db_count, "api_tagged": len(file_ids)}
+def _update_tags(
+    client: PlaudClient, tag_id: str, file_ids: list[str], chunk_size: int, workers: int
+) -> None:
+    chunks = [file_ids[i:i + chunk_size] for i in range(0, len(file_ids), chunk_size)]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        list(pool.map(lambda chunk: client.files.update_tags(chunk, tag_id), chunks))
+
+
+def _is_unknown_tag(error: APIError) -> bool:
+    """Whether update-tags rejected the tag ID itself."""
+    return error.status_code == 404 or (
+        error.status_code == 400 and "tag" in str(error).lower()
+    )
 
 
 def recordings_by_directory(db_path: str | Path | None = None) -> list[dict]:
@@ -350,3 +1296,317 @@ def recordings_by_directory(db_path: str | Path | None = None) -> list[dict]:
         return [dict(r) for r in rows]
     finally:
         conn.close()
+
+
+def rollup_by_period(
+    grain: str = "day",
+    start: str | None = None,
+    end: str | None = None,
+    db_path: str | Path | None = None,
+) -> list[dict]:
+    """Recording count and total duration per day, week or month.
+
+    Reads only the rollup_time table, so the cost depends on the number
+    of buckets, not recordings.
+
+    Args:
+        grain: 'day', 'week' (buckets named by their Monday) or 'month'.
+        start: Inclusive lower bound on the bucket (e.g. '2024-01-01' or '2024-01').
+        end: Exclusive upper bound on the bucket.
+        db_path: Path to the database file.
+
+    Returns:
+        List of dicts with 'bucket', 'count' and 'total_duration', in bucket order.
+    """
+    if grain not in _ROLLUP_GRAINS:
+        raise ValueError(f"Unknown grain {grain!r}; expected one of {list(_ROLLUP_GRAINS)}")
+    clauses = ["grain = ?"]
+    params: list = [grain]
+    if start:
+        clauses.append("bucket >= ?")
+        params.append(start)
+    if end:
+        clauses.append("bucket < ?")
+        params.append(end)
+    conn = get_db(db_path)
+    try:
+        rows = conn.execute(
+            f"""SELECT bucket, count, total_duration FROM rollup_time
+                WHERE {' AND '.join(clauses)} ORDER BY bucket""",
+            params,
+        ).fetchall()
+        return [dict(r) for r in rows]
+    finally:
+        conn.close()
+
+
+def rollup_by_hour_weekday(db_path: str | Path | None = None) -> list[dict]:
+    """Recording count and total duration per (hour, weekday) cell, from rollups.
+
+    Returns:
+        List of dicts with 'hour', 'weekday', 'weekday_name', 'count' and
+        'total_duration', ordered by weekday then hour.
+    """
+    conn = get_db(db_path)
+    try:
+        rows = conn.execute(
+            """SELECT hour, weekday, count, total_duration FROM rollup_hour_weekday
+               ORDER BY weekday, hour"""
+        ).fetchall()
+        return [{**dict(r), "weekday_name": WEEKDAY_NAMES[r["weekday"]]} for r in rows]
+    finally:
+        conn.close()
+
+
+def rollup_by_directory(db_path: str | Path | None = None) -> list[dict]:
+    """Recording count and total duration per directory, from rollups.
+
+    Returns:
+        List of dicts with 'directory' ('(unassigned)' for none), 'count'
+        and 'total_duration', by count descending.
+    """
+    conn = get_db(db_path)
+    try:
+        rows = conn.execute(
+            """SELECT CASE directory WHEN '' THEN '(unassigned)' ELSE directory END AS directory,
+                      count, total_duration
+               FROM rollup_directory
+               ORDER BY count DESC, directory"""
+        ).fetchall()
+        return [dict(r) for r in rows]
+    finally:
+        conn.close()
+
+
+def get_local_transcript(file_id: str, db_path: str | Path | None = None) -> Transcript:
+    """Load a recording's transcript from the detail store.
+
+    Requires a prior sync_recordings(details=True). Returns an empty
+    Transcript if nothing is stored for the file.
+    """
+    conn = get_db(db_path)
+    try:
+        row = conn.execute(
+            "SELECT language FROM recording_details WHERE id = ?", (file_id,)
+        ).fetchone()
+        return _load_transcript(conn, file_id, language=row["language"] if row else None)
+    finally:
+        conn.close()
+
+
+def get_local_summary(file_id: str, db_path: str | Path | None = None) -> str | None:
+    """Load a recording's AI summary from the detail store."""
+    conn = get_db(db_path)
+    try:
+        row = conn.execute(
+            "SELECT content FROM summaries WHERE recording_id = ?", (file_id,)
+        ).fetchone()
+        return row["content"] if row else None
+    finally:
+        conn.close()
+
+
+def get_local_recording(file_id: str, db_path: str | Path | None = None) -> Recording | None:
+    """Build a Recording (metadata, transcript, summary) from the local database.
+
+    Returns:
+        Recording object or None if the file has not been synced.
+    """
+    conn = get_db(db_path)
+    try:
+        return load_recording(conn, file_id)
+    finally:
+        conn.close()
+
+
+def load_recording(conn: sqlite3.Connection, file_id: str) -> Recording | None:
+    """get_local_recording() on an already open connection."""
+    row = conn.execute(
+        """SELECT r.id, r.filename, r.duration, r.start_time_ms,
+                  d.language, s.content AS summary
+           FROM recordings r
+           LEFT JOIN recording_details d ON d.id = r.id
+           LEFT JOIN summaries s ON s.recording_id = r.id
+           WHERE r.id = ?""",
+        (file_id,),
+    ).fetchone()
+    if row is None:
+        return None
+
+    created_at = (
+        datetime.fromtimestamp(row["start_time_ms"] / 1000.0, tz=timezone.utc)
+        if row["start_time_ms"] else None
+    )
+    return Recording(
+        id=row["id"],
+        title=row["filename"],
+        duration=row["duration"],
+        created_at=created_at,
+        transcript=_load_transcript(conn, file_id, language=row["language"]),
+        summary=row["summary"],
+        language=row["language"],
+    )
+
+
+def _load_transcript(
+    conn: sqlite3.Connection, file_id: str, language: str | None = None
+) -> Transcript:
+    rows = conn.execute(
+        """SELECT speaker, content, start_ms, end_ms
+           FROM transcript_segments
+           WHERE recording_id = ?
+           ORDER BY seq""",
+        (file_id,),
+    ).fetchall()
+    entries = [
+        TranscriptEntry(
+            speaker=r["speaker"],
+            text=r["content"],
+            start_time=r["start_ms"] / 1000.0,
+            end_time=r["end_ms"] / 1000.0,
+        )
+        for r in rows
+    ]
+    return Transcript(entries=entries, language=language)
+
+
+def _fts_query(query: str) -> str:
+    """Turn free text into an FTS5 query matching all terms (implicit AND)."""
+    terms = query.split()
+    return " ".join('"' + t.replace('"', '""') + '"' for t in terms)
+
+
+def search_local(
+    query: str,
+    after: str | None = None,
+    before: str | None = None,
+    directory: str | None = None,
+    tag_id: str | None = None,
+    speaker: str | None = None,
+    sources: tuple[str, ...] = ("segment", "summary", "title"),
+    limit: int = 20,
+    offset: int = 0,
+    highlight: tuple[str, str] = ("**", "**"),
+    raw: bool = False,
+    db_path: str | Path | None = None,
+) -> list[dict]:
+    """Full-text search over locally synced filenames, transcripts and summaries.
+
+    Transcripts and summaries are only searchable after a
+    sync_recordings(details=True). No API calls are made.
+
+    Args:
+        query: Search text. All terms must match; pass raw=True to use
+            FTS5 query syntax (phrases, OR, NEAR, prefix*) directly.
+        after: ISO date string (inclusive lower bound on local_datetime).
+        before: ISO date string (exclusive upper bound on local_datetime).
+        directory: Only match recordings assigned to this directory.
+        tag_id: Only match recordings carrying this Plaud tag ID.
+        speaker: Only match transcript segments spoken by this speaker.
+            Summary and title hits are excluded when set.
+        sources: Which of "segment", "summary" and "title" to search.
+        limit: Maximum number of hits.
+        offset: Number of hits to skip (for paging).
+        highlight: Markers placed around matched terms in the snippet.
+        raw: Treat query as an FTS5 expression.
+        db_path: Path to the database file.
+
+    Returns:
+        List of dicts ordered by relevance, with 'kind', 'recording_id',
+        'filename', 'speaker', 'start_time', 'end_time' (seconds, segments
+        only), 'snippet' and 'score' (bm25, lower is better).
+    """
+    match = query if raw else _fts_query(query)
+    if not match:
+        return []
+
+    params: dict = {
+        "match": match,
+        "open": highlight[0],
+        "close": highlight[1],
+        "limit": limit,
+        "offset": offset,
+    }
+    clauses = []
+    if after:
+        clauses.append("r.local_datetime >= :after")
+        params["after"] = after
+    if before:
+        clauses.append("r.local_datetime < :before")
+        params["before"] = before
+    if directory:
+        clauses.append("r.directory = :directory")
+        params["directory"] = directory
+    if tag_id:
+        clauses.append(
+            "EXISTS (SELECT 1 FROM recording_tags t "
+            "WHERE t.tag_id = :tag_id AND t.recording_id = r.id)"
+        )
+        params["tag_id"] = tag_id
+    filters = "".join(f" AND {c}" for c in clauses)
+
+    selects = []
+    if "segment" in sources:
+        speaker_filter = ""
+        if speaker is not None:
+            speaker_filter = " AND s.speaker = :speaker"
+            params["speaker"] = speaker
+        selects.append(
+            f"""SELECT 'segment' AS kind, r.id AS recording_id, r.filename,
+                       s.speaker, s.start_ms, s.end_ms,
+                       snippet(segments_fts, 0, :open, :close, '…', 16) AS snippet,
+                       bm25(segments_fts) AS score
+                FROM segments_fts
+                JOIN transcript_segments s ON s.id = segments_fts.rowid
+                JOIN recordings r ON r.id = s.recording_id
+                WHERE segments_fts MATCH :match{speaker_filter}{filters}"""
+        )
+    if speaker is None and "summary" in sources:
+        selects.append(
+            f"""SELECT 'summary' AS kind, r.id AS recording_id, r.filename,
+                       NULL AS speaker, NULL AS start_ms, NULL AS end_ms,
+                       snippet(summaries_fts, 0, :open, :close, '…', 16) AS snippet,
+                       bm25(summaries_fts) AS score
+                FROM summaries_fts
+                JOIN summaries sm ON sm.rowid = summaries_fts.rowid
+                JOIN recordings r ON r.id = sm.recording_id
+                WHERE summaries_fts MATCH :match{filters}"""
+        )
+    if speaker is None and "title" in sources:
+        selects.append(
+            f"""SELECT 'title' AS kind, r.id AS recording_id, r.filename,
+                       NULL AS speaker, NULL AS start_ms, NULL AS end_ms,
+                       highlight(titles_fts, 0, :open, :close) AS snippet,
+                       bm25(titles_fts) AS score
+                FROM titles_fts
+                JOIN recordings r ON r.rowid = titles_fts.rowid
+                WHERE titles_fts MATCH :match{filters}"""
+        )
+    if not selects:
+        return []
+
+    sql = " UNION ALL ".join(selects) + " ORDER BY score LIMIT :limit OFFSET :offset"
+
+    conn = get_db(db_path)
+    try:
+        if not conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'segments_fts'"
+        ).fetchone():
+            raise ConfigurationError("search_local requires an SQLite build with FTS5")
+        rows = conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+    return [
+        {
+            "kind": r["kind"],
+            "recording_id": r["recording_id"],
+            "filename": r["filename"],
+            "speaker": r["speaker"],
+            "start_time": r["start_ms"] / 1000.0 if r["start_ms"] is not None else None,
+            "end_time": r["end_ms"] / 1000.0 if r["end_ms"] is not None else None,
+            "snippet": r["snippet"],
+            "score": r["score"],
+        }
+        for r in rows
+    ]
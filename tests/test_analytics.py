@@ -0,0 +1,89 @@
+"""Unit tests for vectorized speaker analytics."""
+
+from datetime import timezone
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from plaudpy import analytics, utils
+from plaudpy.models import FileDetail, FileSimple, Transcript, TranscriptEntry
+
+
+def _transcript():
+    return Transcript(entries=[
+        TranscriptEntry(speaker="A", text="1", start_time=0.0, end_time=10.0),
+        TranscriptEntry(speaker="A", text="2", start_time=10.0, end_time=25.0),
+        TranscriptEntry(speaker="B", text="3", start_time=24.0, end_time=30.0),  # interrupts A
+        TranscriptEntry(speaker="A", text="4", start_time=31.0, end_time=33.0),
+        TranscriptEntry(speaker="B", text="5", start_time=35.0, end_time=36.0),
+    ])
+
+
+class TestSpeakerStats:
+
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_metrics(self, columnar):
+        transcript = _transcript().to_columnar() if columnar else _transcript()
+        stats = {row["speaker"]: row for row in analytics.speaker_stats(transcript)}
+
+        assert stats["A"] == {
+            "speaker": "A", "talk_time": 27.0, "segments": 3, "turns": 2,
+            "interruptions": 0, "longest_monologue": 25.0,
+        }
+        assert stats["B"] == {
+            "speaker": "B", "talk_time": 7.0, "segments": 2, "turns": 2,
+            "interruptions": 1, "longest_monologue": 6.0,
+        }
+
+    def test_empty(self):
+        assert analytics.speaker_stats(Transcript()) == []
+
+    def test_aggregate(self):
+        stats = analytics.speaker_stats(_transcript())
+        totals = {row["speaker"]: row for row in analytics.aggregate_speaker_stats([stats, stats])}
+        assert totals["A"]["talk_time"] == 54.0
+        assert totals["A"]["recordings"] == 2
+        assert totals["B"]["longest_monologue"] == 6.0
+
+
+class TestAnalyzeLibrary:
+
+    @pytest.fixture
+    def db(self, tmp_path, monkeypatch):
+        trans_result = [
+            {"speaker": e.speaker, "content": e.text,
+             "start_time": int(e.start_time * 1000), "end_time": int(e.end_time * 1000)}
+            for e in _transcript().entries
+        ]
+        listing = [FileSimple(id=f"f{i}", filename=f"R{i}", is_trans=True) for i in range(2)]
+        details = {"f0": trans_result, "f1": trans_result[:2]}
+        monkeypatch.setattr(utils, "_get_all_files", lambda: listing)
+        monkeypatch.setattr(utils, "_iter_details", lambda ids, listing=None, client=None: iter([[
+            FileDetail(id=i, trans_result=details[i]) for i in ids
+        ]]))
+        path = tmp_path / "plaud.db"
+        utils.sync_recordings(db_path=path, tz=timezone.utc, details=True)
+        return path, listing, details
+
+    def test_persists_and_reports(self, db):
+        path, _, _ = db
+        assert analytics.analyze_library(db_path=path) == 2
+        assert analytics.analyze_library(db_path=path) == 0
+
+        report = {row["speaker"]: row for row in analytics.library_speaker_report(db_path=path)}
+        assert report["A"]["talk_time"] == 52.0
+        assert report["A"]["recordings"] == 2
+        assert report["B"]["interruptions"] == 1
+
+    def test_reanalyses_changed_recordings(self, db):
+        path, listing, details = db
+        analytics.analyze_library(db_path=path)
+
+        details["f1"] = details["f0"]
+        listing[1].edit_time = 99
+        utils.sync_recordings(db_path=path, tz=timezone.utc, details=True)
+
+        assert analytics.analyze_library(db_path=path) == 1
+        report = {row["speaker"]: row for row in analytics.library_speaker_report(db_path=path)}
+        assert report["B"]["recordings"] == 2
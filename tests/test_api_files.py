@@ -6,6 +6,7 @@ import httpx
 import pytest
 
 from plaudpy.api.files import FilesAPI
+from plaudpy.batching import AdaptiveChunker
 from plaudpy.config import PlaudConfig
 from plaudpy.models.file import FileDetail, FileSimple, UploadPresignedUrl
 
@@ -54,6 +55,60 @@ class TestFilesAPI:
         result = files_api.get_details([])
         assert result == []
 
+    def test_iter_details_adaptive_chunks(self, files_api):
+        def post(url, json, **kwargs):
+            response = MagicMock(status_code=200, content=b"x" * 1000 * len(json))
+            response.json.return_value = {"data_file_list": [{"id": i} for i in json]}
+            return response
+
+        files_api.client.post.side_effect = post
+        files = [FileSimple(id=f"f{i}", duration=1000, is_trans=True) for i in range(10)]
+        chunker = AdaptiveChunker(target_bytes=4000, bytes_per_unit=1.0, overhead_bytes=0)
+
+        chunks = list(files_api.iter_details(files, chunker=chunker))
+
+        assert [len(c) for c in chunks] == [4, 4, 2]
+        assert [d.id for c in chunks for d in c] == [f.id for f in files]
+
+    def test_iter_details_retries_timeout_smaller(self, files_api):
+        calls = []
+
+        def post(url, json, **kwargs):
+            calls.append(list(json))
+            if len(json) > 2:
+                raise httpx.ReadTimeout("slow")
+            response = MagicMock(status_code=200)
+            response.json.return_value = {"data_file_list": [{"id": i} for i in json]}
+            return response
+
+        files_api.client.post.side_effect = post
+        chunker = AdaptiveChunker(target_bytes=4, bytes_per_unit=0, overhead_bytes=1)
+
+        chunks = list(files_api.iter_details(["a", "b", "c", "d"], chunker=chunker))
+
+        assert calls[0] == ["a", "b", "c", "d"]
+        assert [d.id for c in chunks for d in c] == ["a", "b", "c", "d"]
+        assert chunker.budget < 4
+
+    def test_iter_details_timeout_retry_is_strictly_smaller(self, files_api):
+        sizes = []
+
+        def post(url, json, **kwargs):
+            sizes.append(len(json))
+            if len(json) > 50:
+                raise httpx.ReadTimeout("slow")
+            response = MagicMock(status_code=200)
+            response.json.return_value = {"data_file_list": [{"id": i} for i in json]}
+            return response
+
+        files_api.client.post.side_effect = post
+        ids = [f"f{i}" for i in range(150)]
+
+        chunks = list(files_api.iter_details(ids))
+
+        assert sizes[:2] == [100, 50]
+        assert sum(len(c) for c in chunks) == 150
+
     def test_get_detail(self, files_api):
         response = MagicMock(status_code=200)
         response.json.return_value = {"id": "f1", "filename": "Test", "duration": 60, "start_time": 0}
@@ -128,6 +183,34 @@ class TestFilesAPI:
         assert isinstance(result, UploadPresignedUrl)
         assert result.url == "https://s3.example.com/upload"
 
+    def test_upload_part_put(self, files_api):
+        response = MagicMock(status_code=200, headers={"ETag": '"abc"'})
+        files_api.client.put.return_value = response
+
+        etag = files_api.upload_part("https://s3.example.com/upload", b"data")
+
+        assert etag == '"abc"'
+        kwargs = files_api.client.put.call_args[1]
+        assert kwargs == {"content": b"data"}  # no bearer token to storage
+
+    def test_upload_part_streams_file(self, files_api, tmp_path):
+        path = tmp_path / "a.mp3"
+        path.write_bytes(b"x" * 10)
+        files_api.client.put.return_value = MagicMock(status_code=200, headers={})
+
+        with path.open("rb") as fp:
+            files_api.upload_part("https://s3.example.com/upload", fp)
+            kwargs = files_api.client.put.call_args[1]
+            assert kwargs["headers"] == {"Content-Length": "10"}
+            assert b"".join(kwargs["content"]) == b"x" * 10
+
+    def test_upload_part_post_fields(self, files_api):
+        files_api.client.post.return_value = MagicMock(status_code=204, headers={})
+
+        assert files_api.upload_part("https://s3.example.com", b"data", fields={"key": "k"}) is None
+        kwargs = files_api.client.post.call_args[1]
+        assert kwargs["data"] == {"key": "k"}
+
     def test_confirm_upload(self, files_api):
         response = MagicMock(status_code=200)
         response.json.return_value = {"status": "confirmed"}
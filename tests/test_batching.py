@@ -0,0 +1,59 @@
+"""Unit tests for adaptive /file/list chunk sizing."""
+
+from plaudpy.batching import AdaptiveChunker
+from plaudpy.models import FileSimple
+
+
+def _files(*durations):
+    return [FileSimple(id=f"f{i}", duration=d, is_trans=True) for i, d in enumerate(durations)]
+
+
+class TestAdaptiveChunker:
+
+    def test_long_recordings_get_smaller_chunks(self):
+        chunker = AdaptiveChunker(target_bytes=100_000, bytes_per_unit=1.0, overhead_bytes=0)
+        assert chunker.next_size(_files(*[10_000] * 50)) == 10
+        assert chunker.next_size(_files(*[1_000] * 50)) == 50
+
+    def test_untranscribed_files_cost_only_overhead(self):
+        chunker = AdaptiveChunker(target_bytes=10_000, overhead_bytes=1_000, max_ids=100)
+        files = [FileSimple(id=str(i), duration=10**9) for i in range(30)]
+        assert chunker.next_size(files) == 10
+
+    def test_at_least_one_and_at_most_max_ids(self):
+        chunker = AdaptiveChunker(target_bytes=10, max_ids=5)
+        assert chunker.next_size(_files(10**9, 1)) == 1
+        assert chunker.next_size([None] * 20) == 1
+        assert AdaptiveChunker(max_ids=5).next_size(_files(*[1] * 20)) == 5
+        assert chunker.next_size([]) == 1
+
+    def test_learns_bytes_per_duration(self):
+        chunker = AdaptiveChunker(bytes_per_unit=1.0, overhead_bytes=0, smoothing=1.0)
+        chunker.record(_files(100, 300), nbytes=2_000, latency=0.1)
+        assert chunker.bytes_per_unit == 5.0
+
+    def test_aimd(self):
+        chunker = AdaptiveChunker(target_bytes=1_000, max_latency=1.0, increase=0.1, decrease=0.5)
+        chunker.record(_files(1), nbytes=100, latency=5.0)  # slow: multiplicative cut
+        assert chunker.budget == 500
+        chunker.record_timeout()
+        assert chunker.budget == 250
+        chunker.record(_files(1), nbytes=100, latency=0.1)  # fast: additive increase
+        assert chunker.budget == 350
+        chunker.record(_files(1), nbytes=5_000, latency=0.1)  # oversized response
+        assert chunker.budget == 175
+        for _ in range(20):
+            chunker.record(_files(1), nbytes=100, latency=0.1)
+        assert chunker.budget == 1_000  # capped at the target
+
+    def test_timeout_caps_ids_and_recovers_additively(self):
+        chunker = AdaptiveChunker(max_ids=100, increase=0.1, overhead_bytes=1)
+        files = _files(*[1] * 200)
+        assert chunker.next_size(files) == 100
+
+        chunker.record_timeout(100)
+        assert chunker.next_size(files) == 50
+        chunker.record_timeout(50)
+        assert chunker.next_size(files) == 25
+        chunker.record(files[:25], nbytes=100, latency=0.1)
+        assert chunker.next_size(files) == 35
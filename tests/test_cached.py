@@ -0,0 +1,207 @@
+"""Tests for the offline-first cached client."""
+
+from datetime import timedelta, timezone
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from plaudpy import cached as cached_module
+from plaudpy import utils
+from plaudpy.cached import CachedPlaudClient
+from plaudpy.exceptions import APIError, ConfigurationError, OfflineError
+from plaudpy.models import FileDetail, FileSimple, FileTag
+
+
+def _listing():
+    # Newest first, like the API
+    return [
+        FileSimple(id="b", filename="Beta", duration=30, start_time=1700100000000),
+        FileSimple(id="a", filename="Alpha", duration=60, start_time=1700000000000,
+                   edit_time=1, is_trans=True),
+    ]
+
+
+@pytest.fixture
+def upstream():
+    client = MagicMock()
+    client.files.list_simple.return_value = _listing()
+    client.files.get_details.side_effect = lambda ids: [
+        FileDetail(id=i, filename="Alpha", trans_result=[{"speaker": "S1", "content": "hi"}])
+        for i in ids
+    ]
+    client.tags.list_tags.return_value = [FileTag(id="t1", name="Work", color="red")]
+    return client
+
+
+@pytest.fixture
+def make(upstream, tmp_path):
+    clients = []
+
+    def make(**kwargs):
+        kwargs.setdefault("client", upstream)
+        kwargs.setdefault("tz", timezone.utc)
+        client = CachedPlaudClient(db_path=tmp_path / "plaud.db", **kwargs)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+def _offline(upstream):
+    error = httpx.ConnectError("down")
+    upstream.files.list_simple.side_effect = error
+    upstream.files.get_details.side_effect = error
+    upstream.files.update.side_effect = error
+    upstream.tags.list_tags.side_effect = error
+    upstream.tags.update_tag.side_effect = error
+
+
+class TestReads:
+
+    def test_listing_served_locally_while_fresh(self, make, upstream):
+        client = make()
+
+        assert [f.id for f in client.files.list_simple()] == ["b", "a"]
+        assert [f.id for f in client.files.list_simple()] == ["b", "a"]
+        assert upstream.files.list_simple.call_count == 1
+
+    def test_stale_listing_returned_then_revalidated(self, make, upstream):
+        client = make(max_age=timedelta(0))
+        client.files.list_simple()
+        upstream.files.list_simple.return_value = _listing()[1:]
+
+        assert len(client.files.list_simple()) == 2  # stale copy, no waiting
+        client.wait()
+        assert upstream.files.list_simple.call_count == 2
+        assert [f.id for f in client.files.list_simple()] == ["a"]
+
+    def test_stale_listing_served_when_offline(self, make, upstream):
+        client = make(max_age=timedelta(0))
+        client.files.list_simple()
+        _offline(upstream)
+
+        assert len(client.files.list_simple()) == 2
+        client.wait()
+        assert not client.online
+        assert len(client.files.list_simple()) == 2
+
+    def test_miss_while_offline(self, make, upstream):
+        _offline(upstream)
+        client = make()
+
+        with pytest.raises(OfflineError):
+            client.get_recording("a")
+
+    def test_no_credentials_is_offline(self, make, monkeypatch):
+        monkeypatch.setattr(cached_module, "PlaudClient", MagicMock(side_effect=ConfigurationError("x")))
+        client = make(client=None)
+
+        with pytest.raises(OfflineError):
+            client.files.list_simple()
+
+    def test_recording_fresh_while_listing_unchanged(self, make, upstream, tmp_path):
+        client = make()
+        client.files.list_simple()
+
+        first = client.get_recording("a")
+        conn = utils.get_db(tmp_path / "plaud.db")
+        conn.execute("UPDATE recording_details SET fetched_at = '2000-01-01T00:00:00+00:00'")
+        conn.commit()
+        conn.close()
+        second = client.get_recording("a")
+
+        assert first.transcript.entries[0].text == second.transcript.entries[0].text == "hi"
+        assert upstream.files.get_details.call_count == 1
+
+    def test_reads_from_synced_store_without_api(self, make, upstream, tmp_path, monkeypatch):
+        monkeypatch.setattr(utils, "_get_all_files", _listing)
+        monkeypatch.setattr(utils, "_iter_details", lambda ids, listing=None, client=None: iter([[
+            FileDetail(id=i, trans_result=[{"speaker": "S1", "content": "synced"}]) for i in ids
+        ]]))
+        utils.sync_recordings(db_path=tmp_path / "plaud.db", tz=timezone.utc, details=True)
+        client = make()
+
+        assert len(client.files.list_simple()) == 2
+        assert client.get_recording("a").transcript.entries[0].text == "synced"
+        assert client.get_recording("b").transcript.entries == []
+        upstream.files.list_simple.assert_not_called()
+        upstream.files.get_details.assert_not_called()
+
+    def test_tags(self, make, upstream):
+        client = make()
+
+        assert client.tags.list_tags()[0].name == "Work"
+        assert client.tags.list_tags()[0].name == "Work"
+        assert upstream.tags.list_tags.call_count == 1
+
+    def test_other_calls_pass_through(self, make, upstream):
+        client = make()
+
+        client.ai.get_task_status()
+        client.files.download("a")
+
+        upstream.ai.get_task_status.assert_called_once()
+        upstream.files.download.assert_called_once_with("a")
+
+
+class TestWrites:
+
+    def test_write_sent_when_online(self, make, upstream):
+        client = make()
+        client.files.list_simple()
+        upstream.files.update.return_value = {"ok": True}
+
+        assert client.files.update("a", filename="Renamed") == {"ok": True}
+        assert client.files.list_simple()[1].filename == "Renamed"
+        assert client.queued_writes() == []
+
+    def test_offline_write_is_queued_applied_and_replayed(self, make, upstream):
+        client = make()
+        client.files.list_simple()
+        client.tags.list_tags()
+        _offline(upstream)
+
+        assert client.files.update("a", filename="Renamed") == {"queued": 1}
+        client.files.update_tags("b", "t1")
+        client.tags.update_tag("t1", name="Office")
+
+        files = {f.id: f for f in client.files.list_simple()}
+        assert files["a"].filename == "Renamed"
+        assert files["b"].filetag_id_list == ("t1",)
+        assert client.tags.list_tags()[0].name == "Office"
+        assert [w["method"] for w in client.queued_writes()] == ["update", "update_tags", "update_tag"]
+
+        upstream.files.update.side_effect = None
+        upstream.tags.update_tag.side_effect = None
+        client._offline_until = 0.0
+        assert client.replay_writes() == 3
+        upstream.files.update.assert_called_with("a", filename="Renamed")
+        upstream.files.update_tags.assert_called_once_with("b", "t1")
+        assert client.queued_writes() == []
+
+    def test_revalidation_keeps_queued_writes(self, make, upstream):
+        client = make(max_age=timedelta(0))
+        client.files.list_simple()
+        upstream.files.trash.side_effect = httpx.ConnectError("down")
+        client.files.trash(["a"])
+        client._offline_until = 0.0
+        upstream.files.trash.side_effect = APIError("busy", status_code=503)
+
+        client.files.list_simple()
+        client.wait()
+
+        assert {f.id: f for f in client.files.list_simple()}["a"].is_trash
+
+    def test_rejected_write_is_kept_with_error(self, make, upstream):
+        client = make()
+        upstream.files.trash.side_effect = httpx.ConnectError("down")
+        client.files.trash(["a"])
+        client._offline_until = 0.0
+        upstream.files.trash.side_effect = APIError("nope", status_code=400)
+
+        assert client.replay_writes() == 0
+        assert client.queued_writes()[0]["error"] == "nope"
+        assert client.queued_writes(pending_only=True) == []
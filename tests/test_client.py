@@ -109,11 +109,34 @@ class TestPlaudClientMocked:
 
         assert recordings[0].summary == "This is a summary of the meeting."
 
+    def test_get_recordings_parses_eagerly_with_workers(self, client_with_mocks):
+        """Passing workers parses transcripts up front."""
+        recordings = client_with_mocks.get_recordings(workers=1, columnar=True)
+
+        assert recordings[0]._source is None
+        assert recordings[0].transcript.speakers == ["Speaker 1", "Speaker 2"]
+
+    def test_get_recording(self, client_with_mocks):
+        """get_recording goes through the batching loader."""
+        recording = client_with_mocks.get_recording("abc123")
+
+        assert recording.id == "abc123"
+        assert recording.summary == "This is a summary of the meeting."
+
     def test_token_distributed_to_all_apis(self, client_with_mocks):
         """All sub-APIs should receive the access token."""
         for api in client_with_mocks._apis:
             assert api._access_token == "test-token"
 
+    def test_reauthenticate_replaces_token(self, client_with_mocks, mock_http_client):
+        """reauthenticate() logs in again and redistributes the new token."""
+        fresh = MagicMock(status_code=200, json=lambda: {"access_token": "fresh-token"})
+        mock_http_client.post.side_effect = lambda url, **kwargs: fresh
+
+        client_with_mocks.reauthenticate()
+
+        assert all(api._access_token == "fresh-token" for api in client_with_mocks._apis)
+
     def test_sub_api_properties(self, client_with_mocks):
         """Sub-API properties should return correct instances."""
         from plaudpy.api import (
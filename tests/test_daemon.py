@@ -0,0 +1,179 @@
+"""Tests for the resident sync daemon."""
+
+import sqlite3
+import threading
+from datetime import timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from plaudpy import daemon as daemon_module
+from plaudpy import utils
+from plaudpy.daemon import NEW_RECORDING, TAG_CHANGED, TRANSCRIPT_READY, SyncDaemon
+from plaudpy.exceptions import APIError
+from plaudpy.models import FileDetail, FileSimple
+
+
+def _file(file_id, **kwargs):
+    return FileSimple(id=file_id, filename=file_id, duration=60, start_time=1700000000000, **kwargs)
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.files.list_simple.return_value = [_file("a", is_trans=True, edit_time=1), _file("b")]
+    client.files.iter_details.side_effect = lambda files: iter([[
+        FileDetail(id=f.id, trans_result=[{"speaker": "S1", "content": "hi"}]) for f in files
+    ]])
+    client.ai.get_file_task_status.return_value = []
+    return client
+
+
+@pytest.fixture
+def daemon(client, tmp_path):
+    d = SyncDaemon(client, db_path=tmp_path / "plaud.db", tz=timezone.utc, jitter=0)
+    yield d
+    d.close()
+
+
+def _seed(daemon):
+    events = []
+    daemon.on(None, events.append)
+    daemon.sync_listing()
+    daemon.refresh_details()
+    return events
+
+
+class TestSyncDaemon:
+
+    def test_first_pass_seeds_empty_store_quietly(self, daemon):
+        events = _seed(daemon)
+
+        assert events == []
+        assert utils.count_recordings(daemon.db_path) == 2
+        assert utils.get_local_recording("a", daemon.db_path).transcript.entries
+
+    def test_new_recording_and_tag_change(self, daemon, client):
+        events = _seed(daemon)
+        client.files.list_simple.return_value = [
+            _file("a", is_trans=True, edit_time=2, filetag_id_list=["t1"]), _file("b"), _file("c"),
+        ]
+
+        daemon.sync_listing()
+
+        assert [(e.kind, e.file_id) for e in events] == [(NEW_RECORDING, "c"), (TAG_CHANGED, "a")]
+        assert events[1].added_tags == ("t1",)
+        assert utils.count_recordings(daemon.db_path) == 3
+
+    def test_unchanged_listing_writes_nothing(self, daemon, client, monkeypatch):
+        _seed(daemon)
+        upsert = MagicMock()
+        monkeypatch.setattr(utils, "upsert_recordings", upsert)
+
+        daemon.sync_listing()
+        daemon.refresh_details()
+
+        upsert.assert_not_called()
+        assert client.files.iter_details.call_count == 1  # only the seeding pass
+
+    def test_transcript_ready(self, daemon, client):
+        events = _seed(daemon)
+        client.files.list_simple.return_value = [
+            _file("a", is_trans=True, edit_time=1), _file("b", is_trans=True, edit_time=5),
+        ]
+
+        daemon.sync_listing()
+        daemon.refresh_details()
+
+        assert [(e.kind, e.file_id) for e in events] == [(TRANSCRIPT_READY, "b")]
+        fetched = client.files.iter_details.call_args[0][0]
+        assert [f.id for f in fetched] == ["b"]
+
+    def test_existing_store_reports_changes_since_last_sync(self, client, tmp_path):
+        db = tmp_path / "plaud.db"
+        first = SyncDaemon(client, db_path=db, tz=timezone.utc)
+        first.sync_listing()
+        first.close()
+
+        client.files.list_simple.return_value.append(_file("c"))
+        second = SyncDaemon(client, db_path=db, tz=timezone.utc)
+        events = []
+        second.on(NEW_RECORDING, events.append)
+        second.sync_listing()
+        second.close()
+
+        assert [e.file_id for e in events] == ["c"]
+
+    def test_finished_task_pulls_listing_forward(self, daemon, client):
+        _seed(daemon)
+        daemon._due["listing"] = float("inf")
+        client.ai.get_file_task_status.return_value = [{"file_id": "b", "status": "success"}]
+
+        assert daemon.check_tasks() == ["b"]
+        assert daemon._due["listing"] < float("inf")
+
+    def test_no_task_request_when_everything_transcribed(self, daemon, client):
+        client.files.list_simple.return_value = [_file("a", is_trans=True)]
+        daemon.sync_listing()
+
+        assert daemon.check_tasks() == []
+        client.ai.get_file_task_status.assert_not_called()
+
+    def test_run_pending_reschedules_with_jitter(self, client, tmp_path, monkeypatch):
+        monkeypatch.setattr(daemon_module, "time", MagicMock(monotonic=lambda: 0.0))
+        d = SyncDaemon(client, db_path=tmp_path / "plaud.db", listing_interval=100,
+                       detail_interval=1000, task_interval=10, jitter=0.5)
+
+        assert d.run_pending() == ["listing", "details", "tasks"]
+        assert 50 <= d._due["listing"] <= 150
+        assert 500 <= d._due["details"] <= 1500
+        assert d.run_pending() == []
+        d.close()
+
+    def test_expired_session_reauthenticates(self, daemon, client):
+        client.files.list_simple.side_effect = APIError("expired", status_code=401)
+
+        daemon.run_pending()
+
+        client.reauthenticate.assert_called_once()
+
+    def test_unexpected_errors_do_not_stop_cadence(self, daemon, client):
+        client.files.list_simple.side_effect = sqlite3.OperationalError("database is locked")
+
+        assert daemon.run_pending() == ["listing", "details", "tasks"]
+        client.reauthenticate.assert_not_called()
+
+    def test_callback_errors_do_not_stop_sync(self, daemon, client):
+        _seed(daemon)
+        daemon.on(NEW_RECORDING, MagicMock(side_effect=RuntimeError("boom")))
+        client.files.list_simple.return_value = [_file("c")]
+
+        events = daemon.sync_listing()
+
+        assert [e.file_id for e in events] == ["c"]
+
+    def test_unknown_event_kind(self, daemon):
+        with pytest.raises(ValueError):
+            daemon.on("nope", print)
+
+    def test_direct_job_then_start(self, daemon, client):
+        daemon.sync_listing()
+        synced = threading.Event()
+        daemon.on(NEW_RECORDING, lambda event: synced.set())
+        client.files.list_simple.return_value = [_file("a", is_trans=True, edit_time=1), _file("c")]
+        daemon.start()
+        assert synced.wait(5)
+        daemon.close()
+
+        assert utils.count_recordings(daemon.db_path) == 3
+        assert daemon._thread is None
+
+    def test_start_and_close(self, daemon, client):
+        synced = threading.Event()
+        client.files.list_simple.side_effect = lambda: synced.set() or []
+        daemon.start()
+        assert synced.wait(5)
+        daemon.close()
+
+        assert daemon._thread is None
+        assert daemon._conn is None
@@ -0,0 +1,180 @@
+"""Unit tests for transcript exporters."""
+
+import csv
+import io
+import json
+from datetime import timezone
+
+import pytest
+
+from plaudpy import export, utils
+from plaudpy.export import (
+    export_library,
+    export_recordings,
+    merge_rows,
+    write_csv,
+    write_jsonl,
+    write_srt,
+    write_vtt,
+)
+from plaudpy.models import FileDetail, FileSimple, Recording, Transcript, TranscriptEntry
+
+
+@pytest.fixture(params=["model", "columnar"])
+def transcript(request):
+    transcript = Transcript(entries=[
+        TranscriptEntry(speaker="Alice", text="Hello there", start_time=0.0, end_time=1.5),
+        TranscriptEntry(speaker="Alice", text="how are you", start_time=1.6, end_time=3.0),
+        TranscriptEntry(speaker="Bob", text="Fine, thanks", start_time=3661.25, end_time=3662.0),
+    ])
+    return transcript if request.param == "model" else transcript.to_columnar()
+
+
+def _render(writer, transcript, **options) -> str:
+    buf = io.StringIO()
+    writer(transcript, buf, **options)
+    return buf.getvalue()
+
+
+class TestSubtitles:
+
+    def test_srt(self, transcript):
+        assert _render(write_srt, transcript) == (
+            "1\n00:00:00,000 --> 00:00:01,500\nAlice: Hello there\n\n"
+            "2\n00:00:01,600 --> 00:00:03,000\nAlice: how are you\n\n"
+            "3\n01:01:01,250 --> 01:01:02,000\nBob: Fine, thanks\n"
+        )
+
+    def test_vtt_merged(self, transcript):
+        assert _render(write_vtt, transcript, merge_speakers=True) == (
+            "WEBVTT\n\n"
+            "00:00:00.000 --> 00:00:03.000\n<v Alice>Hello there how are you\n\n"
+            "01:01:01.250 --> 01:01:02.000\n<v Bob>Fine, thanks\n"
+        )
+
+    def test_wrapping(self, transcript):
+        out = _render(write_srt, transcript, wrap_width=8, include_speakers=False)
+        assert "Hello\nthere" in out
+
+    def test_merge_respects_gap(self):
+        rows = [("A", "x", 0.0, 1.0), ("A", "y", 5.0, 6.0), ("A", "z", 6.5, 7.0)]
+        assert list(merge_rows(rows, max_gap=1.0)) == [("A", "x", 0.0, 1.0), ("A", "y z", 5.0, 7.0)]
+
+
+class TestDataFormats:
+
+    def test_jsonl(self, transcript):
+        lines = _render(write_jsonl, transcript).splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[2]) == {
+            "index": 2, "speaker": "Bob", "start_time": 3661.25, "end_time": 3662.0,
+            "text": "Fine, thanks",
+        }
+
+    def test_csv(self, transcript):
+        rows = list(csv.reader(io.StringIO(_render(write_csv, transcript, merge_speakers=True))))
+        assert rows[0] == ["index", "start_time", "end_time", "speaker", "text"]
+        assert rows[1] == ["0", "0.0", "3.0", "Alice", "Hello there how are you"]
+        assert rows[2][4] == "Fine, thanks"
+
+
+class TestExportRecordings:
+
+    def test_exports_every_recording(self, tmp_path, transcript):
+        recordings = [
+            Recording(id=f"r{i}", title=f"Rec {i}", transcript=transcript) for i in range(5)
+        ]
+        paths = export_recordings(recordings, tmp_path / "out", format="vtt", workers=3)
+
+        assert [p.name for p in paths] == [f"r{i}.vtt" for i in range(5)]
+        assert all(p.read_text().startswith("WEBVTT") for p in paths)
+
+    def test_markdown_format(self, tmp_path, transcript):
+        recording = Recording(id="r1", title="Rec", transcript=transcript)
+        [path] = export_recordings([recording], tmp_path, format="markdown")
+        assert path.suffix == ".md"
+        assert path.read_text() == recording.to_markdown()
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            export_recordings([], tmp_path, format="docx")
+
+
+class TestExportLibrary:
+
+    @pytest.fixture
+    def store(self, tmp_path, monkeypatch, sample_transcript_data):
+        listing = [
+            FileSimple(id=f"f{i}", filename=f"Meeting {i}", start_time=1700000000000 + i,
+                       is_trans=True, is_summary=True)
+            for i in range(3)
+        ]
+        monkeypatch.setattr(utils, "_get_all_files", lambda: listing)
+        monkeypatch.setattr(utils, "_iter_details", lambda ids, listing=None, client=None: iter([[
+            FileDetail(id=i, trans_result=sample_transcript_data, ai_content=f"Summary {i}")
+            for i in ids
+        ]]))
+        db = tmp_path / "plaud.db"
+        utils.sync_recordings(db_path=db, tz=timezone.utc, details=True)
+        return db, listing
+
+    def test_renders_then_skips_unchanged(self, tmp_path, store):
+        db, _ = store
+        out = tmp_path / "out"
+
+        assert export_library(out, db_path=db) == {"rendered": 3, "unchanged": 0, "deleted": 0, "failed": 0}
+        text = (out / "f1.md").read_text()
+        assert "# Meeting 1" in text and "Summary f1" in text
+        assert export_library(out, db_path=db) == {"rendered": 0, "unchanged": 3, "deleted": 0, "failed": 0}
+
+    def test_rerenders_changed_and_deletes_trashed(self, tmp_path, store):
+        db, listing = store
+        out = tmp_path / "out"
+        export_library(out, db_path=db)
+
+        listing[0].filename = "Renamed"
+        listing[2].is_trash = True
+        utils.sync_recordings(db_path=db, tz=timezone.utc, details=True)
+
+        assert export_library(out, db_path=db) == {"rendered": 1, "unchanged": 1, "deleted": 1, "failed": 0}
+        assert (out / "f0.md").read_text().startswith("# Renamed")
+        assert not (out / "f2.md").exists()
+        assert sorted(p.name for p in out.iterdir()) == [".plaud-export.json", "f0.md", "f1.md"]
+
+    def test_format_change_replaces_files(self, tmp_path, store):
+        db, _ = store
+        out = tmp_path / "out"
+        export_library(out, db_path=db)
+
+        result = export_library(out, format="srt", db_path=db)
+        assert result == {"rendered": 3, "unchanged": 0, "deleted": 3, "failed": 0}
+        assert sorted(p.suffix for p in out.glob("f*")) == [".srt"] * 3
+
+    def test_failed_chunk_is_retried_next_run(self, tmp_path, store, monkeypatch):
+        db, _ = store
+        out = tmp_path / "out"
+        monkeypatch.setattr(export, "EXPORT_CHUNK_SIZE", 1)
+        render = export._render_chunk
+
+        def flaky(db_path, dest, file_ids, format, options):
+            if file_ids == ["f1"]:
+                raise OSError("disk full")
+            return render(db_path, dest, file_ids, format, options)
+
+        monkeypatch.setattr(export, "_render_chunk", flaky)
+        result = export_library(out, db_path=db)
+        assert result == {"rendered": 2, "unchanged": 0, "deleted": 0, "failed": 1}
+        manifest = json.loads((out / export.MANIFEST_NAME).read_text())
+        assert sorted(manifest["recordings"]) == ["f0", "f2"]
+
+        monkeypatch.setattr(export, "_render_chunk", render)
+        assert export_library(out, db_path=db) == {
+            "rendered": 1, "unchanged": 2, "deleted": 0, "failed": 0,
+        }
+
+    def test_process_pool(self, tmp_path, store, monkeypatch):
+        db, _ = store
+        monkeypatch.setattr(export, "EXPORT_CHUNK_SIZE", 1)
+        result = export_library(tmp_path / "out", format="vtt", workers=2, db_path=db)
+        assert result["rendered"] == 3
+        assert (tmp_path / "out" / "f2.vtt").read_text().startswith("WEBVTT")
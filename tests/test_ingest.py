@@ -0,0 +1,121 @@
+"""Tests for the ingest pipeline."""
+
+import json
+from concurrent.futures import Future
+from unittest.mock import MagicMock
+
+import pytest
+
+from plaudpy.exceptions import APIError
+from plaudpy.ingest import STATE_NAME, ingest
+from plaudpy.models import FileDetail, TaskStatus, UploadPresignedUrl
+
+
+def _resolved(status="success"):
+    future = Future()
+    future.set_result(TaskStatus(status=status))
+    return future
+
+
+@pytest.fixture
+def client(sample_file_detail_data):
+    client = MagicMock()
+    client.files.get_upload_url.side_effect = lambda name, **kw: UploadPresignedUrl(
+        url=f"https://storage/{name}", file_id=f"id-{name}"
+    )
+    client.uploaded = {}
+
+    def upload_part(url, data, fields=None):
+        client.uploaded[url] = data if isinstance(data, bytes) else data.read()
+        return '"etag"'
+
+    client.files.upload_part.side_effect = upload_part
+    client.files.get_details.side_effect = lambda ids: [
+        FileDetail.model_validate({**sample_file_detail_data, "id": ids[0]})
+    ]
+    client.ai.poller.watch.side_effect = lambda file_id: _resolved()
+    return client
+
+
+@pytest.fixture
+def audio(tmp_path):
+    paths = []
+    for name in ("a.mp3", "b.mp3", "c.mp3"):
+        path = tmp_path / name
+        path.write_bytes(b"audio-" + name.encode())
+        paths.append(path)
+    return paths
+
+
+class TestIngest:
+
+    def test_runs_every_stage(self, client, audio, tmp_path):
+        dest = tmp_path / "out"
+        states = ingest(client, audio, dest, language="de")
+
+        assert [s.file_id for s in states] == ["id-a.mp3", "id-b.mp3", "id-c.mp3"]
+        assert all(s.done and s.error is None for s in states)
+        assert client.uploaded["https://storage/a.mp3"] == b"audio-a.mp3"
+        client.files.confirm_upload.assert_any_call("id-a.mp3")
+        client.ai.trigger_transcription.assert_any_call("id-a.mp3", language="de")
+        output = dest / "id-a.mp3.md"
+        assert states[0].output == str(output)
+        assert "# Test Recording" in output.read_text()
+
+    def test_multipart_upload(self, client, audio, tmp_path):
+        client.files.get_upload_url.side_effect = lambda name, **kw: UploadPresignedUrl(
+            file_id="id", upload_id="up-1", part_urls=["https://p/1", "https://p/2"]
+        )
+        ingest(client, audio[:1], tmp_path / "out")
+
+        assert client.uploaded == {"https://p/1": b"audio-", "https://p/2": b"a.mp3"}
+        client.files.merge_multipart.assert_called_once_with(
+            "id",
+            upload_id="up-1",
+            parts=[{"part_number": 1, "etag": '"etag"'}, {"part_number": 2, "etag": '"etag"'}],
+        )
+
+    def test_unexpected_error_fails_file_instead_of_hanging(self, client, audio, tmp_path):
+        states = ingest(client, audio[:1], tmp_path / "out", export_options={"bogus": 1}, timeout=10)
+
+        assert states[0].stage == "fetch"
+        assert "bogus" in states[0].error
+
+    def test_failed_transcription(self, client, audio, tmp_path):
+        client.ai.poller.watch.side_effect = lambda file_id: _resolved("failed")
+        states = ingest(client, audio[:1], tmp_path / "out")
+        assert states[0].stage == "transcribe"
+        assert "failed" in states[0].error
+        client.files.get_details.assert_not_called()
+
+    def test_resumes_from_checkpoint(self, client, audio, tmp_path):
+        dest = tmp_path / "out"
+        client.ai.trigger_transcription.side_effect = [APIError("busy", 503), {}, {}]
+        first = ingest(client, audio, dest, concurrency={"transcribe": 1})
+        assert sum(1 for s in first if s.error) == 1
+
+        state = json.loads((dest / STATE_NAME).read_text())
+        assert len(state["files"]) == 3
+
+        client.files.get_upload_url.reset_mock()
+        client.ai.trigger_transcription.reset_mock(side_effect=True)
+        second = ingest(client, audio, dest)
+        assert all(s.done for s in second)
+        client.files.get_upload_url.assert_not_called()
+        assert client.ai.trigger_transcription.call_count == 1
+
+    def test_changed_file_starts_over(self, client, audio, tmp_path):
+        dest = tmp_path / "out"
+        ingest(client, audio[:1], dest)
+        audio[0].write_bytes(b"new recording content")
+        ingest(client, audio[:1], dest)
+        assert client.files.get_upload_url.call_count == 2
+
+    def test_duplicate_paths(self, client, audio, tmp_path):
+        states = ingest(client, [audio[0], audio[0]], tmp_path / "out")
+        assert len(states) == 1
+        assert client.files.get_upload_url.call_count == 1
+
+    def test_unknown_format(self, client, audio, tmp_path):
+        with pytest.raises(ValueError):
+            ingest(client, audio, tmp_path / "out", format="docx")
@@ -0,0 +1,102 @@
+"""Unit tests for batched recording lookups."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from plaudpy.exceptions import APIError
+from plaudpy.loader import RecordingLoader
+from plaudpy.models import FileDetail
+
+
+@pytest.fixture
+def files():
+    files = MagicMock()
+    files.get_details.side_effect = lambda ids: [
+        FileDetail(id=i, filename=f"Recording {i}") for i in ids if i != "missing"
+    ]
+    return files
+
+
+class TestRecordingLoader:
+
+    def test_concurrent_calls_share_one_request(self, files):
+        loader = RecordingLoader(files, window=0.05)
+        results = {}
+
+        def get(file_id):
+            results[file_id] = loader.get(file_id, timeout=5)
+
+        threads = [threading.Thread(target=get, args=(f"f{i}",)) for i in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        files.get_details.assert_called_once()
+        assert sorted(files.get_details.call_args[0][0]) == [f"f{i}" for i in range(5)]
+        assert results["f3"].title == "Recording f3"
+
+    def test_dedupes_ids(self, files):
+        loader = RecordingLoader(files, window=10)
+        a, b = loader.load("f1"), loader.load("f1")
+        assert a is b
+        loader.flush()
+        files.get_details.assert_called_once_with(["f1"])
+        assert a.result(timeout=0).id == "f1"
+
+    def test_max_batch_dispatches_immediately(self, files):
+        loader = RecordingLoader(files, window=10, max_batch=2)
+        first, second = loader.load("f1"), loader.load("f2")
+        assert first.result(timeout=5).id == "f1"
+        assert second.result(timeout=5).id == "f2"
+        third = loader.load("f3")
+        assert not third.done()
+        loader.flush()
+        assert files.get_details.call_count == 2
+
+    def test_missing_id_resolves_none(self, files):
+        loader = RecordingLoader(files, window=0)
+        assert loader.get("missing", timeout=5) is None
+
+    def test_error_reaches_every_caller(self, files):
+        files.get_details.side_effect = APIError("boom", 500)
+        loader = RecordingLoader(files, window=10)
+        futures = [loader.load("f1"), loader.load("f2")]
+        loader.flush()
+        for future in futures:
+            with pytest.raises(APIError):
+                future.result(timeout=0)
+
+    def test_async(self, files):
+        loader = RecordingLoader(files, window=0.01)
+
+        async def main():
+            return await asyncio.gather(*(loader.aget(f"f{i}") for i in range(3)))
+
+        recordings = asyncio.run(main())
+        assert [r.id for r in recordings] == ["f0", "f1", "f2"]
+        files.get_details.assert_called_once()
+
+    def test_full_batch_does_not_block_event_loop(self, files):
+        sent = threading.Event()
+        threads = []
+
+        def get_details(ids):
+            threads.append(threading.current_thread())
+            sent.wait(5)
+            return [FileDetail(id=i) for i in ids]
+
+        files.get_details.side_effect = get_details
+        loader = RecordingLoader(files, window=10, max_batch=3)
+
+        async def main():
+            lookups = asyncio.gather(*(loader.aget(f"f{i}") for i in range(3)))
+            await asyncio.sleep(0)  # the loop keeps running while the batch is sent
+            sent.set()
+            return await lookups
+
+        assert [r.id for r in asyncio.run(main())] == ["f0", "f1", "f2"]
+        assert threads and threads[0] is not threading.main_thread()
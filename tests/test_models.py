@@ -1,15 +1,18 @@
 """Unit tests for PlaudPy models."""
 
+import io
 from datetime import datetime, timezone
 
 import pytest
 
 from plaudpy.models import (
+    ColumnarTranscript,
     FileDetail,
     FileSimple,
     Recording,
     Transcript,
     TranscriptEntry,
+    diff_listings,
 )
 
 
@@ -88,6 +91,152 @@ class TestTranscript:
         assert transcript.to_markdown() == ""
 
 
+class TestStreamingWriters:
+    """Tests for write_text / write_markdown."""
+
+    @pytest.fixture
+    def recording(self, sample_file_detail_data):
+        return Recording.from_file_detail(FileDetail.model_validate(sample_file_detail_data))
+
+    def test_write_text_matches_to_text(self, recording):
+        buf = io.StringIO()
+        recording.transcript.write_text(buf, include_speakers=False)
+        assert buf.getvalue() == recording.transcript.to_text(include_speakers=False)
+
+    def test_write_markdown_in_chunks(self, recording):
+        class Recorder(io.StringIO):
+            writes = 0
+
+            def write(self, s):
+                Recorder.writes += 1
+                return super().write(s)
+
+        buf = Recorder()
+        recording.transcript.write_markdown(buf, include_timestamps=True, chunk_size=16)
+        assert buf.getvalue() == recording.transcript.to_markdown(include_timestamps=True)
+        assert Recorder.writes > 1
+
+    def test_recording_write_markdown_binary(self, recording):
+        buf = io.BytesIO()
+        recording.write_markdown(buf)
+        assert buf.getvalue().decode("utf-8") == recording.to_markdown()
+
+
+class TestColumnarTranscript:
+    """Tests for ColumnarTranscript."""
+
+    def test_from_trans_result(self, sample_transcript_data):
+        transcript = ColumnarTranscript.from_trans_result(sample_transcript_data, language="en")
+
+        assert len(transcript) == 3
+        assert transcript.speakers == ["Speaker 1", "Speaker 2"]
+        assert transcript.entries[1] == TranscriptEntry(
+            speaker="Speaker 2", text="I'm doing well, thanks!", start_time=2.5, end_time=4.0
+        )
+        assert transcript.entries[-1].text == "Great to hear."
+        assert [e.text for e in transcript.entries[:2]] == [
+            "Hello, how are you?", "I'm doing well, thanks!",
+        ]
+
+    def test_same_rendering_as_transcript(self, sample_file_detail_data):
+        detail = FileDetail.model_validate(sample_file_detail_data)
+        regular = detail.get_transcript()
+        columnar = detail.get_transcript(columnar=True)
+
+        assert isinstance(columnar, ColumnarTranscript)
+        assert columnar.to_text() == regular.to_text()
+        assert columnar.to_text(include_speakers=False) == regular.to_text(include_speakers=False)
+        assert columnar.to_markdown(include_timestamps=True) == regular.to_markdown(include_timestamps=True)
+        assert list(columnar.entries) == regular.entries
+        assert columnar == regular
+
+    def test_round_trip(self, sample_file_detail_data):
+        regular = FileDetail.model_validate(sample_file_detail_data).get_transcript()
+        assert regular.to_columnar().to_transcript() == regular
+
+    def test_entry_index_out_of_range(self):
+        transcript = ColumnarTranscript()
+        assert not transcript.entries
+        with pytest.raises(IndexError):
+            transcript.entries[0]
+
+    def test_recording_with_columnar_transcript(self, sample_file_detail_data):
+        detail = FileDetail.model_validate(sample_file_detail_data)
+        columnar = Recording.from_file_detail(detail, columnar=True)
+        regular = Recording.from_file_detail(detail)
+
+        assert isinstance(columnar.transcript, ColumnarTranscript)
+        assert columnar.to_markdown() == regular.to_markdown()
+        assert columnar.model_dump() == regular.model_dump()
+
+
+class TestTranscriptTimeIndex:
+    """Tests for time-based lookups on Transcript and ColumnarTranscript."""
+
+    @pytest.fixture(params=["model", "columnar"])
+    def transcript(self, request):
+        # Bob's entry overlaps both of Alice's; entries are not in start order
+        transcript = Transcript(entries=[
+            TranscriptEntry(speaker="Alice", text="one", start_time=0.0, end_time=10.0),
+            TranscriptEntry(speaker="Alice", text="three", start_time=12.0, end_time=15.0),
+            TranscriptEntry(speaker="Bob", text="two", start_time=8.0, end_time=13.0),
+            TranscriptEntry(speaker="Carol", text="four", start_time=30.0, end_time=31.0),
+        ])
+        return transcript if request.param == "model" else transcript.to_columnar()
+
+    def test_entry_at(self, transcript):
+        assert transcript.entry_at(5.0).text == "one"
+        assert transcript.entry_at(9.0).text == "two"  # latest start wins
+        assert transcript.entry_at(12.5).text == "three"
+        assert transcript.entry_at(10.0).text == "two"  # end is exclusive
+        assert transcript.entry_at(20.0) is None
+        assert [e.text for e in transcript.entries_at(12.5)] == ["two", "three"]
+
+    def test_slice(self, transcript):
+        part = transcript.slice(9.0, 12.0)
+        assert type(part) is type(transcript)
+        assert [e.text for e in part.entries] == ["one", "two"]
+        assert [e.text for e in transcript.slice(11.0, 40.0).entries] == ["two", "three", "four"]
+        assert len(transcript.slice(16.0, 29.0).entries) == 0
+
+    def test_window_iter(self, transcript):
+        windows = [
+            (start, end, [e.text for e in part.entries])
+            for start, end, part in transcript.window_iter(10.0)
+        ]
+        assert windows == [
+            (0.0, 10.0, ["one", "two"]),
+            (10.0, 20.0, ["two", "three"]),
+            (20.0, 30.0, []),
+            (30.0, 40.0, ["four"]),
+        ]
+        assert len(list(transcript.window_iter(10.0, step=5.0))) == 7
+
+    def test_window_iter_rejects_bad_size(self, transcript):
+        with pytest.raises(ValueError):
+            list(transcript.window_iter(0))
+
+    def test_index_rebuilt_when_entries_change(self):
+        transcript = Transcript(entries=[TranscriptEntry(text="a", start_time=0, end_time=1)])
+        assert transcript.entry_at(5.0) is None
+        transcript.entries.append(TranscriptEntry(text="b", start_time=4, end_time=6))
+        assert transcript.entry_at(5.0).text == "b"
+
+    def test_index_cleared_when_entries_reassigned(self):
+        transcript = Transcript(entries=[TranscriptEntry(text="a", start_time=0, end_time=1)])
+        assert transcript.entry_at(0.5).text == "a"
+        transcript.entries = [TranscriptEntry(text="b", start_time=0, end_time=1)]
+        assert transcript.entry_at(0.5).text == "b"
+
+    def test_equality_ignores_index(self):
+        transcript = Transcript(entries=[TranscriptEntry(text="a", start_time=0, end_time=1)])
+        copy = transcript.model_copy(deep=True)
+        transcript.entry_at(0.5)
+
+        assert transcript == copy
+        assert transcript != Transcript()
+
+
 class TestFileSimple:
     """Tests for FileSimple model."""
 
@@ -134,6 +283,29 @@ class TestFileDetail:
         assert transcript.entries[0].start_time == 0.0
         assert transcript.entries[0].end_time == 2.0
 
+    def test_get_transcript_memoized(self, sample_file_detail_data):
+        file = FileDetail.model_validate(sample_file_detail_data)
+        assert file.get_transcript() is file.get_transcript()
+
+        file.transcript_data = sample_file_detail_data["trans_result"][:1]
+        assert len(file.get_transcript().entries) == 1
+
+    def test_equality_ignores_parsed_transcripts(self, sample_file_detail_data):
+        parsed = FileDetail.model_validate(sample_file_detail_data)
+        fresh = FileDetail.model_validate(sample_file_detail_data)
+        parsed.get_transcript()
+
+        assert parsed == fresh
+        assert parsed != FileDetail(id=parsed.id)
+
+    def test_get_transcript_release(self, sample_file_detail_data):
+        file = FileDetail.model_validate(sample_file_detail_data)
+        transcript = file.get_transcript(release=True)
+
+        assert file.transcript_data is None
+        assert file.get_transcript() is transcript
+        assert file.get_transcript(columnar=True).to_text() == transcript.to_text()
+
     def test_get_transcript_empty(self):
         file = FileDetail(id="test", filename="Test")
         transcript = file.get_transcript()
@@ -154,6 +326,46 @@ class TestRecording:
         assert recording.summary == "This is a summary of the meeting."
         assert len(recording.transcript.entries) == 3
 
+    def test_transcript_parsed_lazily(self, sample_file_detail_data):
+        detail = FileDetail.model_validate(sample_file_detail_data)
+        recording = Recording.from_file_detail(detail)
+
+        assert detail._transcripts == {}
+        assert detail.transcript_data is not None
+        transcript = recording.transcript
+        assert recording.transcript is transcript
+        assert detail.transcript_data is not None
+
+    def test_release_is_opt_in(self, sample_file_detail_data):
+        detail = FileDetail.model_validate(sample_file_detail_data)
+        recording = Recording.from_file_detail(detail, release=True)
+
+        assert len(recording.transcript.entries) == 3
+        assert detail.transcript_data is None
+
+    def test_equality_ignores_parse_state(self, sample_file_detail_data):
+        detail = FileDetail.model_validate(sample_file_detail_data)
+        first = Recording.from_file_detail(detail)
+        second = Recording.from_file_detail(detail)
+        first.transcript
+
+        assert first == second
+        explicit = Recording(**second.model_dump(exclude={"transcript"}),
+                             transcript=detail.get_transcript())
+        assert explicit == Recording.from_file_detail(detail)
+        assert first != Recording(id=first.id, title=first.title)
+
+    def test_explicit_transcript(self):
+        transcript = Transcript(entries=[TranscriptEntry(speaker="A", text="Hi")])
+        recording = Recording(id="r", title="T", transcript=transcript)
+        assert recording.transcript is transcript
+
+        restored = Recording.model_validate(recording.model_dump())
+        assert restored.transcript == transcript
+
+        recording.transcript = Transcript()
+        assert recording.transcript.entries == []
+
     def test_to_markdown(self, sample_file_detail_data):
         detail = FileDetail.model_validate(sample_file_detail_data)
         recording = Recording.from_file_detail(detail)
@@ -182,3 +394,58 @@ class TestRecording:
 
         md = recording.to_markdown(include_timestamps=True)
         assert "[0.0s]" in md
+
+
+class TestListingFields:
+    """Tests for the full /file/simple/web field set and diff_listings."""
+
+    def test_parses_listing_fields(self):
+        f = FileSimple.model_validate({
+            "id": "f1", "filesize": 1024, "file_md5": "abc", "end_time": 1700000060000,
+            "scene": 1, "serial_number": "SN1", "filetag_id_list": ["t1"],
+            "keywords": ["budget", "q3"], "is_trash": True,
+        })
+        assert f.filesize == 1024
+        assert f.file_md5 == "abc"
+        assert f.filetag_id_list == ("t1",)
+        assert f.keywords == ("budget", "q3")
+        assert f.is_trash
+
+    def test_null_fields(self):
+        f = FileSimple.model_validate(
+            {"id": "f1", "keywords": None, "filetag_id_list": None, "file_md5": None}
+        )
+        assert f.keywords == ()
+        assert f.filetag_id_list == ()
+        assert f.file_md5 == ""
+
+    def test_diff_listings(self):
+        old = [
+            FileSimple(id="same", edit_time=1),
+            FileSimple(id="edited", edit_time=1),
+            FileSimple(id="retagged", filetag_id_list=["a"]),
+            FileSimple(id="renamed", filename="Old", is_trans=True),
+            FileSimple(id="transcribed"),
+            FileSimple(id="gone"),
+        ]
+        new = [
+            FileSimple(id="same", edit_time=1),
+            FileSimple(id="edited", edit_time=2, is_trans=True),
+            FileSimple(id="retagged", filetag_id_list=["a", "b"]),
+            FileSimple(id="renamed", filename="New", is_trans=True),
+            FileSimple(id="transcribed", is_trans=True),
+            FileSimple(id="fresh", is_summary=True),
+        ]
+        diff = diff_listings(old, new)
+
+        assert [f.id for f in diff.added] == ["fresh"]
+        assert [f.id for f in diff.removed] == ["gone"]
+        assert [f.id for f in diff.edited] == ["edited", "retagged", "renamed"]
+        assert [f.id for f in diff.content_edited] == ["edited"]
+        assert [f.id for f in diff.newly_transcribed] == ["edited", "transcribed"]
+        assert diff.needs_detail == ["fresh", "edited", "transcribed"]
+        assert diff
+
+    def test_no_changes(self):
+        listing = [FileSimple(id="a", edit_time=3)]
+        assert not diff_listings(listing, list(listing))
@@ -0,0 +1,76 @@
+"""Unit tests for multi-core parsing and rendering helpers."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from plaudpy.models import ColumnarTranscript, FileDetail, Recording
+from plaudpy.parallel import parallel_map, parse_recordings, render_recordings
+
+
+def _square(x):
+    return x * x
+
+
+@pytest.fixture
+def details_data(sample_file_detail_data):
+    return [
+        {**sample_file_detail_data, "id": f"f{i}", "filename": f"Recording {i}"}
+        for i in range(40)
+    ]
+
+
+class TestParallelMap:
+
+    def test_small_input_runs_sequentially(self):
+        class NoExecutor:
+            def map(self, *args):
+                raise AssertionError("should not be used")
+
+        assert parallel_map(_square, range(5), executor=NoExecutor()) == [0, 1, 4, 9, 16]
+
+    def test_process_pool_preserves_order(self):
+        assert parallel_map(_square, range(100), workers=2) == [x * x for x in range(100)]
+
+    def test_chunked_submission(self):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            calls = []
+            original_map = pool.map
+
+            def map(fn, chunks):
+                chunks = list(chunks)
+                calls.append([len(c) for c in chunks])
+                return original_map(fn, chunks)
+
+            pool.map = map
+            assert parallel_map(_square, range(100), executor=pool, chunk_size=30)[-1] == 99 * 99
+        assert calls == [[30, 30, 30, 10]]
+
+
+class TestParseAndRender:
+
+    def test_parse_recordings_in_processes(self, details_data):
+        recordings = parse_recordings(details_data, workers=2)
+
+        assert [r.id for r in recordings] == [f"f{i}" for i in range(40)]
+        assert len(recordings[7].transcript.entries) == 3
+        assert recordings[7].to_markdown() == Recording.from_file_detail(
+            FileDetail.model_validate(details_data[7])
+        ).to_markdown()
+
+    def test_parse_recordings_columnar(self, details_data):
+        recordings = parse_recordings(details_data, columnar=True, workers=2)
+        assert isinstance(recordings[0].transcript, ColumnarTranscript)
+        assert recordings[0].transcript.speakers == ["Speaker 1", "Speaker 2"]
+
+    def test_render_recordings(self, details_data):
+        recordings = parse_recordings(details_data, workers=1)
+        rendered = render_recordings(recordings, format="srt", workers=2)
+
+        assert len(rendered) == 40
+        assert rendered[0].startswith("1\n00:00:00,000 --> 00:00:02,000\n")
+        assert render_recordings(recordings[:2]) == [r.to_markdown() for r in recordings[:2]]
+
+    def test_render_unknown_format(self):
+        with pytest.raises(ValueError):
+            render_recordings([], format="pdf")
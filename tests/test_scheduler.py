@@ -0,0 +1,121 @@
+"""Tests for the transcription scheduler."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from plaudpy.exceptions import APIError
+from plaudpy.models import FileSimple
+from plaudpy.models.user import TranscriptionQuota
+from plaudpy.scheduler import TranscriptionScheduler
+
+
+def _listing():
+    return [
+        FileSimple(id="done", duration=100, is_trans=True),
+        FileSimple(id="summ", duration=100, is_summary=True),
+        FileSimple(id="short", duration=10),
+        FileSimple(id="medium", duration=50),
+        FileSimple(id="long", duration=200),
+    ]
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.files.list_simple.return_value = _listing()
+    client.users.get_transcription_quota.return_value = TranscriptionQuota(remaining=100)
+    return client
+
+
+class TestPlan:
+
+    def test_drops_done_and_unknown(self, client):
+        plan = TranscriptionScheduler(client).plan(["done", "summ", "short", "ghost"])
+        assert plan.already_done == ["done", "summ"]
+        assert plan.unknown == ["ghost"]
+        assert plan.to_submit == ["short"]
+
+    def test_orders_by_priority_then_duration_within_budget(self, client):
+        plan = TranscriptionScheduler(client).plan(
+            ["long", "medium", "short"], priorities={"medium": 5}
+        )
+        assert plan.to_submit == ["medium", "short"]
+        assert plan.over_budget == ["long"]
+        assert plan.budget == 100
+        assert plan.planned_cost == 60
+
+    def test_unreported_quota_is_unlimited(self, client):
+        client.users.get_transcription_quota.return_value = TranscriptionQuota()
+        plan = TranscriptionScheduler(client).plan(["long", "short"])
+        assert plan.to_submit == ["short", "long"]
+        assert plan.over_budget == []
+
+    def test_explicit_budget_and_listing(self, client):
+        plan = TranscriptionScheduler(client).plan(
+            ["short", "medium"], budget=20, listing=_listing()
+        )
+        assert plan.to_submit == ["short"]
+        client.files.list_simple.assert_not_called()
+        client.users.get_transcription_quota.assert_not_called()
+
+
+class TestRun:
+
+    def test_submits_with_trigger_options(self, client):
+        scheduler = TranscriptionScheduler(client, language="de")
+        run = scheduler.run(["short", "medium"])
+        assert run.submitted == ["short", "medium"]
+        client.ai.trigger_transcription.assert_any_call("short", language="de")
+        assert client.ai.trigger_transcription.call_count == 2
+
+    def test_no_double_trigger(self, client):
+        scheduler = TranscriptionScheduler(client)
+        scheduler.run(["short"])
+        run = scheduler.run(["short"])
+        assert run.submitted == []
+        assert run.recently_triggered == ["short"]
+        assert client.ai.trigger_transcription.call_count == 1
+
+    def test_concurrent_runs_trigger_once(self, client):
+        scheduler = TranscriptionScheduler(client)
+        threads = [threading.Thread(target=scheduler.run, args=(["short"],)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert client.ai.trigger_transcription.call_count == 1
+
+    def test_failed_trigger_can_be_retried(self, client, tmp_path):
+        db_path = tmp_path / "plaud.db"
+        client.ai.trigger_transcription.side_effect = [APIError("boom", 500), {}]
+        scheduler = TranscriptionScheduler(client, db_path=db_path)
+        run = scheduler.run(["short"])
+        assert run.failed == {"short": "boom"}
+        assert scheduler.run(["short"]).submitted == ["short"]
+
+    def test_journal_survives_restart(self, client, tmp_path):
+        db_path = tmp_path / "plaud.db"
+        TranscriptionScheduler(client, db_path=db_path).run(["short"])
+        run = TranscriptionScheduler(client, db_path=db_path).run(["short"])
+        assert run.recently_triggered == ["short"]
+        assert client.ai.trigger_transcription.call_count == 1
+
+    def test_claim_is_shared_across_schedulers(self, client, tmp_path):
+        db_path = tmp_path / "plaud.db"
+        first = TranscriptionScheduler(client, db_path=db_path)
+        second = TranscriptionScheduler(client, db_path=db_path)
+        assert first.run(["short"]).submitted == ["short"]
+        assert second.plan(["short"]).recently_triggered == ["short"]
+
+        # A plan made before the other scheduler's claim still loses the claim
+        second._journal = lambda file_ids: {}
+        run = second.run(["short", "medium"])
+        assert run.submitted == ["medium"]
+        assert run.to_submit == ["medium"]
+        assert run.recently_triggered == ["short"]
+        assert run.planned_cost == 50
+        assert [c.args[0] for c in client.ai.trigger_transcription.call_args_list] == [
+            "short", "medium",
+        ]
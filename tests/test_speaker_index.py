@@ -0,0 +1,98 @@
+"""Unit tests for the local speaker-embedding index."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from plaudpy import speaker_index
+from plaudpy.models import Speaker
+from plaudpy.speaker_index import SpeakerIndex, embedding_from_response, extract_embeddings
+
+
+def _profiles():
+    return [Speaker(id="s1", name="Alice"), Speaker(id="s2", name="Bob"), Speaker(id="s3", name="Eve")]
+
+
+def _embeddings():
+    return np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float32)
+
+
+class TestEmbeddingFromResponse:
+
+    @pytest.mark.parametrize("payload", [
+        {"embedding": [1.0, 2.0]},
+        {"data": {"embedding": [1.0, 2.0]}},
+        {"data": [1.0, 2.0]},
+    ])
+    def test_shapes(self, payload):
+        assert embedding_from_response(payload) == [1.0, 2.0]
+
+    def test_missing(self):
+        with pytest.raises(ValueError):
+            embedding_from_response({"status": "ok"})
+
+
+class TestExtractEmbeddings:
+
+    def test_batched_in_order(self):
+        ai = MagicMock()
+        ai.extract_speaker_embedding.side_effect = lambda file_id, **kw: {"embedding": [float(file_id), 1.0]}
+        vectors = extract_embeddings(ai, [{"file_id": str(i)} for i in range(10)], workers=3)
+        assert vectors.shape == (10, 2)
+        assert vectors.dtype == np.float32
+        assert vectors[:, 0].tolist() == list(range(10))
+
+
+class TestSpeakerIndex:
+
+    def test_search_top_k(self, tmp_path):
+        index = SpeakerIndex(tmp_path / "idx")
+        index.add_profiles(_profiles(), _embeddings() * 5)  # stored normalized
+
+        hits = index.search([[0.9, 0.1, 0.0]], k=2)[0]
+        assert [label["name"] for label, _ in hits] == ["Alice", "Bob"]
+        assert hits[0][1] == pytest.approx(0.9 / np.hypot(0.9, 0.1))
+
+    def test_persisted_and_memory_mapped(self, tmp_path):
+        SpeakerIndex(tmp_path / "idx").add_profiles(_profiles(), _embeddings())
+
+        reopened = SpeakerIndex(tmp_path / "idx")
+        assert len(reopened) == 3
+        assert reopened.dim == 3
+        assert isinstance(reopened._vectors, np.memmap)
+        assert reopened.match([[0, 0, 2]])[0]["speaker_id"] == "s3"
+
+    def test_incremental_growth(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(speaker_index, "INITIAL_CAPACITY", 2)
+        index = SpeakerIndex(tmp_path / "idx")
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(9, 4))
+        for i, v in enumerate(vectors):
+            index.add(v, [{"speaker_id": str(i)}])
+
+        assert len(index) == 9
+        assert len(index._vectors) == 16
+        matches = SpeakerIndex(tmp_path / "idx").match(vectors, threshold=0.99)
+        assert [m["speaker_id"] for m in matches] == [str(i) for i in range(9)]
+
+    def test_match_threshold_and_live_profiles(self, tmp_path):
+        index = SpeakerIndex(tmp_path / "idx")
+        index.add_profiles(_profiles(), _embeddings())
+        queries = [[1, 0.2, 0], [0.5, 0.5, 0.5]]
+
+        assert [m and m["name"] for m in index.match(queries, threshold=0.9)] == ["Alice", None]
+        live = [Speaker(id="s2", name="Bob")]
+        assert index.match(queries, threshold=0.1, speakers=live)[0]["name"] == "Bob"
+
+    def test_dimension_mismatch(self, tmp_path):
+        index = SpeakerIndex(tmp_path / "idx")
+        index.add_profiles(_profiles(), _embeddings())
+        with pytest.raises(ValueError):
+            index.add([[1.0, 2.0]], [{}])
+
+    def test_empty_index(self, tmp_path):
+        index = SpeakerIndex(tmp_path / "idx")
+        assert index.search([[1.0, 0.0]]) == [[]]
+        assert index.match([[1.0, 0.0]]) == [None]
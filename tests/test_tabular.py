@@ -0,0 +1,107 @@
+"""Unit tests for the columnar recordings export."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from plaudpy import tabular, utils
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "plaud.db"
+    conn = utils.get_db(path)
+    rows = [
+        ("r1", "Standup", 600, 1700000000000, "2023-11-14T22:13:20+00:00", 22, 1, "Tuesday", 0),
+        ("r2", "Planning", 1800, 1700036000000, "2023-11-15T08:13:20+00:00", 8, 2, "Wednesday", 0),
+        ("r3", "Review", 3600, 1702000000000, "2023-12-08T01:46:40+00:00", 1, 4, "Friday", 0),
+        ("r4", "Undated", 120, 0, None, None, None, None, 0),
+    ]
+    conn.executemany(
+        """INSERT INTO recordings
+               (id, filename, duration, start_time_ms, local_datetime, hour,
+                weekday, weekday_name, is_working_hours, synced_at)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, '2024-01-01')""",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def pa():
+    return pytest.importorskip("pyarrow")
+
+
+class TestNumpy:
+
+    def test_dtype_follows_schema(self, db_path):
+        arr = tabular.to_numpy(db_path)
+
+        assert arr.dtype["duration"] == np.int64
+        assert arr.dtype["filename"] == object
+        assert list(arr.dtype.names)[:3] == ["id", "filename", "duration"]
+        assert list(arr["id"]) == ["r4", "r1", "r2", "r3"]  # by start time
+
+    def test_nulls(self, db_path):
+        arr = tabular.to_numpy(db_path, columns=["id", "hour", "local_datetime"])
+
+        undated = arr[arr["id"] == "r4"][0]
+        assert undated["hour"] == tabular.INT_NULL
+        assert undated["local_datetime"] is None
+
+    def test_batches(self, db_path):
+        batches = list(tabular.iter_numpy_batches(db_path, columns=["id", "duration"], batch_size=3))
+
+        assert [len(b) for b in batches] == [3, 1]
+        assert np.concatenate(batches)["duration"].sum() == 6120
+
+    def test_empty_and_unknown_column(self, tmp_path):
+        arr = tabular.to_numpy(tmp_path / "empty.db", columns=["id", "duration"])
+        assert arr.shape == (0,)
+        assert arr.dtype.names == ("id", "duration")
+
+        with pytest.raises(ValueError, match="nope"):
+            tabular.to_numpy(tmp_path / "empty.db", columns=["nope"])
+
+
+class TestArrow:
+
+    def test_to_arrow(self, db_path, pa):
+        table = tabular.to_arrow(db_path, batch_size=2)
+
+        assert table.num_rows == 4
+        assert table.schema.field("duration").type == pa.int64()
+        assert table.schema.field("filename").type == pa.string()
+        assert table.column("hour").null_count == 1
+
+    def test_empty(self, tmp_path, pa):
+        table = tabular.to_arrow(tmp_path / "empty.db", columns=["id"])
+        assert table.num_rows == 0
+        assert table.column_names == ["id"]
+
+    def test_write_parquet_partitions_by_month(self, db_path, tmp_path, pa):
+        import pyarrow.parquet as pq
+
+        dest = tmp_path / "parquet"
+        written = tabular.write_parquet(dest, db_path, batch_size=1)
+
+        assert [p.parent.name for p in written] == [
+            "month=2023-11", "month=2023-12", f"month={tabular.NULL_PARTITION}",
+        ]
+        november = pq.read_table(dest / "month=2023-11" / "part-0.parquet")
+        assert november.column("id").to_pylist() == ["r1", "r2"]
+
+    def test_write_parquet_removes_stale_months(self, db_path, tmp_path, pa):
+        dest = tmp_path / "parquet"
+        tabular.write_parquet(dest, db_path)
+
+        conn = utils.get_db(db_path)
+        conn.execute("DELETE FROM recordings WHERE id = 'r3'")
+        conn.commit()
+        conn.close()
+        tabular.write_parquet(dest, db_path)
+
+        assert not (dest / "month=2023-12").exists()
+        assert (dest / "month=2023-11" / "part-0.parquet").exists()
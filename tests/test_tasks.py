@@ -0,0 +1,158 @@
+"""Tests for the shared task-status poller."""
+
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from plaudpy.api.ai import AIAPI
+from plaudpy.config import PlaudConfig
+from plaudpy.exceptions import APIError, AuthenticationError
+from plaudpy.models import FileSimple
+from plaudpy.tasks import TaskPoller, parse_task_statuses
+
+
+@pytest.fixture
+def ai_api():
+    config = PlaudConfig(username="test", password="test")
+    api = AIAPI(config, MagicMock(spec=httpx.Client))
+    api.get_file_task_status = MagicMock(return_value={"data": []})
+    return api
+
+
+def _poller(ai_api, **kwargs):
+    kwargs.setdefault("min_interval", 0.01)
+    kwargs.setdefault("max_interval", 0.02)
+    poller = TaskPoller(ai_api, **kwargs)
+    ai_api.poller = poller
+    return poller
+
+
+class TestParseTaskStatuses:
+
+    def test_list_in_data_envelope(self):
+        statuses = parse_task_statuses(
+            {"data": [{"file_id": "a", "status": "success"}, {"status": "orphan"}]}
+        )
+        assert list(statuses) == ["a"]
+        assert statuses["a"].status == "success"
+
+    def test_dict_keyed_by_file_id(self):
+        statuses = parse_task_statuses({"a": {"task_status": 1, "progress": 0.5}, "b": "failed"})
+        assert statuses["a"].status == "1"
+        assert statuses["a"].progress == 0.5
+        assert statuses["b"].status == "failed"
+
+    def test_unexpected_payload(self):
+        assert parse_task_statuses(None) == {}
+
+
+class TestTaskPoller:
+
+    def test_one_request_serves_all_waiters(self, ai_api):
+        poller = TaskPoller(ai_api)
+        fa, fb = Future(), Future()
+        poller._futures = {"a": fa, "b": fb}  # drive rounds by hand, no thread
+        ai_api.get_file_task_status.reset_mock()
+        ai_api.get_file_task_status.return_value = [
+            {"file_id": "a", "status": "success"},
+            {"file_id": "b", "status": "processing"},
+        ]
+        assert poller.poll_once() == 1
+        assert ai_api.get_file_task_status.call_count == 1
+        assert fa.result(timeout=0).status == "success"
+        assert not fb.done()
+        assert poller.pending == ["b"]
+
+    def test_wait_for(self, ai_api):
+        _poller(ai_api)
+        ai_api.get_file_task_status.return_value = [{"file_id": "a", "status": "completed"}]
+        status = ai_api.wait_for("a", timeout=5)
+        assert status.file_id == "a"
+        assert status.status == "completed"
+
+    def test_shared_future(self, ai_api):
+        poller = _poller(ai_api)
+        ai_api.get_file_task_status.return_value = []
+        assert poller.watch("a") is poller.watch("a")
+        poller.close()
+
+    def test_wait_for_timeout(self, ai_api):
+        poller = _poller(ai_api)
+        ai_api.get_file_task_status.return_value = [{"file_id": "a", "status": "processing"}]
+        with pytest.raises(FutureTimeoutError):
+            ai_api.wait_for("a", timeout=0.05)
+        assert poller.pending == ["a"]
+        poller.close()
+
+    def test_confirms_unreported_files_from_listing(self, ai_api):
+        files = MagicMock()
+        files.list_simple.return_value = [FileSimple(id="a", is_trans=True)]
+        poller = _poller(ai_api, files=files, confirm_every=1)
+        ai_api.get_file_task_status.return_value = []
+        assert ai_api.wait_for("a", timeout=5).status == "success"
+
+    def test_poll_errors_back_off(self, ai_api):
+        poller = _poller(ai_api)
+        ai_api.get_file_task_status.side_effect = [
+            APIError("busy", 503),
+            [{"file_id": "a", "status": "done"}],
+        ]
+        assert poller.wait_for("a", timeout=5).status == "done"
+
+    def test_repeated_poll_errors_fail_waiters(self, ai_api):
+        poller = _poller(ai_api, max_failures=3)
+        ai_api.get_file_task_status.side_effect = APIError("busy", 503)
+        with pytest.raises(APIError, match="busy"):
+            poller.wait_for("a", timeout=5)
+        assert ai_api.get_file_task_status.call_count == 3
+        assert poller.pending == []
+
+    def test_auth_error_fails_waiters_at_once(self, ai_api):
+        poller = _poller(ai_api)
+        ai_api.get_file_task_status.side_effect = AuthenticationError("expired")
+        with pytest.raises(AuthenticationError):
+            poller.wait_for("a", timeout=5)
+        assert ai_api.get_file_task_status.call_count == 1
+
+    def test_adaptive_interval(self, ai_api):
+        poller = TaskPoller(ai_api, min_interval=1, max_interval=4, backoff=2)
+        poller._futures = {"a": Future()}
+        results = iter([0, 0, 0, 1, 0])
+        intervals: list[float] = []
+
+        def poll_once(confirm=False):
+            resolved = next(results, None)
+            if resolved is None:
+                poller._futures.clear()
+                return 0
+            return resolved
+
+        poller.poll_once = poll_once
+        poller._wake.wait = intervals.append
+        poller._run()
+        assert intervals == [2, 4, 4, 1, 2, 4]
+
+    def test_completions(self, ai_api):
+        _poller(ai_api)
+        ai_api.get_file_task_status.side_effect = lambda: [
+            {"file_id": "a", "status": "success"},
+            {"file_id": "b", "status": "failed"},
+        ]
+
+        async def collect():
+            return [s.file_id async for s in ai_api.completions(["a", "b", "a"])]
+
+        assert sorted(asyncio.run(collect())) == ["a", "b"]
+
+    def test_close_cancels_waiters(self, ai_api):
+        poller = _poller(ai_api)
+        ai_api.get_file_task_status.return_value = []
+        future = poller.watch("a")
+        poller.close()
+        assert future.cancelled()
+        with pytest.raises(RuntimeError):
+            poller.watch("b")
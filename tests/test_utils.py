@@ -0,0 +1,599 @@
+"""Unit tests for the local SQLite helpers in plaudpy.utils."""
+
+import sqlite3
+from datetime import timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from plaudpy import utils
+from plaudpy.exceptions import APIError
+from plaudpy.models import FileDetail, FileSimple, FileTag
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "plaud.db"
+    conn = utils.get_db(path)
+    rows = [
+        ("r1", "Standup", 600, 1700000000000, "2023-11-14T22:13:20+00:00", 22, 1, "Tuesday", 0),
+        ("r2", "Planning", 1800, 1700036000000, "2023-11-15T08:13:20+00:00", 8, 2, "Wednesday", 0),
+        ("r3", "Review", 3600, 1700046000000, "2023-11-15T11:00:00+00:00", 11, 2, "Wednesday", 1),
+        ("r4", "Weekend", 120, 1700300000000, "2023-11-18T09:33:20+00:00", 9, 5, "Saturday", 0),
+    ]
+    conn.executemany(
+        """INSERT INTO recordings
+               (id, filename, duration, start_time_ms, local_datetime, hour,
+                weekday, weekday_name, is_working_hours, synced_at)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, '2024-01-01')""",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def traced_sql(monkeypatch):
+    """Capture every statement the helpers execute against the DB."""
+    statements: list[str] = []
+    original_get_db = utils.get_db
+
+    def get_db(db_path=None):
+        conn = original_get_db(db_path)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(utils, "get_db", get_db)
+    return statements
+
+
+def _plan(db_path, sql: str) -> list[str]:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return [r[3] for r in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+    finally:
+        conn.close()
+
+
+class TestIndexes:
+
+    def test_indexes_created_and_versioned(self, db_path):
+        conn = utils.get_db(db_path)
+        try:
+            names = {
+                r["name"]
+                for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+            }
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            conn.close()
+        assert set(utils._INDEXES) <= names
+        assert version == utils._INDEX_VERSION
+
+    def test_stale_indexes_dropped_on_version_bump(self, db_path, monkeypatch):
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE INDEX idx_recordings_obsolete ON recordings (filename)")
+        conn.execute("PRAGMA user_version = 0")
+        conn.commit()
+        conn.close()
+
+        conn = utils.get_db(db_path)
+        try:
+            names = {r["name"] for r in conn.execute("SELECT name FROM sqlite_master")}
+        finally:
+            conn.close()
+        assert "idx_recordings_obsolete" not in names
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            lambda p: utils.count_recordings_during_hours(9, 18, db_path=p),
+            lambda p: utils.count_recordings_during_hours(0, 24, weekdays_only=False, db_path=p),
+            lambda p: utils.recordings_by_weekday(db_path=p),
+            lambda p: utils.recordings_by_hour(db_path=p),
+            lambda p: utils.recordings_by_directory(db_path=p),
+            lambda p: utils.assign_directory("Work", working_hours_only=True, after="2023-11-01", db_path=p),
+            lambda p: utils.assign_directory("Work", weekdays_only=True, db_path=p),
+            lambda p: utils.assign_directory("Nov", after="2023-11-01", before="2023-12-01", db_path=p),
+        ],
+    )
+    def test_helpers_never_scan_table(self, db_path, traced_sql, call):
+        call(db_path)
+        queries = [
+            s for s in traced_sql
+            if s.lstrip().upper().startswith(("SELECT", "UPDATE")) and "recordings" in s
+        ]
+        assert queries
+        for sql in queries:
+            for detail in _plan(db_path, sql):
+                if detail.startswith("SCAN recordings"):
+                    assert "COVERING INDEX" in detail, (sql, detail)
+                if detail.startswith("SEARCH recordings"):
+                    assert "INDEX" in detail, (sql, detail)
+
+
+class TestQueryHelpers:
+
+    def test_count_recordings_during_hours(self, db_path):
+        assert utils.count_recordings_during_hours(9, 18, db_path=db_path) == 1
+        assert utils.count_recordings_during_hours(9, 18, weekdays_only=False, db_path=db_path) == 2
+
+    def test_recordings_by_weekday(self, db_path):
+        result = utils.recordings_by_weekday(db_path=db_path)
+        assert [r["weekday_name"] for r in result] == ["Tuesday", "Wednesday", "Saturday"]
+        assert [r["count"] for r in result] == [1, 2, 1]
+
+    def test_recordings_by_hour(self, db_path):
+        result = utils.recordings_by_hour(db_path=db_path)
+        assert [r["hour"] for r in result] == [8, 9, 11, 22]
+
+    def test_assign_directory(self, db_path):
+        assert utils.assign_directory("Work", working_hours_only=True, db_path=db_path) == 1
+        result = {r["directory"]: r["count"] for r in utils.recordings_by_directory(db_path=db_path)}
+        assert result == {"(unassigned)": 3, "Work": 1}
+
+
+class TestDetailStore:
+
+    @pytest.fixture
+    def listing(self):
+        return [
+            FileSimple(id="f1", filename="One", duration=60, start_time=1700000000000,
+                       edit_time=100, is_trans=True, is_summary=True),
+            FileSimple(id="f2", filename="Two", duration=30, start_time=1700100000000,
+                       edit_time=200),
+        ]
+
+    @pytest.fixture
+    def fake_api(self, monkeypatch, listing, sample_transcript_data):
+        calls: list[list[str]] = []
+
+        def iter_details(file_ids, listing=None, client=None):
+            calls.append(list(file_ids))
+            for fid in file_ids:
+                yield [FileDetail(id=fid, trans_result=sample_transcript_data,
+                                  ai_content="Summary", language="en")]
+
+        monkeypatch.setattr(utils, "_get_all_files", lambda: listing)
+        monkeypatch.setattr(utils, "_iter_details", iter_details)
+        return calls
+
+    def test_sync_details_persists_segments_and_summary(self, tmp_path, fake_api):
+        db = tmp_path / "plaud.db"
+        utils.sync_recordings(db_path=db, tz=timezone.utc, details=True)
+
+        assert fake_api == [["f1"]]
+        transcript = utils.get_local_transcript("f1", db_path=db)
+        assert len(transcript.entries) == 3
+        assert transcript.entries[1].speaker == "Speaker 2"
+        assert transcript.entries[1].start_time == 2.5
+        assert transcript.language == "en"
+        assert utils.get_local_summary("f1", db_path=db) == "Summary"
+        assert utils.get_local_summary("f2", db_path=db) is None
+
+        recording = utils.get_local_recording("f1", db_path=db)
+        assert recording.title == "One"
+        assert recording.summary == "Summary"
+        assert len(recording.transcript.entries) == 3
+        assert utils.get_local_recording("missing", db_path=db) is None
+
+    def test_unchanged_listing_skips_fetch(self, tmp_path, fake_api):
+        db = tmp_path / "plaud.db"
+        utils.sync_recordings(db_path=db, tz=timezone.utc, details=True)
+        utils.sync_recordings(db_path=db, tz=timezone.utc, details=True)
+        assert fake_api == [["f1"]]
+
+    def test_changed_flags_trigger_refetch(self, tmp_path, fake_api, listing):
+        db = tmp_path / "plaud.db"
+        utils.sync_recordings(db_path=db, tz=timezone.utc, details=True)
+        listing[1].is_trans = True
+        listing[1].edit_time = 300
+        utils.sync_recordings(db_path=db, tz=timezone.utc, details=True)
+
+        assert fake_api == [["f1"], ["f2"]]
+        assert len(utils.get_local_transcript("f2", db_path=db).entries) == 3
+
+    def test_unchanged_content_not_rewritten(self, tmp_path, fake_api, listing):
+        db = tmp_path / "plaud.db"
+        utils.sync_recordings(db_path=db, tz=timezone.utc, details=True)
+        conn = utils.get_db(db)
+        before = [r["id"] for r in conn.execute("SELECT id FROM transcript_segments")]
+        conn.close()
+
+        listing[0].edit_time = 101
+        utils.sync_recordings(db_path=db, tz=timezone.utc, details=True)
+
+        conn = utils.get_db(db)
+        after = [r["id"] for r in conn.execute("SELECT id FROM transcript_segments")]
+        conn.close()
+        assert fake_api == [["f1"], ["f1"]]
+        assert before == after
+
+    def test_interrupted_sync_keeps_stored_chunks(self, tmp_path, fake_api, listing, monkeypatch):
+        db = tmp_path / "plaud.db"
+        for f in listing:
+            f.is_trans = True
+        stored = utils._iter_details
+
+        def failing(file_ids, listing=None, client=None):
+            chunks = stored(file_ids, listing, client)
+            yield next(chunks)
+            raise ConnectionError("dropped")
+
+        monkeypatch.setattr(utils, "_iter_details", failing)
+        with pytest.raises(ConnectionError):
+            utils.sync_recordings(db_path=db, tz=timezone.utc, details=True)
+        assert len(utils.get_local_transcript("f1", db_path=db).entries) == 3
+
+        monkeypatch.setattr(utils, "_iter_details", stored)
+        utils.sync_recordings(db_path=db, tz=timezone.utc, details=True)
+        assert fake_api == [["f1", "f2"], ["f2"]]
+
+
+class TestSearchLocal:
+
+    @pytest.fixture
+    def db(self, tmp_path, monkeypatch):
+        listing = [
+            FileSimple(id="f1", filename="Budget review", start_time=1700000000000,
+                       is_trans=True, is_summary=True, filetag_id_list=["t-fin"]),
+            FileSimple(id="f2", filename="Hiring sync", start_time=1700600000000,
+                       is_trans=True),
+        ]
+        details = {
+            "f1": FileDetail(
+                id="f1",
+                trans_result=[
+                    {"speaker": "Alice", "content": "The budget is over by ten percent",
+                     "start_time": 1000, "end_time": 4000},
+                    {"speaker": "Bob", "content": "We should trim the travel budget",
+                     "start_time": 5000, "end_time": 9000},
+                ],
+                ai_content="Discussed budget overrun and travel cuts.",
+            ),
+            "f2": FileDetail(
+                id="f2",
+                trans_result=[
+                    {"speaker": "Alice", "content": "Two engineering candidates this week",
+                     "start_time": 0, "end_time": 3000},
+                ],
+            ),
+        }
+        monkeypatch.setattr(utils, "_get_all_files", lambda: listing)
+        monkeypatch.setattr(utils, "_iter_details",
+                            lambda ids, listing=None, client=None: iter([[details[i] for i in ids]]))
+        path = tmp_path / "plaud.db"
+        utils.sync_recordings(db_path=path, tz=timezone.utc, details=True)
+        return path, listing
+
+    def test_ranked_hits_from_all_sources(self, db):
+        path, _ = db
+        hits = utils.search_local("budget", db_path=path)
+
+        assert {h["kind"] for h in hits} == {"segment", "summary", "title"}
+        assert all(h["recording_id"] == "f1" for h in hits)
+        assert all("**budget**" in h["snippet"].lower() for h in hits)
+        assert hits == sorted(hits, key=lambda h: h["score"])
+        segment = next(h for h in hits if h["kind"] == "segment" and h["speaker"] == "Bob")
+        assert (segment["start_time"], segment["end_time"]) == (5.0, 9.0)
+
+    def test_speaker_filter(self, db):
+        path, _ = db
+        hits = utils.search_local("budget", speaker="Alice", db_path=path)
+        assert [(h["kind"], h["speaker"]) for h in hits] == [("segment", "Alice")]
+
+    def test_date_tag_and_directory_filters(self, db):
+        path, _ = db
+        assert utils.search_local("budget", after="2023-11-20", db_path=path) == []
+        assert utils.search_local("candidates", tag_id="t-fin", db_path=path) == []
+        assert len(utils.search_local("budget", tag_id="t-fin", db_path=path)) == 4
+
+        utils.assign_directory("Hiring", after="2023-11-20", db_path=path)
+        hits = utils.search_local("candidates", directory="Hiring", db_path=path)
+        assert [h["recording_id"] for h in hits] == ["f2"]
+
+    def test_index_follows_syncs(self, db):
+        path, listing = db
+        listing[1].filename = "Quarterly budget planning"
+        utils.sync_recordings(db_path=path, tz=timezone.utc, details=True)
+
+        hits = utils.search_local("quarterly", db_path=path)
+        assert [(h["kind"], h["recording_id"]) for h in hits] == [("title", "f2")]
+        assert utils.search_local("hiring", sources=("title",), db_path=path) == []
+
+    def test_free_text_is_escaped(self, db):
+        path, _ = db
+        hits = utils.search_local('budget: "over', db_path=path)
+        assert [(h["kind"], h["speaker"]) for h in hits] == [("segment", "Alice")]
+        assert utils.search_local("   ", db_path=path) == []
+        assert utils.search_local("budg*", raw=True, sources=("title",), db_path=path)
+
+    def test_backfills_existing_database(self, db):
+        path, _ = db
+        conn = sqlite3.connect(str(path))
+        conn.executescript(
+            "DROP TABLE titles_fts; DROP TABLE segments_fts; DROP TABLE summaries_fts;"
+        )
+        conn.close()
+        assert len(utils.search_local("budget", db_path=path)) == 4
+
+
+class TestApplyTag:
+
+    @pytest.fixture
+    def plaud(self, monkeypatch):
+        """Fake PlaudClient recording every API call."""
+        client = MagicMock()
+        client.__enter__.return_value = client
+        client.tags.list_tags.return_value = [FileTag(id="t-old", name="Old")]
+        client.tags.create_tag.side_effect = lambda name: FileTag(id="t-new", name=name)
+        factory = MagicMock(return_value=client)
+        monkeypatch.setattr(utils, "PlaudClient", factory)
+        return client, factory
+
+    def test_creates_tag_and_tags_missing_files(self, db_path, plaud):
+        client, _ = plaud
+        tagged = utils.apply_tag("Work", ["r1", "r2", "r2"], db_path=db_path)
+
+        assert tagged == ["r1", "r2"]
+        client.tags.create_tag.assert_called_once_with("Work")
+        client.files.update_tags.assert_called_once_with(["r1", "r2"], "t-new")
+        assert utils.tag_ids_by_name(db_path) == {"Old": "t-old", "Work": "t-new"}
+        assert utils.tagged_recordings("t-new", db_path) == ["r1", "r2"]
+
+    def test_rerun_makes_no_api_calls(self, db_path, plaud):
+        _, factory = plaud
+        utils.apply_tag("Work", ["r1", "r2"], db_path=db_path)
+        factory.reset_mock()
+
+        assert utils.apply_tag("Work", ["r2", "r1"], db_path=db_path) == []
+        factory.assert_not_called()
+
+    def test_only_missing_files_sent_in_chunks(self, db_path, plaud):
+        client, _ = plaud
+        conn = utils.get_db(db_path)
+        conn.execute("INSERT INTO recording_tags (tag_id, recording_id) VALUES ('t-old', 'r2')")
+        conn.commit()
+        conn.close()
+
+        tagged = utils.apply_tag("Old", ["r1", "r2", "r3", "r4"], db_path=db_path, chunk_size=2)
+
+        assert tagged == ["r1", "r3", "r4"]
+        client.tags.create_tag.assert_not_called()
+        sent = sorted(c.args[0] for c in client.files.update_tags.call_args_list)
+        assert sent == [["r1", "r3"], ["r4"]]
+
+    def test_unknown_cached_tag_refreshes_and_retries(self, db_path, plaud):
+        client, factory = plaud
+        utils.apply_tag("Work", ["r1"], db_path=db_path)
+        # "Work" was deleted and recreated on Plaud under a new ID
+        client.tags.list_tags.return_value = [FileTag(id="t-work2", name="Work")]
+        client.files.update_tags.reset_mock()
+
+        def update_tags(file_ids, tag_id):
+            if tag_id != "t-work2":
+                raise APIError("Tag not found", 404)
+            return {}
+
+        client.files.update_tags.side_effect = update_tags
+
+        assert utils.apply_tag("Work", ["r1", "r2"], db_path=db_path) == ["r1", "r2"]
+        assert [c.args for c in client.files.update_tags.call_args_list] == [
+            (["r2"], "t-new"), (["r1", "r2"], "t-work2"),
+        ]
+        assert utils.tag_ids_by_name(db_path) == {"Work": "t-work2"}
+        assert utils.tagged_recordings("t-new", db_path) == []
+        assert utils.tagged_recordings("t-work2", db_path) == ["r1", "r2"]
+
+    def test_other_tag_errors_are_not_retried(self, db_path, plaud):
+        client, _ = plaud
+        client.files.update_tags.side_effect = APIError("busy", 503)
+        with pytest.raises(APIError):
+            utils.apply_tag("Work", ["r1"], db_path=db_path)
+        assert client.files.update_tags.call_count == 1
+
+    def test_assign_directory_and_tag_is_idempotent(self, db_path, plaud):
+        client, factory = plaud
+        first = utils.assign_directory_and_tag("Work", working_hours_only=True, db_path=db_path)
+        assert first == {"db_updated": 1, "api_tagged": 1}
+        factory.reset_mock()
+
+        second = utils.assign_directory_and_tag("Work", working_hours_only=True, db_path=db_path)
+        assert second == {"db_updated": 1, "api_tagged": 0}
+        factory.assert_not_called()
+
+
+class TestDirectoryRules:
+
+    def test_first_matching_rule_wins(self, db_path):
+        report = utils.apply_directory_rules(
+            [
+                {"directory": "Deep work", "working_hours_only": True, "min_duration": 3000},
+                {"directory": "Meetings", "keywords": ["plan", "stand"]},
+                {"directory": "Weekend", "weekdays": [5, 6]},
+                {"directory": "Rest"},
+            ],
+            db_path=db_path,
+        )
+
+        assert [(r["directory"], r["matched"]) for r in report] == [
+            ("Deep work", 1), ("Meetings", 2), ("Weekend", 1), ("Rest", 0),
+        ]
+        result = {r["directory"]: r["count"] for r in utils.recordings_by_directory(db_path=db_path)}
+        assert result == {"Deep work": 1, "Meetings": 2, "Weekend": 1}
+
+    def test_hours_window_and_rerun_writes_nothing(self, db_path):
+        rules = [{"directory": "Morning", "hours": (8, 12), "max_duration": 3600}]
+        first = utils.apply_directory_rules(rules, db_path=db_path)
+        assert first == [{"directory": "Morning", "matched": 2, "updated": 2}]
+
+        second = utils.apply_directory_rules(rules, db_path=db_path)
+        assert second == [{"directory": "Morning", "matched": 2, "updated": 0}]
+
+    def test_keywords_are_literal(self, db_path):
+        report = utils.apply_directory_rules([{"directory": "X", "keywords": ["%"]}], db_path=db_path)
+        assert report[0]["matched"] == 0
+
+    def test_invalid_rules(self, db_path):
+        with pytest.raises(ValueError):
+            utils.apply_directory_rules([{"directory": "X", "colour": "red"}], db_path=db_path)
+        with pytest.raises(ValueError):
+            utils.apply_directory_rules([{"after": "2023-01-01"}], db_path=db_path)
+
+    def test_hours_window_wraps_midnight(self, db_path):
+        report = utils.apply_directory_rules([{"directory": "Night", "hours": (22, 9)}], db_path=db_path)
+        assert report[0]["matched"] == 2  # r1 at 22:00 and r2 at 08:00
+
+        with pytest.raises(ValueError):
+            utils.apply_directory_rules([{"directory": "X", "hours": (22, 30)}], db_path=db_path)
+
+    def test_push_tags_with_one_client(self, db_path, monkeypatch):
+        client = MagicMock()
+        client.__enter__.return_value = client
+        client.tags.list_tags.return_value = []
+        client.tags.create_tag.side_effect = lambda name: FileTag(id=f"t-{name}", name=name)
+        factory = MagicMock(return_value=client)
+        monkeypatch.setattr(utils, "PlaudClient", factory)
+        rules = [{"directory": "Weekend", "weekdays": [5, 6]}, {"directory": "Weekday"}]
+
+        report = utils.apply_directory_rules(rules, tag=True, db_path=db_path)
+
+        factory.assert_called_once()
+        client.files.update_tags.assert_any_call(["r4"], "t-Weekend")
+        client.files.update_tags.assert_any_call(["r1", "r2", "r3"], "t-Weekday")
+        assert [r["tagged"] for r in report] == [1, 3]
+
+        factory.reset_mock()
+        again = utils.apply_directory_rules(rules, tag=True, db_path=db_path)
+        factory.assert_not_called()
+        assert [r["tagged"] for r in again] == [0, 0]
+
+
+class TestRecomputeLocalFields:
+
+    @pytest.fixture
+    def listing(self, monkeypatch):
+        # Straddles both 2023 DST transitions in Europe/Berlin, plus odd milliseconds
+        starts = [
+            1679792400000,  # 2023-03-26 01:00 UTC, just after spring forward
+            1679788799999,  # one millisecond before it
+            1698541200000,  # 2023-10-29 01:00 UTC, just after fall back
+            1698537600123,  # an hour before, with milliseconds
+            1700000000000,
+            0,
+        ]
+        files = [FileSimple(id=f"f{i}", start_time=ms, duration=60) for i, ms in enumerate(starts)]
+        monkeypatch.setattr(utils, "_get_all_files", lambda: files)
+        return files
+
+    def _fields(self, path):
+        conn = utils.get_db(path)
+        try:
+            return [
+                tuple(r) for r in conn.execute(
+                    """SELECT id, local_datetime, hour, weekday, weekday_name, is_working_hours
+                       FROM recordings ORDER BY id"""
+                )
+            ]
+        finally:
+            conn.close()
+
+    def test_matches_sync(self, tmp_path, listing):
+        zoneinfo = pytest.importorskip("zoneinfo")
+        berlin = zoneinfo.ZoneInfo("Europe/Berlin")
+        tokyo = zoneinfo.ZoneInfo("Asia/Tokyo")
+        expected_path, path = tmp_path / "expected.db", tmp_path / "plaud.db"
+        utils.sync_recordings(db_path=expected_path, tz=berlin, work_start=2, work_end=3)
+        utils.sync_recordings(db_path=path, tz=tokyo)
+
+        assert utils.recompute_local_fields(berlin, 2, 3, db_path=path) == len(listing)
+        assert self._fields(path) == self._fields(expected_path)
+
+    def test_offset_table_has_dst_transitions(self):
+        zoneinfo = pytest.importorskip("zoneinfo")
+        table = utils._offset_table(zoneinfo.ZoneInfo("Europe/Berlin"), 1672531200000, 1704067199000)
+        assert table == [(1672531200000, 3600), (1679792400000, 7200), (1698541200000, 3600)]
+
+
+class TestRollups:
+
+    def _snapshot(self, path):
+        return (
+            utils.rollup_by_period("day", db_path=path),
+            utils.rollup_by_period("week", db_path=path),
+            utils.rollup_by_period("month", db_path=path),
+            utils.rollup_by_hour_weekday(db_path=path),
+            utils.rollup_by_directory(db_path=path),
+        )
+
+    def _assert_consistent(self, path):
+        incremental = self._snapshot(path)
+        utils.rebuild_rollups(path)
+        assert incremental == self._snapshot(path)
+
+    def test_backfilled_from_existing_rows(self, db_path):
+        assert utils.rollup_by_period("day", db_path=db_path) == [
+            {"bucket": "2023-11-14", "count": 1, "total_duration": 600},
+            {"bucket": "2023-11-15", "count": 2, "total_duration": 5400},
+            {"bucket": "2023-11-18", "count": 1, "total_duration": 120},
+        ]
+        assert utils.rollup_by_period("week", db_path=db_path) == [
+            {"bucket": "2023-11-13", "count": 4, "total_duration": 6120},
+        ]
+        assert utils.rollup_by_period("month", start="2023-11", end="2023-12", db_path=db_path) == [
+            {"bucket": "2023-11", "count": 4, "total_duration": 6120},
+        ]
+        cells = utils.rollup_by_hour_weekday(db_path=db_path)
+        assert {"hour": 9, "weekday": 5, "weekday_name": "Saturday",
+                "count": 1, "total_duration": 120} in cells
+        assert utils.rollup_by_directory(db_path=db_path) == [
+            {"directory": "(unassigned)", "count": 4, "total_duration": 6120},
+        ]
+
+    def test_follow_writes(self, db_path):
+        utils.assign_directory("Work", working_hours_only=True, db_path=db_path)
+        assert utils.rollup_by_directory(db_path=db_path) == [
+            {"directory": "(unassigned)", "count": 3, "total_duration": 2520},
+            {"directory": "Work", "count": 1, "total_duration": 3600},
+        ]
+        conn = utils.get_db(db_path)
+        conn.execute("UPDATE recordings SET duration = 60 WHERE id = 'r4'")
+        conn.execute("DELETE FROM recordings WHERE id = 'r1'")
+        conn.commit()
+        conn.close()
+        assert [r["bucket"] for r in utils.rollup_by_period("day", db_path=db_path)] == [
+            "2023-11-15", "2023-11-18",
+        ]
+        self._assert_consistent(db_path)
+
+    def test_follow_sync_and_recompute(self, tmp_path, monkeypatch):
+        zoneinfo = pytest.importorskip("zoneinfo")
+        files = [
+            FileSimple(id=f"f{i}", start_time=1700000000000 + i * 7_200_000, duration=60 * i)
+            for i in range(30)
+        ]
+        monkeypatch.setattr(utils, "_get_all_files", lambda: files)
+        path = tmp_path / "plaud.db"
+        utils.sync_recordings(db_path=path, tz=timezone.utc)
+        utils.sync_recordings(db_path=path, tz=timezone.utc)
+        assert sum(r["count"] for r in utils.rollup_by_period("day", db_path=path)) == 30
+        self._assert_consistent(path)
+
+        utils.recompute_local_fields(zoneinfo.ZoneInfo("Pacific/Auckland"), db_path=path)
+        self._assert_consistent(path)
+
+    def test_created_for_existing_database(self, db_path):
+        expected = self._snapshot(db_path)
+        conn = sqlite3.connect(db_path)
+        for name in ("recordings_rollup_ai", "recordings_rollup_ad", "recordings_rollup_au"):
+            conn.execute(f"DROP TRIGGER {name}")
+        for name in ("rollup_time", "rollup_hour_weekday", "rollup_directory"):
+            conn.execute(f"DROP TABLE {name}")
+        conn.commit()
+        conn.close()
+        assert self._snapshot(db_path) == expected
+
+    def test_unknown_grain(self, db_path):
+        with pytest.raises(ValueError):
+            utils.rollup_by_period("year", db_path=db_path)